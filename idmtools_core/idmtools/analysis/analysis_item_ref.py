@@ -0,0 +1,139 @@
+"""
+AnalysisItemRef is a compact, picklable description of an item sent to analysis workers.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from idmtools.core.enums import EntityStatus, ItemType
+
+if TYPE_CHECKING:  # pragma: no cover
+    from idmtools.entities.iplatform import IPlatform
+
+
+class AnalysisItemRef:
+    """
+    Lightweight reference to an item (often a simulation) to analyze.
+
+    Platforms that can locate the files of an item without the full platform object build these in
+    :meth:`~idmtools.entities.iplatform.IPlatform.to_analysis_item_ref`. Analyzer **filter** and **map** then receive
+    the reference instead of the item. The platform is set again in the worker and is never pickled.
+    """
+    __slots__ = ('uid', 'item_type', 'name', 'tags', 'status', 'parent_id', 'location', 'platform')
+
+    def __init__(self, uid: str, item_type: ItemType, name: Optional[str] = None, tags: Optional[Dict[str, Any]] = None,
+                 status: Optional[EntityStatus] = None, parent_id: Optional[str] = None, location: Optional[str] = None):
+        """
+        Constructor.
+
+        Args:
+            uid: Item id
+            item_type: Item type
+            name: Item name
+            tags: Item tags
+            status: Item status
+            parent_id: Id of the parent item, for example the experiment of a simulation
+            location: Platform specific location of the item files, for example a directory
+        """
+        self.uid = str(uid)
+        self.item_type = item_type
+        self.name = name
+        self.tags = tags or dict()
+        self.status = status
+        self.parent_id = str(parent_id) if parent_id is not None else None
+        self.location = location
+        self.platform: Optional['IPlatform'] = None
+
+    @property
+    def id(self) -> str:
+        """
+        Get the item id.
+
+        Returns:
+            Item id
+        """
+        return self.uid
+
+    @property
+    def experiment_id(self) -> Optional[str]:
+        """
+        Get the experiment id of a simulation.
+
+        Returns:
+            Parent id
+        """
+        return self.parent_id
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Is the item succeeded.
+
+        Returns:
+            True if the status is SUCCEEDED
+        """
+        return self.status == EntityStatus.SUCCEEDED
+
+    def get_item(self, raw: bool = True) -> Any:
+        """
+        Load the full item from the platform, for analyzers needing more than the reference.
+
+        Args:
+            raw: Return the platform object when True, the idmtools object otherwise
+
+        Returns:
+            Item
+        """
+        return self.platform.get_item(self.uid, self.item_type, raw=raw)
+
+    def __getstate__(self):
+        """
+        Get the state to pickle, without the platform.
+
+        Returns:
+            State dict
+        """
+        return {k: getattr(self, k) for k in self.__slots__ if k != 'platform'}
+
+    def __setstate__(self, state):
+        """
+        Restore the state after unpickling.
+
+        Args:
+            state: State dict
+
+        Returns:
+            None
+        """
+        for k, v in state.items():
+            setattr(self, k, v)
+        self.platform = None
+
+    def __eq__(self, other):
+        """
+        References are equal when they point to the same item.
+
+        Args:
+            other: Other object
+
+        Returns:
+            True if equal
+        """
+        return isinstance(other, AnalysisItemRef) and (self.item_type, self.uid) == (other.item_type, other.uid)
+
+    def __hash__(self):
+        """
+        Hash of the reference.
+
+        Returns:
+            Hash
+        """
+        return hash((self.item_type, self.uid))
+
+    def __repr__(self):
+        """
+        String representation of the reference.
+
+        Returns:
+            String
+        """
+        return f"<AnalysisItemRef {self.item_type.value if self.item_type else None} {self.uid}>"
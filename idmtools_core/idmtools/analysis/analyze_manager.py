@@ -7,12 +7,15 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from logging import getLogger, DEBUG
-from typing import NoReturn, List, Dict, Tuple, Optional, TYPE_CHECKING
+from typing import NoReturn, List, Dict, Tuple, Optional, Union, TYPE_CHECKING
 from tqdm import tqdm
 from idmtools import IdmConfigParser
-from idmtools.analysis.map_worker_entry import map_item
+from idmtools.analysis.map_result_cache import MapResultCache
+from idmtools.analysis.map_worker_entry import map_item, map_items, map_items_data, fetch_item_files
 from idmtools.core import NoPlatformException
 from idmtools.core.enums import ItemType
 from idmtools.core.interfaces.ientity import IEntity
@@ -27,7 +30,7 @@ logger = getLogger(__name__)
 user_logger = getLogger('user')
 
 
-def pool_worker_initializer(func, analyzers, platform: 'IPlatform') -> NoReturn:
+def pool_worker_initializer(func, analyzers, platform: 'IPlatform', files_as_view: bool = False) -> NoReturn:
     """
     Initialize the pool worker, which allows the process pool to associate the analyzers, cache, and path mapping to the function executed to retrieve data.
 
@@ -37,12 +40,14 @@ def pool_worker_initializer(func, analyzers, platform: 'IPlatform') -> NoReturn:
         func: The function that the pool will call.
         analyzers: The list of all analyzers to run.
         platform: The platform to communicate with to retrieve files from.
+        files_as_view: Retrieve the files as read-only views when the platform supports it.
 
     Returns:
         None
     """
     func.analyzers = analyzers
     func.platform = platform
+    func.files_as_view = files_as_view
 
 
 class AnalyzeManager:
@@ -52,6 +57,7 @@ class AnalyzeManager:
     ANALYZE_TIMEOUT = 3600 * 8  # Maximum seconds before timing out - set to 8 hours
     WAIT_TIME = 1.15  # How much time to wait between check if the analysis is done
     EXCEPTION_KEY = '__EXCEPTION__'
+    MAX_AUTO_CHUNK_SIZE = 64  # Maximum number of items per map task when chunk_size is auto
 
     class TimeOutException(Exception):
         """
@@ -74,7 +80,10 @@ class AnalyzeManager:
                  partial_analyze_ok: bool = False, max_items: Optional[int] = None, verbose: bool = True,
                  force_manager_working_directory: bool = False,
                  exclude_ids: List[str] = None, analyze_failed_items: bool = False,
-                 max_workers: Optional[int] = None, executor_type: str = 'process'):
+                 max_workers: Optional[int] = None, executor_type: str = 'process',
+                 max_in_flight: Optional[int] = None, map_cache_directory: Optional[str] = None,
+                 reduce_only: bool = False, chunk_size: Union[int, str] = 'auto',
+                 max_download_workers: Optional[int] = None, files_as_view: bool = False):
         """
         Initialize the AnalyzeManager.
 
@@ -92,6 +101,12 @@ class AnalyzeManager:
             analyze_failed_items (bool, optional): Allows analyzing of failed items. Useful when you are trying to aggregate items that have failed. Defaults to False.
             max_workers (int, optional): Set the max workers. If not provided, falls back to the configuration item *max_threads*. If max_workers is not set in configuration, defaults to CPU count
             executor_type: (str): Whether to use process or thread pooling. Process pooling is more efficient but threading might be required in some environments
+            max_in_flight (int, optional): Maximum number of map tasks submitted to the pool at once. Defaults to four times the number of workers.
+            map_cache_directory (str, optional): Directory where map results are stored. When set, items already mapped by the same analyzers (uid, code and filenames) are not mapped again. Defaults to None (no cache).
+            reduce_only (bool, optional): Only reduce the map results stored in *map_cache_directory*, items without cached results are skipped. Defaults to False.
+            chunk_size (int or str, optional): Number of items mapped per task. Larger chunks reduce the pickling and inter process communication per item. 'auto' uses one item per task with thread pooling and otherwise spreads items so each worker gets about four chunks. Defaults to 'auto'.
+            max_download_workers (int, optional): Number of threads downloading item files ahead of the map workers. When set, files are retrieved in this process and the workers only parse and map them, so downloads overlap with parsing. Defaults to None (each worker retrieves the files of its items).
+            files_as_view (bool, optional): Retrieve item files as read-only memoryviews on platforms that support it (for example memory mapped files on the file platforms) instead of reading them into bytearrays. Analyzers must not keep the views in their map results. Ignored when files are downloaded in this process for worker processes, since views can't be sent to them. Defaults to False.
         """
         super().__init__()
         if working_dir is None:
@@ -121,6 +136,27 @@ class AnalyzeManager:
         if logger.isEnabledFor(DEBUG):
             logger.debug(f'AnalyzeManager set to {self.max_processes}')
 
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater or equal to one")
+        self.max_in_flight = max_in_flight
+
+        if chunk_size != 'auto' and (not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError("chunk_size must be 'auto' or an integer greater or equal to one")
+        self.chunk_size = chunk_size
+
+        if max_download_workers is not None and max_download_workers < 1:
+            raise ValueError("max_download_workers must be greater or equal to one")
+        self.max_download_workers = max_download_workers
+        self.files_as_view = files_as_view
+
+        for analyzer in analyzers or []:
+            self._check_analyzer(analyzer)
+
+        if reduce_only and map_cache_directory is None:
+            raise ValueError("reduce_only requires a map_cache_directory")
+        self.map_cache_directory = map_cache_directory
+        self.reduce_only = reduce_only
+
         # Should we continue analyzing even when we encounter an error?
         self.continue_on_error = False
 
@@ -241,9 +277,30 @@ class AnalyzeManager:
 
         Returns:
             None
+
+        Raises:
+            ValueError: If the analyzer supports incremental reduce but does not implement combine
         """
+        self._check_analyzer(analyzer)
         self.analyzers.append(analyzer)
 
+    @staticmethod
+    def _check_analyzer(analyzer: IAnalyzer) -> NoReturn:
+        """
+        Validate an analyzer before any item is analyzed.
+
+        Args:
+            analyzer: An analyzer object (:class:`~idmtools.entities.ianalyzer.IAnalyzer`).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the analyzer supports incremental reduce but does not implement combine
+        """
+        if analyzer.is_incremental and type(analyzer).combine is IAnalyzer.combine:
+            raise ValueError(f"{type(analyzer).__name__} sets supports_incremental but does not implement combine")
+
     def _update_analyzer_uids(self) -> NoReturn:
         """
         Ensure that each analyzer has a unique ID in this context by updating them as needed.
@@ -303,51 +360,183 @@ class AnalyzeManager:
                 user_logger.log(VERBOSE, f' | (Directory map: {on_off(analyzer.need_dir_map)}')
         user_logger.log(VERBOSE, f' | Pool of {n_processes} analyzing {self.executor_type}(es)')
 
-    def _run_and_wait_for_mapping(self, executor) -> Tuple[Dict, bool]:
+    def _get_chunk_size(self, n_items: int) -> int:
+        """
+        Get the number of items to map per task.
+
+        Args:
+            n_items: The number of items to map.
+
+        Returns:
+            Chunk size
+        """
+        if self.chunk_size != 'auto':
+            return self.chunk_size
+        if self.executor_type == 'thread':
+            # threads share the items, there is nothing to amortize
+            return 1
+        return max(1, min(self.MAX_AUTO_CHUNK_SIZE, n_items // (4 * self.max_processes)))
+
+    def _run_and_wait_for_mapping(self, executor) -> Tuple[Dict, Dict, bool]:
         """
         Run and manage the mapping call on each item.
 
+        Items are mapped in chunks of *chunk_size* items. Workers receive the lightweight reference of an item (see
+        :meth:`~idmtools.entities.iplatform.IPlatform.to_analysis_item_ref`) when the platform provides one. At most
+        *max_in_flight* map tasks are queued on the executor at any time. With *max_download_workers*, item files are
+        first retrieved by a pool of threads, at most *max_in_flight* chunks ahead of the map tasks. Results of
+        incremental analyzers (see :meth:`~idmtools.entities.ianalyzer.IAnalyzer.combine`) are folded as soon as an
+        item is mapped and then dropped; only the results of the other analyzers are kept for the reduce step.
+
         Args:
             executor: A pool of workers.
 
         Returns:
-            False if an exception occurred processing **.map** on any item; otherwise True (succeeded).
-
+            Tuple of the item keyed map results, the analyzer ID keyed partial results of incremental analyzers
+            and False if an exception occurred processing **.map** on any item; otherwise True (succeeded).
         """
         # add items to process (map)
         n_items = len(self._items)
         logger.debug(f"Number of items for analysis: {n_items}")
         logger.debug("Mapping the items for analysis")
+        incremental = {a.uid: a for a in self.analyzers if a.is_incremental}
+        partials = {uid: dict(partial=None, count=0) for uid in incremental}
+        max_in_flight = self.max_in_flight or max(1, 4 * self.max_processes)
         futures = dict()
         results = dict()
         status = True
-        # create status bar and then queue our futures
-        with tqdm(total=len(self._items)) as progress:
-            for i in self._items.values():
-                future = executor.submit(map_item, i)
-                future.add_done_callback(lambda p: progress.update())
-                futures[future] = i
-
-            # wait on our futures to complete, catch exceptions, and aggregate results
-            for future in as_completed(futures.keys()):
-                if future.exception():
-                    status = False
-                    ex = future.exception()
-                    user_logger.error(ex)
-                    if not self.continue_on_error:
-                        raise ex
-                else:
-                    results[futures[future]] = future.result()
+        map_cache = MapResultCache(self.map_cache_directory, self.analyzers) if self.map_cache_directory else None
+        fetcher = None
+        fetching = dict()
+
+        def collect(item, data):
+            for uid, analyzer in incremental.items():
+                if uid in data:
+                    partials[uid]['partial'] = analyzer.combine(partials[uid]['partial'], item, data.pop(uid))
+                    partials[uid]['count'] += 1
+            if data:
+                results[item] = data
 
+        try:
+            # use map results stored by a previous analysis
+            to_map = list(self._items.values())
+            if map_cache:
+                to_map = []
+                missing = 0
+                for item in self._items.values():
+                    data = map_cache.get(item.uid)
+                    if data is not None:
+                        collect(item, data)
+                    elif self.reduce_only:
+                        missing += 1
+                    else:
+                        to_map.append(item)
+                logger.debug(f"Number of items with cached map results: {n_items - len(to_map) - missing}")
+                if missing:
+                    user_logger.warning(f"{missing} item(s) have no cached map results and are skipped (reduce_only is on)")
+            # send lightweight references of the items to the workers when the platform supports them
+            item_refs = dict()
+            for item in to_map:
+                ref = self.platform.to_analysis_item_ref(item)
+                if ref is not None:
+                    item_refs[item.uid] = ref
+            chunk_size = self._get_chunk_size(len(to_map))
+            logger.debug(f"Mapping {chunk_size} item(s) per task")
+            pending = iter(to_map)
+            if self.max_download_workers:
+                if isinstance(executor, ProcessPoolExecutor):
+                    # start the worker processes first: forking while download threads hold locks (for example the
+                    # logging locks) can deadlock the workers
+                    for future in [executor.submit(os.getpid) for _ in range(self.max_processes)]:
+                        future.result()
+                fetcher = ThreadPoolExecutor(max_workers=self.max_download_workers)
+                # views can't be pickled to worker processes
+                fetch_as_view = self.files_as_view and not isinstance(executor, ProcessPoolExecutor)
+            # download stage: fetching maps futures to items, fetched holds (item, files) waiting to be mapped
+            fetched = deque()
+
+            def get_ref(item):
+                return item_refs.get(item.uid, item)
+
+            def on_error(ex):
+                nonlocal status
+                status = False
+                user_logger.error(ex)
+                if not self.continue_on_error:
+                    raise ex
+
+            # create status bar and then queue our futures
+            with tqdm(total=len(to_map)) as progress:
+                def submit(func, chunk, entries):
+                    future = executor.submit(func, entries)
+                    future.add_done_callback(lambda p, n=len(chunk): progress.update(n))
+                    futures[future] = chunk
+
+                def queue_chunks():
+                    if fetcher is None:
+                        while len(futures) < max_in_flight:
+                            chunk = list(islice(pending, chunk_size))
+                            if not chunk:
+                                break
+                            submit(map_items, chunk, [get_ref(i) for i in chunk])
+                        return
+                    # back pressure: download at most max_in_flight chunks ahead of the map stage
+                    while len(fetching) + len(fetched) < max_in_flight * chunk_size:
+                        item = next(pending, None)
+                        if item is None:
+                            break
+                        fetching[fetcher.submit(fetch_item_files, get_ref(item), self.analyzers, self.platform,
+                                                fetch_as_view)] = item
+                    # send full chunks, or the remaining items once everything is downloaded
+                    while fetched and len(futures) < max_in_flight and (len(fetched) >= chunk_size or not fetching):
+                        entries = [fetched.popleft() for _ in range(min(chunk_size, len(fetched)))]
+                        submit(map_items_data, [item for item, _ in entries],
+                               [(get_ref(item), uids, file_data) for item, (uids, file_data) in entries])
+
+                queue_chunks()
+                # wait on our futures to complete, catch exceptions, and aggregate results
+                while futures or fetching:
+                    done, _ = wait(list(futures.keys()) + list(fetching.keys()), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in fetching:
+                            item = fetching.pop(future)
+                            if future.exception():
+                                progress.update(1)
+                                on_error(future.exception())
+                            else:
+                                fetched.append((item, future.result()))
+                            continue
+                        chunk = futures.pop(future)
+                        if future.exception():
+                            outcomes = [(None, future.exception())] * len(chunk)
+                        else:
+                            outcomes = future.result()
+                        for item, (data, ex) in zip(chunk, outcomes):
+                            if ex is not None:
+                                on_error(ex)
+                                continue
+                            if map_cache:
+                                map_cache.set(item.uid, data)
+                            collect(item, data)
+                    queue_chunks()
+        finally:
+            if fetcher:
+                for future in fetching:
+                    future.cancel()
+                fetcher.shutdown(wait=False)
+            if map_cache:
+                map_cache.close()
         logger.debug(f"Result fetching status: : {status}")
-        return results, status
+        return results, partials, status
 
-    def _run_and_wait_for_reducing(self, executor, results) -> dict:
+    def _run_and_wait_for_reducing(self, executor, results, partials: Optional[Dict] = None) -> dict:
         """
         Run and manage the reduce call on the combined item results (by analyzer).
 
         Args:
             executor: A pool of workers.
+            results: The item keyed map results.
+            partials: The analyzer ID keyed partial results of incremental analyzers.
 
         Returns:
             An analyzer ID keyed dictionary of finalize results.
@@ -356,6 +545,7 @@ class AnalyzeManager:
         # the keys in self.cache from map() calls are expected to be item ids. Each keyed value
         # contains analyzer_id: item_results_for_analyzer entries.
         logger.debug("Running reduce results")
+        partials = partials or {}
         futures = {}
         finalize_results = {}
         # create a progress bar
@@ -363,13 +553,18 @@ class AnalyzeManager:
             # for each analyzer, queue our futures
             for analyzer in self.analyzers:
                 logger.debug(f"Gather data for {analyzer.uid}")
-                item_data_for_analyzer = {}
-                for item, data in results.items():
-                    if analyzer.uid in data:
-                        item_data_for_analyzer[item] = data[analyzer.uid]
-                if item_data_for_analyzer.__len__() == 0:
-                    user_logger.warning(f"Note: {analyzer.uid} has no simulation data to analyze. Please verify the filter or map function of the analyzer.")
-                future = executor.submit(analyzer.reduce, item_data_for_analyzer)
+                if analyzer.uid in partials:
+                    if partials[analyzer.uid]['count'] == 0:
+                        user_logger.warning(f"Note: {analyzer.uid} has no simulation data to analyze. Please verify the filter or map function of the analyzer.")
+                    future = executor.submit(analyzer.finalize, partials[analyzer.uid]['partial'])
+                else:
+                    item_data_for_analyzer = {}
+                    for item, data in results.items():
+                        if analyzer.uid in data:
+                            item_data_for_analyzer[item] = data[analyzer.uid]
+                    if item_data_for_analyzer.__len__() == 0:
+                        user_logger.warning(f"Note: {analyzer.uid} has no simulation data to analyze. Please verify the filter or map function of the analyzer.")
+                    future = executor.submit(analyzer.reduce, item_data_for_analyzer)
                 future.add_done_callback(lambda p: progress.update())
 
                 logger.debug(f"Queueing {analyzer.uid}")
@@ -452,15 +647,16 @@ class AnalyzeManager:
                 os.environ['IDMTOOLS_CONFIG_FILE'] = config_file
 
             # our options for our executor
-            opts = dict(max_workers=n_processes, initializer=pool_worker_initializer, initargs=(map_item, self.analyzers, self.platform))
+            opts = dict(max_workers=n_processes, initializer=pool_worker_initializer,
+                        initargs=(map_item, self.analyzers, self.platform, self.files_as_view))
             # determine type. Most cases we want a process, but sometimes(like in Jupyter notebooks, we want to use threads)
             if self.executor_type == 'process':
                 executor = ProcessPoolExecutor(**opts)
             else:
                 executor = ThreadPoolExecutor(**opts)
 
-            map_results, status = self._run_and_wait_for_mapping(executor)
-            finalize_results = self._run_and_wait_for_reducing(executor, map_results)
+            map_results, partials, status = self._run_and_wait_for_mapping(executor)
+            finalize_results = self._run_and_wait_for_reducing(executor, map_results, partials)
 
         finally:
             # because of debug mode, we have to leave executor and let python handle the shutdown through del
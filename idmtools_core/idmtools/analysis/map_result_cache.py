@@ -0,0 +1,160 @@
+"""idmtools map result cache.
+
+MapResultCache stores the results of analyzer map calls on disk so an analysis can be resumed or reduced again without
+fetching and parsing the item files a second time.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import hashlib
+import inspect
+import os
+import uuid
+from logging import getLogger
+from typing import Any, Dict, List, Tuple, Union
+from diskcache import Cache
+from idmtools.core.cache_enabled import MAX_CACHE_SIZE
+from idmtools.entities.ianalyzer import IAnalyzer
+from idmtools.utils.canonical_hash import canonical_hash
+
+logger = getLogger(__name__)
+
+# Analyzer attributes that don't change the result of map
+ANALYZER_STATE_ATTRIBUTES = ('results', 'working_dir')
+
+
+def analyzer_state_hash(analyzer: IAnalyzer) -> str:
+    """
+    Hash the attributes of an analyzer, for example the arguments it was constructed with.
+
+    Two instances of an analyzer class built with different arguments don't share their cached map results.
+
+    Args:
+        analyzer: Analyzer to hash
+
+    Returns:
+        Canonical hash of the analyzer attributes, or a random value when they can't be hashed so nothing is reused
+    """
+    state = {k: v for k, v in vars(analyzer).items() if k not in ANALYZER_STATE_ATTRIBUTES}
+    try:
+        return canonical_hash(state)
+    except Exception as e:
+        logger.warning(f"Map results of analyzer {analyzer.uid} are not reused, its attributes can't be hashed: {e}")
+        return uuid.uuid4().hex
+
+
+def analyzer_code_hash(analyzer: IAnalyzer) -> str:
+    """
+    Hash the source code of an analyzer class and its bases.
+
+    Changing the code of the analyzer invalidates its cached map results.
+
+    Args:
+        analyzer: Analyzer to hash
+
+    Returns:
+        md5 hex digest of the analyzer code
+    """
+    md5 = hashlib.md5()
+    for cls in type(analyzer).__mro__:
+        if cls is object:
+            continue
+        try:
+            source = inspect.getsource(cls)
+        except (OSError, TypeError):
+            # Source is not available (interactive session, compiled module). Fallback to the class name
+            source = f"{cls.__module__}.{cls.__qualname__}"
+        md5.update(source.encode('utf-8'))
+    return md5.hexdigest()
+
+
+class MapResultCache:
+    """
+    Persistent store of analyzer map results keyed by item id and analyzer uid, code, attributes and file selection.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], analyzers: List[IAnalyzer]):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory of the cache. Created if it doesn't exist.
+            analyzers: Analyzers whose map results are stored.
+        """
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._cache = Cache(self.directory, size_limit=MAX_CACHE_SIZE)
+        self._analyzer_keys = {a.uid: self._analyzer_key(a) for a in analyzers}
+
+    @staticmethod
+    def _analyzer_key(analyzer: IAnalyzer) -> str:
+        """
+        Build the part of the key that identifies an analyzer.
+
+        Args:
+            analyzer: Analyzer
+
+        Returns:
+            Key string
+        """
+        filenames = ",".join(sorted(analyzer.filenames))
+        selection = f"{getattr(analyzer, 'columns', None)}:{getattr(analyzer, 'json_paths', None)}"
+        return f"{analyzer.uid}:{analyzer_code_hash(analyzer)}:{analyzer_state_hash(analyzer)}:{analyzer.parse}:" \
+               f"{filenames}:{selection}"
+
+    def _key(self, item_id: str, analyzer_uid: str) -> str:
+        """
+        Build the key of an item/analyzer pair.
+
+        Args:
+            item_id: Item id
+            analyzer_uid: Analyzer uid
+
+        Returns:
+            Key string
+        """
+        return f"{item_id}:{self._analyzer_keys[analyzer_uid]}"
+
+    def get(self, item_id: str) -> Union[Dict[str, Any], None]:
+        """
+        Get the cached map results of an item.
+
+        Args:
+            item_id: Item id
+
+        Returns:
+            Analyzer uid keyed map results (analyzers that filtered the item out are omitted), or None when at least
+            one analyzer has no cached result for the item.
+        """
+        data = dict()
+        for uid in self._analyzer_keys:
+            entry: Tuple[bool, Any] = self._cache.get(self._key(item_id, uid), retry=True)
+            if entry is None:
+                return None
+            selected, value = entry
+            if selected:
+                data[uid] = value
+        return data
+
+    def set(self, item_id: str, data: Dict[str, Any]):
+        """
+        Store the map results of an item.
+
+        Args:
+            item_id: Item id
+            data: Analyzer uid keyed map results. Analyzers missing from data filtered out the item.
+
+        Returns:
+            None
+        """
+        for uid in self._analyzer_keys:
+            entry = (True, data[uid]) if uid in data else (False, None)
+            self._cache.set(self._key(item_id, uid), entry, retry=True)
+
+    def close(self):
+        """
+        Close the cache.
+
+        Returns:
+            None
+        """
+        self._cache.close()
@@ -9,9 +9,9 @@ import itertools
 from logging import getLogger, DEBUG
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.utils.file_parser import FileParser
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from idmtools.core.interfaces.iitem import IItem
-from idmtools.entities.ianalyzer import TAnalyzerList
+from idmtools.entities.ianalyzer import IAnalyzer, TAnalyzerList
 from idmtools.utils.general import FilterSafeItem
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -36,10 +36,174 @@ def map_item(item: IItem) -> Dict[str, Dict]:
         logger.debug(f"Init item {item.uid} in worker")
     analyzers = map_item.analyzers
     platform = map_item.platform
-    return _get_mapped_data_for_item(item, analyzers, platform)
+    return _get_mapped_data_for_item(item, analyzers, platform, getattr(map_item, 'files_as_view', False))
 
 
-def _get_mapped_data_for_item(item: IEntity, analyzers: TAnalyzerList, platform: 'IPlatform') -> Dict[str, Dict]:
+def map_items(items: List[IItem]) -> List[Tuple[Optional[Dict[str, Dict]], Optional[Exception]]]:
+    """
+    Map a chunk of items; a worker process entry point for analyzer item-mapping.
+
+    Mapping several items per task sends all their results back in one message.
+
+    Args:
+        items: The items (often simulations) to process.
+
+    Returns:
+        List of (mapped data, None) or (None, exception) tuples, in the same order as items
+    """
+    analyzers = map_item.analyzers
+    platform = map_item.platform
+    as_view = getattr(map_item, 'files_as_view', False)
+    results = []
+    for item in items:
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"Init item {item.uid} in worker")
+        try:
+            results.append((_get_mapped_data_for_item(item, analyzers, platform, as_view), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def _get_file_selection(analyzer: IAnalyzer, attribute: str, filename: str):
+    """
+    Get the columns/json paths an analyzer selects from a file.
+
+    Args:
+        analyzer: Analyzer
+        attribute: columns or json_paths
+        filename: Filename
+
+    Returns:
+        Selection of the analyzer for the file, or None to load the whole file
+    """
+    selection = getattr(analyzer, attribute, None)
+    if isinstance(selection, dict):
+        return selection.get(filename)
+    return selection
+
+
+def fetch_item_files(item: IItem, analyzers: TAnalyzerList, platform: 'IPlatform', as_view: bool = False) -> \
+        Tuple[List[str], Dict[str, bytes]]:
+    """
+    Select the analyzers applicable to an item and retrieve their files; the fetch stage of the analysis pipeline.
+
+    Args:
+        item: The item (often simulation) to process.
+        analyzers: The analyzers to filter the item with.
+        platform: A platform object to retrieve files from.
+        as_view: Retrieve the files as read-only views when the platform supports it.
+
+    Returns:
+        Tuple of the uids of the analyzers to use on the item and the file data keyed by filename
+    """
+    try:
+        analyzers_to_use, file_data = _get_files_for_item(item, analyzers, platform, as_view)
+    except Exception as e:
+        e.item = item
+        logger.error(e)
+        raise e
+    return [a.uid for a in analyzers_to_use], file_data
+
+
+def map_items_data(entries: List[Tuple[IItem, List[str], Dict[str, bytes]]]) -> \
+        List[Tuple[Optional[Dict[str, Dict]], Optional[Exception]]]:
+    """
+    Map a chunk of items whose files were already retrieved; a worker process entry point for analyzer item-mapping.
+
+    Args:
+        entries: List of (item, uids of the analyzers to use, file data) as returned by :func:`fetch_item_files`.
+
+    Returns:
+        List of (mapped data, None) or (None, exception) tuples, in the same order as entries
+    """
+    analyzers = map_item.analyzers
+    platform = map_item.platform
+    results = []
+    for item, analyzer_uids, file_data in entries:
+        try:
+            item.platform = platform
+            analyzers_to_use = [a for a in analyzers if a.uid in analyzer_uids]
+            results.append((_map_file_data(item, analyzers_to_use, file_data), None))
+        except Exception as e:
+            e.item = item
+            logger.error(e)
+            results.append((None, e))
+    return results
+
+
+def _get_files_for_item(item: IEntity, analyzers: TAnalyzerList, platform: 'IPlatform', as_view: bool = False) -> \
+        Tuple[TAnalyzerList, Dict[str, bytes]]:
+    """
+    Determine which analyzers are applicable to an item and retrieve the files they need.
+
+    Args:
+        item: The :class:`~idmtools.entities.iitem.IItem` object to filter.
+        analyzers: The :class:`~idmtools.analysis.IAnalyzer` items to filter the item with.
+        platform: A platform object to query for information.
+        as_view: Retrieve the files as read-only views when the platform supports it.
+
+    Returns:
+        Tuple of the analyzers to use and the file data keyed by filename
+    """
+    # determine which analyzers (and by extension, which filenames) are applicable to this item
+    # ensure item has a platform
+    item.platform = platform
+    analyzers_to_use = [a for a in analyzers if a.filter(FilterSafeItem(item))]
+    analyzer_uids = [a.uid for a in analyzers]
+
+    filenames = set(itertools.chain(*(a.filenames for a in analyzers_to_use)))
+    filenames = [f.replace("\\", '/') for f in filenames]
+
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(f"Analyzers to use on item: {str(analyzer_uids)}")
+        logger.debug(f"Filenames to analyze: {filenames}")
+
+    # The byte_arrays will associate filename with content
+    if len(filenames) > 0 and as_view:
+        file_data = platform.get_files(item, filenames, as_view=True)
+    elif len(filenames) > 0:
+        file_data = platform.get_files(item, filenames)
+    else:
+        file_data = dict()
+    return analyzers_to_use, file_data
+
+
+def _map_file_data(item: IEntity, analyzers_to_use: TAnalyzerList, file_data: Dict[str, bytes]) -> Dict[str, Dict]:
+    """
+    Parse the file data of an item and run the map of each analyzer on it.
+
+    Args:
+        item: The :class:`~idmtools.entities.iitem.IItem` object to call analyzer
+            :meth:`~idmtools.analysis.AddAnalyzer.map` methods on.
+        analyzers_to_use: The analyzers applicable to the item.
+        file_data: The file data keyed by filename.
+
+    Returns:
+        Dict[str, Dict] - Analyzer uid keyed map results
+    """
+    # Selected data will be a dict with analyzer.uid: data  entries
+    selected_data = {}
+    for analyzer in analyzers_to_use:
+        # If the analyzer needs the parsed data, parse
+        if analyzer.parse:
+            logger.debug(f'Parsing content for {analyzer.uid}')
+            data = {filename: FileParser.parse(filename, content,
+                                               columns=_get_file_selection(analyzer, 'columns', filename),
+                                               json_paths=_get_file_selection(analyzer, 'json_paths', filename))
+                    for filename, content in file_data.items() if filename in analyzer.filenames}
+        else:
+            # If the analyzer doesnt wish to parse, give the raw data
+            data = {filename: content for filename, content in file_data.items() if filename in analyzer.filenames}
+
+        # run the mapping routine for this analyzer and item
+        logger.debug("Running map on selected data")
+        selected_data[analyzer.uid] = analyzer.map(data, item)
+    return selected_data
+
+
+def _get_mapped_data_for_item(item: IEntity, analyzers: TAnalyzerList, platform: 'IPlatform', as_view: bool = False) -> \
+        Dict[str, Dict]:
     """
     Get mapped data from an item.
 
@@ -49,45 +213,15 @@ def _get_mapped_data_for_item(item: IEntity, analyzers: TAnalyzerList, platform:
         analyzers: The :class:`~idmtools.analysis.IAnalyzer` items with
             :meth:`~idmtools.analysis.AddAnalyzer.map` methods to call on the provided items.
         platform: A platform object to query for information.
+        as_view: Retrieve the files as read-only views when the platform supports it.
 
     Returns:
         Dict[str, Dict] - Array mapping file data to from str to contents
 
     """
     try:
-        # determine which analyzers (and by extension, which filenames) are applicable to this item
-        # ensure item has a platform
-        item.platform = platform
-        analyzers_to_use = [a for a in analyzers if a.filter(FilterSafeItem(item))]
-        analyzer_uids = [a.uid for a in analyzers]
-
-        filenames = set(itertools.chain(*(a.filenames for a in analyzers_to_use)))
-        filenames = [f.replace("\\", '/') for f in filenames]
-
-        if logger.isEnabledFor(DEBUG):
-            logger.debug(f"Analyzers to use on item: {str(analyzer_uids)}")
-            logger.debug(f"Filenames to analyze: {filenames}")
-
-        # The byte_arrays will associate filename with content
-        if len(filenames) > 0:
-            file_data = platform.get_files(item, filenames)
-        else:
-            file_data = dict()
-
-        # Selected data will be a dict with analyzer.uid: data  entries
-        selected_data = {}
-        for analyzer in analyzers_to_use:
-            # If the analyzer needs the parsed data, parse
-            if analyzer.parse:
-                logger.debug(f'Parsing content for {analyzer.uid}')
-                data = {filename: FileParser.parse(filename, content) for filename, content in file_data.items() if filename in analyzer.filenames}
-            else:
-                # If the analyzer doesnt wish to parse, give the raw data
-                data = {filename: content for filename, content in file_data.items() if filename in analyzer.filenames}
-
-            # run the mapping routine for this analyzer and item
-            logger.debug("Running map on selected data")
-            selected_data[analyzer.uid] = analyzer.map(data, item)
+        analyzers_to_use, file_data = _get_files_for_item(item, analyzers, platform, as_view)
+        selected_data = _map_file_data(item, analyzers_to_use, file_data)
 
         # Store all analyzer results for this item in the result cache
         if logger.isEnabledFor(DEBUG):
@@ -4,7 +4,7 @@ idmtools asset class definition.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 
-import io
+import hashlib
 import os
 from dataclasses import dataclass, field, InitVar
 from functools import partial
@@ -16,7 +16,8 @@ import backoff
 import requests
 from idmtools import IdmConfigParser
 from idmtools.utils.file import file_content_to_generator, content_generator
-from idmtools.utils.hashing import calculate_md5, calculate_md5_stream
+from idmtools.services.checksum_cache import calculate_file_checksum
+from idmtools.utils.hashing import FILE_HASH_CHUNK_SIZE
 
 logger = getLogger(__name__)
 
@@ -192,9 +193,10 @@ class Asset:
         Returns:
             None
         """
-        if isinstance(self.content, bytes):
-            return self.content
-        return str.encode(self.handler(self.content))
+        content = self.content
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return content
+        return str.encode(self.handler(content))
 
     @property
     def length(self):
@@ -233,7 +235,7 @@ class Asset:
             with open(self.absolute_path, "rb") as fp:
                 self._content = fp.read()
 
-        elif self.download_generator_hook:
+        elif self._content is None and self.download_generator_hook:
             if logger.isEnabledFor(DEBUG):
                 logger.debug(f"Fetching {self.filename} content from platform")
             self._content = self.download_stream().getvalue()
@@ -391,14 +393,16 @@ class Asset:
         """
         Calculate checksum on asset. If previous checksum was calculated, that value will be returned.
 
+        Checksums of local files are kept in the checksum cache, see :mod:`idmtools.services.checksum_cache`.
+
         Returns:
             Checksum string
         """
         if not self._checksum:
             if self.absolute_path:
-                self._checksum = calculate_md5(self.absolute_path)
+                self._checksum = calculate_file_checksum(self.absolute_path)
             elif self.content is not None:
-                self._checksum = calculate_md5_stream(io.BytesIO(self.bytes))
+                self._checksum = hashlib.md5(self.bytes).hexdigest()
         return self._checksum
 
     def short_remote_path(self) -> str:
@@ -424,9 +428,9 @@ class Asset:
             None
         """
         if self.absolute_path is not None:
-            self.download_generator_hook = partial(file_content_to_generator, self.absolute_path)
+            self.download_generator_hook = partial(file_content_to_generator, self.absolute_path, FILE_HASH_CHUNK_SIZE)
         elif self.content:
-            self.download_generator_hook = partial(content_generator, self.bytes)
+            self.download_generator_hook = partial(content_generator, self.bytes, FILE_HASH_CHUNK_SIZE)
         else:
             raise ValueError("Asset has no content or absolute path")
 
@@ -8,15 +8,16 @@ import os
 from dataclasses import dataclass, field
 from logging import getLogger
 from os import PathLike
-from typing import List, NoReturn, TypeVar, Union, Any, Dict, TYPE_CHECKING
+from typing import List, NoReturn, TypeVar, Union, Any, Dict, Generator, Iterable, Optional, Tuple, TYPE_CHECKING
 from idmtools.assets import Asset, TAssetList
 from idmtools.assets import TAssetFilterList
 from idmtools.assets.errors import DuplicatedAssetError
 from idmtools.core import FilterMode, ItemType
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.core.interfaces.iitem import IItem
+from idmtools.services.checksum_cache import calculate_checksums, iter_with_checksums
 from idmtools.utils.entities import get_default_tags
-from idmtools.utils.file import scan_directory
+from idmtools.utils.file import walk_files, DEFAULT_SCAN_WORKERS
 from idmtools.utils.filters.asset_filters import default_asset_file_filter
 from idmtools.utils.info import get_doc_base_url
 
@@ -27,11 +28,156 @@ if TYPE_CHECKING:  # pragma: no cover
 
 user_logger = getLogger('user')
 
+TAssetKey = Tuple[str, str]
+
+
+def asset_key(asset: Asset) -> TAssetKey:
+    """
+    Get the key of an asset in a collection.
+
+    Assets with the same key end up at the same remote path, so a collection holds at most one asset per key.
+
+    Args:
+        asset: Asset
+
+    Returns:
+        Relative path, with forward slashes, and filename
+    """
+    return asset.relative_path.replace("\\", "/"), asset.filename
+
+
+def _path_key(relative_path: Optional[str], filename: Optional[str]) -> TAssetKey:
+    """
+    Get the key of the asset at a path, normalized the same way as assets normalize their path.
+
+    Args:
+        relative_path: Relative path
+        filename: Filename
+
+    Returns:
+        Key of the asset
+    """
+    return (relative_path or "").strip(" \\/").replace("\\", "/"), filename or ""
+
+
+class _AssetList(list):
+    """
+    List of the assets of a collection, as returned by :attr:`AssetCollection.assets`.
+
+    Changes made directly to the list are applied to the collection.
+    """
+    __slots__ = ('_collection',)
+
+    def __init__(self, assets: Iterable[Asset], collection: 'AssetCollection'):
+        """
+        Initialize the list.
+
+        Args:
+            assets: Assets of the collection
+            collection: Collection the list belongs to
+        """
+        super().__init__(assets)
+        self._collection = collection
+
+    def __reduce__(self):
+        """Pickle as a plain list."""
+        return list, (list(self),)
+
+    def _changed(self):
+        """Apply the content of the list to the collection."""
+        self._collection._set_assets(self, list_view=self)
+
+    def _add(self, asset: Asset) -> bool:
+        """
+        Add an asset at the end of the list and to the collection without rebuilding the collection.
+
+        Args:
+            asset: Asset
+
+        Returns:
+            False if the asset can't be added that way: the list is not the one of the collection anymore or the
+            collection already has an asset with the same key
+        """
+        collection = self._collection
+        if collection._asset_list is not self:
+            return False
+        key = asset_key(asset)
+        if key in collection._assets:
+            return False
+        collection._store(asset, key)
+        return True
+
+    def append(self, asset: Asset):
+        """Append an asset, in constant time when its key is not in the collection yet."""
+        if not self._add(asset):
+            list.append(self, asset)
+            self._changed()
+
+    def extend(self, assets: Iterable[Asset]):
+        """Append assets, in constant time per asset when their keys are not in the collection yet."""
+        for asset in assets:
+            self.append(asset)
+
+    def __iadd__(self, assets: Iterable[Asset]):
+        """Append assets, see :meth:`extend`."""
+        self.extend(assets)
+        return self
+
+    def insert(self, index: int, asset: Asset):
+        """Insert an asset. Inserting at the end is an :meth:`append`."""
+        if index >= len(self):
+            self.append(asset)
+        else:
+            # the order of the collection changes, list.insert is linear anyway
+            list.insert(self, index, asset)
+            self._changed()
+
+    def __setitem__(self, index, value):
+        """Replace assets. Replacing an asset by one with the same key doesn't rebuild the collection."""
+        collection = self._collection
+        if isinstance(index, int) and collection._asset_list is self:
+            key = asset_key(value)
+            if key == asset_key(self[index]):
+                list.__setitem__(self, index, value)
+                previous = collection._assets.get(key)
+                collection._assets[key] = value
+                collection._index_checksum(value, key, previous)
+                return
+        list.__setitem__(self, index, value)
+        self._changed()
+
+
+def _apply_to_collection(method):
+    """
+    Wrap a list method so the changes it makes are applied to the collection.
+
+    Args:
+        method: List method
+
+    Returns:
+        Wrapped method
+    """
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return self if result is NotImplemented else result
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('remove', 'pop', 'clear', 'sort', 'reverse', '__delitem__', '__imul__'):
+    setattr(_AssetList, _name, _apply_to_collection(getattr(list, _name)))
+
 
 @dataclass(repr=False)
 class AssetCollection(IEntity):
     """
     A class that represents a collection of assets.
+
+    Assets are stored in insertion order by their key, see :func:`asset_key`, so adding, replacing, removing and
+    finding an asset by path don't depend on the size of the collection. Assets should not be renamed while they are
+    part of a collection.
     """
 
     #: Assets for collection
@@ -39,6 +185,11 @@ class AssetCollection(IEntity):
     #: ItemType so platform knows how to handle item properly
     item_type: ItemType = field(default=ItemType.ASSETCOLLECTION, compare=False)
 
+    # list of the assets, built on access
+    _asset_list = None
+    # checksum -> keys of the assets, built by find_by_checksum
+    _checksum_index = None
+
     def __init__(self, assets: Union[List[str], TAssetList, 'AssetCollection'] = None, tags=None):
         """
         A constructor.
@@ -50,17 +201,122 @@ class AssetCollection(IEntity):
         if tags is None:
             tags = {}
         self.item_type = ItemType.ASSETCOLLECTION
+        self._assets: Dict[TAssetKey, Asset] = dict()
         if isinstance(assets, AssetCollection):
-            self.assets = copy.deepcopy(assets.assets)
+            self._set_assets(copy.deepcopy(list(assets._assets.values())))
         elif assets:
-            self.assets = []
             for asset in assets:
                 self.add_or_replace_asset(asset)
-        else:
-            self.assets = []
 
         self.tags = self.tags or tags
 
+    @property
+    def assets(self) -> List[Asset]:  # noqa: F811
+        """
+        Assets of the collection.
+
+        Returns:
+            List of assets. Changes made to the list are applied to the collection
+        """
+        if self._asset_list is None:
+            self._asset_list = _AssetList(self._assets.values(), self)
+        return self._asset_list
+
+    @assets.setter
+    def assets(self, assets: Iterable[Asset]):
+        """
+        Set the assets of the collection.
+
+        Args:
+            assets: Assets. When several assets have the same key, the last one is kept
+
+        Returns:
+            None
+        """
+        self._set_assets(assets)
+
+    def _set_assets(self, assets: Iterable[Asset], list_view: _AssetList = None):
+        """
+        Replace the content of the collection.
+
+        Args:
+            assets: Assets
+            list_view: List of assets returned to the user that the content comes from, if any
+
+        Returns:
+            None
+        """
+        self._assets = {asset_key(asset): asset for asset in (assets if assets is not None else [])}
+        self._asset_list = list_view if list_view is not None and len(list_view) == len(self._assets) else None
+        self._checksum_index = None
+
+    def _store(self, asset: Asset, key: TAssetKey = None):
+        """
+        Store an asset, replacing the asset with the same key in place.
+
+        Args:
+            asset: Asset
+            key: Key of the asset, if already known
+
+        Returns:
+            None
+        """
+        key = key or asset_key(asset)
+        previous = self._assets.get(key)
+        self._assets[key] = asset
+        if self._asset_list is not None:
+            if previous is None:
+                list.append(self._asset_list, asset)
+            else:
+                self._asset_list = None
+        self._index_checksum(asset, key, previous)
+
+    def _discard(self, key: TAssetKey) -> Optional[Asset]:
+        """
+        Remove an asset.
+
+        Args:
+            key: Key of the asset
+
+        Returns:
+            Asset removed or None if there is no asset with that key
+        """
+        asset = self._assets.pop(key, None)
+        if asset is not None:
+            self._asset_list = None
+            self._index_checksum(None, key, asset)
+        return asset
+
+    def _index_checksum(self, asset: Optional[Asset], key: TAssetKey, previous: Optional[Asset]):
+        """
+        Update the checksum index, when it is built, after an asset is stored or removed.
+
+        Args:
+            asset: Asset stored under the key, None if the key was removed
+            key: Key of the asset
+            previous: Asset previously stored under the key
+
+        Returns:
+            None
+        """
+        if self._checksum_index is None:
+            return
+        if previous is not None:
+            keys = self._checksum_index.get(previous.calculate_checksum(), [])
+            if key in keys:
+                keys.remove(key)
+        if asset is not None:
+            self._checksum_index.setdefault(asset.calculate_checksum(), []).append(key)
+
+    def __getstate__(self):
+        """
+        Ignore the fields in pickle_ignore_fields and the indexes during pickling.
+        """
+        state = super().__getstate__()
+        state.pop('_asset_list', None)
+        state.pop('_checksum_index', None)
+        return state
+
     @classmethod
     def from_id(cls, item_id: str, platform: 'IPlatform' = None, as_copy: bool = False,  # noqa E821
                 **kwargs) -> 'AssetCollection':
@@ -84,26 +340,48 @@ class AssetCollection(IEntity):
     @classmethod
     def from_directory(cls, assets_directory: str, recursive: bool = True, flatten: bool = False,
                        filters: 'TAssetFilterList' = None, filters_mode: FilterMode = FilterMode.OR,  # noqa: F821
-                       relative_path: str = None) -> 'TAssetCollection':
+                       relative_path: str = None, include: List[str] = None, exclude: List[str] = None,
+                       workers: int = DEFAULT_SCAN_WORKERS, checksums: bool = False) -> 'TAssetCollection':
         """
         Fill up an :class:`AssetCollection` from the specified directory.
 
-        See :meth:`~AssetCollection.assets_from_directory` for arguments.
+        See :meth:`~AssetCollection.iter_assets_from_directory` for arguments.
 
         Returns:
             A created :class:`AssetCollection` object.
         """
-        assets = cls.assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode, relative_path)
-        return cls(assets=assets)
+        return cls(assets=cls.iter_assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode, relative_path,
+                                                         include=include, exclude=exclude, workers=workers, checksums=checksums))
 
     @staticmethod
     def assets_from_directory(assets_directory: Union[str, PathLike], recursive: bool = True, flatten: bool = False,
                               filters: 'TAssetFilterList' = None,  # noqa: F821
                               filters_mode: FilterMode = FilterMode.OR,
-                              forced_relative_path: str = None, no_ignore: bool = False) -> List[Asset]:
+                              forced_relative_path: str = None, no_ignore: bool = False, include: List[str] = None,
+                              exclude: List[str] = None, workers: int = DEFAULT_SCAN_WORKERS,
+                              checksums: bool = False) -> List[Asset]:
         """
         Create assets for files in a given directory.
 
+        See :meth:`~AssetCollection.iter_assets_from_directory` for arguments.
+
+        Returns:
+            A list of assets.
+        """
+        return list(AssetCollection.iter_assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode,
+                                                               forced_relative_path, no_ignore, include, exclude, workers,
+                                                               checksums))
+
+    @staticmethod
+    def iter_assets_from_directory(assets_directory: Union[str, PathLike], recursive: bool = True, flatten: bool = False,
+                                   filters: 'TAssetFilterList' = None,  # noqa: F821
+                                   filters_mode: FilterMode = FilterMode.OR,
+                                   forced_relative_path: str = None, no_ignore: bool = False, include: List[str] = None,
+                                   exclude: List[str] = None, workers: int = DEFAULT_SCAN_WORKERS,
+                                   checksums: bool = False) -> Generator[Asset, None, None]:
+        """
+        Create assets for files in a given directory, as the directory is scanned.
+
         Args:
             assets_directory: The root directory of the assets.
             recursive: True to recursively traverse the subdirectory.
@@ -114,6 +392,11 @@ class AssetCollection(IEntity):
             filters_mode: When given multiple filters, either OR or AND the results.
             forced_relative_path: Prefix a relative path to the path created from the root directory.
             no_ignore: Should we not ignore common directories(.git, .svn. etc) The full list is defined in IGNORE_DIRECTORIES
+            include: Glob patterns of the files to include, matched against the file name and the path relative to the
+                root directory with forward slashes. Patterns are applied before any file is created or read
+            exclude: Glob patterns of the files and directories to leave out, matched like include
+            workers: Number of threads scanning directories. See :func:`~idmtools.utils.file.walk_files`
+            checksums: Calculate the checksums of the assets concurrently as they are found
 
         Examples:
             For **relative_path**, given the following folder structure root/a/1,txt root/b.txt and
@@ -123,39 +406,39 @@ class AssetCollection(IEntity):
             /1.txt and /b.txt
 
         Returns:
-            A list of assets.
+            A generator of assets.
         """
         if isinstance(assets_directory, PathLike):
             assets_directory = str(assets_directory)
-        found_assets = []
-        for entry in scan_directory(assets_directory, recursive, IGNORE_DIRECTORIES if not no_ignore else None):
-            relative_path = os.path.relpath(os.path.dirname(entry.path), assets_directory)
-            found_assets.append(Asset(absolute_path=os.path.abspath(entry.path),
-                                      relative_path=None if relative_path == "." else relative_path,
-                                      filename=entry.name))
-
-        # Apply the default filter
-        found_assets = list(filter(default_asset_file_filter, found_assets))
-
-        # Operations on assets (filter, flatten, force relative_path)
-        assets = []
-        for asset in found_assets:
-            if filters:
-                results = [f(asset) for f in filters]
-                if filters_mode == FilterMode.OR and not any(results):
-                    continue
-                if filters_mode == FilterMode.AND and not all(results):
+
+        def assets():
+            for entry in walk_files(assets_directory, recursive, IGNORE_DIRECTORIES if not no_ignore else None,
+                                    include=include, exclude=exclude, workers=workers):
+                relative_path = os.path.relpath(os.path.dirname(entry.path), assets_directory)
+                asset = Asset(absolute_path=os.path.abspath(entry.path),
+                              relative_path=None if relative_path == "." else relative_path,
+                              filename=entry.name)
+                # Apply the default filter
+                if not default_asset_file_filter(asset):
                     continue
 
-            if flatten:
-                asset.relative_path = None
+                # Operations on assets (filter, flatten, force relative_path)
+                if filters:
+                    results = [f(asset) for f in filters]
+                    if filters_mode == FilterMode.OR and not any(results):
+                        continue
+                    if filters_mode == FilterMode.AND and not all(results):
+                        continue
 
-            if forced_relative_path:
-                asset.relative_path = os.path.join(forced_relative_path, asset.relative_path)
+                if flatten:
+                    asset.relative_path = None
 
-            assets.append(asset)
+                if forced_relative_path:
+                    asset.relative_path = os.path.join(forced_relative_path, asset.relative_path)
 
-        return assets
+                yield asset
+
+        return iter_with_checksums(assets()) if checksums else assets()
 
     def copy(self) -> 'AssetCollection':
         """
@@ -168,16 +451,18 @@ class AssetCollection(IEntity):
 
     def add_directory(self, assets_directory: Union[str, PathLike], recursive: bool = True, flatten: bool = False,
                       filters: 'TAssetFilterList' = None, filters_mode: FilterMode = FilterMode.OR,  # noqa: F821
-                      relative_path: str = None, no_ignore: bool = False):
+                      relative_path: str = None, no_ignore: bool = False, include: List[str] = None,
+                      exclude: List[str] = None, workers: int = DEFAULT_SCAN_WORKERS, checksums: bool = False):
         """
         Retrieve assets from the specified directory and add them to the collection.
 
-        See :meth:`~AssetCollection.assets_from_directory` for arguments.
+        See :meth:`~AssetCollection.iter_assets_from_directory` for arguments.
         """
         if isinstance(assets_directory, PathLike):
             assets_directory = str(assets_directory)
-        assets = AssetCollection.assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode, relative_path, no_ignore)
-        for asset in assets:
+        for asset in AssetCollection.iter_assets_from_directory(assets_directory, recursive, flatten, filters, filters_mode,
+                                                                relative_path, no_ignore, include, exclude, workers,
+                                                                checksums):
             self.add_asset(asset)
 
     def is_editable(self, error=False) -> bool:
@@ -215,16 +500,18 @@ class AssetCollection(IEntity):
         self.is_editable(True)
         if isinstance(asset, (str, PathLike)):
             asset = Asset(absolute_path=str(asset), **kwargs)
-        # do a simple check first
-        if asset in self.assets:
+        key = asset_key(asset)
+        existing = self._assets.get(key)
+        if existing is not None:
             if fail_on_duplicate:
-                if not fail_on_deep_comparison or self.find_index_of_asset(asset, deep_compare=True) is None:
+                # only the content of assets with the same path is compared
+                if not fail_on_deep_comparison or not existing.deep_equals(asset):
                     raise DuplicatedAssetError(("File with same paths but different content provided", asset) if fail_on_deep_comparison else asset)
             else:
                 # The equality not considering the content of the asset, even if it is already present
                 # nothing guarantees that the content is the same. So remove and add the fresh one.
-                self.assets.remove(asset)
-        self.assets.append(asset)
+                self._discard(key)
+        self._store(asset, key)
 
     def __add__(self, other: Union[TAssetList, 'AssetCollection', Asset]) -> 'AssetCollection':
         """
@@ -241,13 +528,10 @@ class AssetCollection(IEntity):
                              'AssetCollection')
         self.is_editable(True)
         na = AssetCollection()
-        na.add_assets(self)
+        na._set_assets(self._assets.values())
         if isinstance(other, Asset):
             na.add_asset(other, False)
         else:
-            if len(self.assets) == 0:
-                na.assets = copy.deepcopy(other.assets)
-                return na
             na.add_assets(other, False)
         return na
 
@@ -281,13 +565,11 @@ class AssetCollection(IEntity):
         """
         self.is_editable(True)
         tasset = Asset(asset) if isinstance(asset, (str, PathLike)) else asset
-        index = self.find_index_of_asset(tasset)
-        if index is not None:
-            if fail_on_deep_comparison and not tasset.deep_equals(self.assets[index]):
-                raise ValueError(f"Contents of file {asset.short_remote_path()} being replaced differs. To prevent unexpected behaviour, please review script or disable deep checks")
-            self.assets[index] = tasset
-        else:
-            self.assets.append(tasset)
+        key = asset_key(tasset)
+        existing = self._assets.get(key)
+        if existing is not None and fail_on_deep_comparison and not tasset.deep_equals(existing):
+            raise ValueError(f"Contents of file {asset.short_remote_path()} being replaced differs. To prevent unexpected behaviour, please review script or disable deep checks")
+        self._store(tasset, key)
 
     def get_one(self, **kwargs):
         """
@@ -305,8 +587,13 @@ class AssetCollection(IEntity):
             None or Asset if found.
 
         """
+        if isinstance(kwargs.get('filename'), str) and isinstance(kwargs.get('relative_path'), str):
+            asset = self._assets.get(_path_key(kwargs['relative_path'], kwargs['filename']))
+            if asset is None or not all(getattr(asset, k) == v for k, v in kwargs.items()):
+                return None
+            return asset
         try:
-            return next(filter(lambda a: all(getattr(a, k) == kwargs.get(k) for k in kwargs), self.assets))
+            return next(filter(lambda a: all(getattr(a, k) == kwargs.get(k) for k in kwargs), self._assets.values()))
         except StopIteration:
             return None
 
@@ -319,14 +606,17 @@ class AssetCollection(IEntity):
         """
         self.is_editable(True)
         if 'index' in kwargs:
-            return self.assets.remove(self.assets[kwargs.get('index')])
+            self._discard(asset_key(self.assets[kwargs.get('index')]))
+            return
 
         if 'asset' in kwargs:
-            return self.assets.remove(kwargs.get('asset'))
+            if self._discard(asset_key(kwargs.get('asset'))) is None:
+                raise ValueError(f"{kwargs.get('asset')} is not in the collection")
+            return
 
         asset = self.get_one(**kwargs)
         if asset:
-            self.assets.remove(asset)
+            self._discard(asset_key(asset))
 
     def pop(self, **kwargs) -> Asset:
         """
@@ -338,11 +628,13 @@ class AssetCollection(IEntity):
         """
         self.is_editable(True)
         if not kwargs:
-            return self.assets.pop()
+            if not self._assets:
+                raise IndexError("pop from empty asset collection")
+            return self._discard(next(reversed(self._assets.keys())))
 
         asset = self.get_one(**kwargs)
         if asset:
-            self.assets.remove(asset)
+            self._discard(asset_key(asset))
         return asset
 
     def extend(self, assets: List[Asset], fail_on_duplicate: bool = True) -> NoReturn:
@@ -366,7 +658,7 @@ class AssetCollection(IEntity):
             None
         """
         self.is_editable(True)
-        self.assets.clear()
+        self._set_assets([])
 
     def set_all_persisted(self):
         """
@@ -386,7 +678,7 @@ class AssetCollection(IEntity):
         Returns:
             Total assets
         """
-        return len(self.assets)
+        return len(self._assets)
 
     @IEntity.uid.getter
     def uid(self):
@@ -407,7 +699,7 @@ class AssetCollection(IEntity):
         Returns:
             Total number of assets
         """
-        return len(self.assets)
+        return len(self._assets)
 
     def __getitem__(self, index):
         """
@@ -446,7 +738,56 @@ class AssetCollection(IEntity):
         # make a dummy asset
         content = None if absolute_path or checksum else ""
         tmp_asset = Asset(absolute_path=absolute_path, filename=filename, relative_path=relative_path, checksum=checksum, content=content)
-        return self.find_index_of_asset(tmp_asset) is not None
+        return asset_key(tmp_asset) in self._assets
+
+    def get_asset(self, relative_path: str = None, filename: str = None) -> Optional[Asset]:
+        """
+        Get an asset by path.
+
+        Args:
+            relative_path: Relative path of the asset
+            filename: Filename of the asset
+
+        Returns:
+            Asset or None if the collection has no asset at that path
+        """
+        return self._assets.get(_path_key(relative_path, filename))
+
+    def calculate_checksums(self, workers: int = None):
+        """
+        Calculate the checksums of all the assets.
+
+        Local files are hashed concurrently and their checksums are kept in the checksum cache, see
+        :mod:`idmtools.services.checksum_cache`.
+
+        Args:
+            workers: Number of threads hashing files. Defaults to the checksum_workers option
+
+        Returns:
+            None
+        """
+        calculate_checksums(self._assets.values(), workers)
+
+    def find_by_checksum(self, checksum: str) -> List[Asset]:
+        """
+        Find the assets with a given content.
+
+        The first call calculates the checksum of every asset of the collection. The checksum index is then kept up to
+        date as assets are added and removed.
+
+        Args:
+            checksum: Checksum of the content
+
+        Returns:
+            Assets with that checksum
+        """
+        if self._checksum_index is None:
+            self.calculate_checksums()
+            index = dict()
+            for key, asset in self._assets.items():
+                index.setdefault(asset.calculate_checksum(), []).append(key)
+            self._checksum_index = index
+        return [self._assets[key] for key in self._checksum_index.get(checksum, [])]
 
     def find_index_of_asset(self, other: 'Asset', deep_compare: bool = False) -> Union[int, None]:
         """
@@ -460,12 +801,11 @@ class AssetCollection(IEntity):
             Index number if found.
             None if not found.
         """
-        for idx, asset in enumerate(self.assets):
-            if deep_compare and asset.deep_equals(other):
-                return idx
-            elif not deep_compare and asset == other:
-                return idx
-        return None
+        key = asset_key(other)
+        asset = self._assets.get(key)
+        if asset is None or (deep_compare and not asset.deep_equals(other)):
+            return None
+        return list(self._assets.keys()).index(key)
 
     def pre_creation(self, platform: 'IPlatform') -> None:
         """
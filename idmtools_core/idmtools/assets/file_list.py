@@ -7,6 +7,7 @@ from typing import List
 import os
 import re
 from idmtools.assets import Asset, AssetCollection
+from idmtools.utils.file import walk_files
 from idmtools.utils.local_os import LocalOS
 
 
@@ -107,32 +108,27 @@ class FileList:
                 self.add_file(file_path, relative_path=f_relative_path)
 
         else:
-            # Walk through the path
-            for root, _subdirs, files in os.walk(path):
-                # Little safety to not go too deep
-                depth = root[len(path) + len(os.path.sep):].count(os.path.sep)
-                if depth > self.max_depth:
+            # Walk through the path. Files of the root are at depth 0 and of its subdirectories at depth 1, so the
+            # files found are at most max_depth + 1 levels below the root
+            for entry in walk_files(path, max_depth=self.max_depth + 1):
+                # Find the file relative path compared to the root folder
+                # If the relative_path is . -> change it into ''
+                f = entry.name
+                f_relative_path = os.path.normpath(os.path.relpath(os.path.dirname(entry.path), path))
+                if f_relative_path == '.':
+                    f_relative_path = ''
+
+                # if files_in_dir specified -> skip the ones not included
+                if files_in_dir is not None and f not in files_in_dir and os.path.join(f_relative_path,
+                                                                                       f) not in files_in_dir:
                     continue
 
-                # Add the files in the current dir
-                for f in files:
-                    # Find the file relative path compared to the root folder
-                    # If the relative_path is . -> change it into ''
-                    f_relative_path = os.path.normpath(os.path.relpath(root, path))
-                    if f_relative_path == '.':
-                        f_relative_path = ''
-
-                    # if files_in_dir specified -> skip the ones not included
-                    if files_in_dir is not None and f not in files_in_dir and os.path.join(f_relative_path,
-                                                                                           f) not in files_in_dir:
-                        continue
-
-                    # if we want to force a relative path -> force it
-                    if relative_path is not None:
-                        f_relative_path = os.path.join(relative_path, f_relative_path)
-
-                    # add the file
-                    self.add_file(os.path.join(root, f), relative_path=f_relative_path)
+                # if we want to force a relative path -> force it
+                if relative_path is not None:
+                    f_relative_path = os.path.join(relative_path, f_relative_path)
+
+                # add the file
+                self.add_file(entry.path, relative_path=f_relative_path)
 
     def to_asset_collection(self) -> AssetCollection:
         """
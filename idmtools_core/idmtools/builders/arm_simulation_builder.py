@@ -3,7 +3,9 @@ idmtools arm builder definition.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+from collections.abc import Sequence
 from idmtools.builders import SweepArm
+from idmtools.builders.simulation_builder import normalize_index
 from itertools import tee
 
 
@@ -118,7 +120,11 @@ class ArmSimulationBuilder:
         new_sweeps = []
         # make two copies of each sweep
         for sweep in arm.sweeps:
-            old_sw, new_sw = tee(sweep, 2)
+            if isinstance(sweep, Sequence):
+                # sweep definitions can be iterated many times and addressed by index
+                old_sw, new_sw = sweep, sweep
+            else:
+                old_sw, new_sw = tee(sweep, 2)
             old_sweeps.append(old_sw)
             new_sweeps.append(new_sw)
 
@@ -143,6 +149,27 @@ class ArmSimulationBuilder:
         for arm in self.arms:
             yield from arm.functions
 
+    def __getitem__(self, index):
+        """
+        Get the sweep functions of a simulation without building the simulations before it.
+
+        Args:
+            index: Index of the simulation or slice of indexes
+
+        Returns:
+            Tuple of the sweep functions of the simulation, or list of tuples for a slice
+
+        Raises:
+            IndexError - If the index is out of range
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        index = normalize_index(index, len(self))
+        for arm in self.arms:
+            if index < arm.count:
+                return arm[index]
+            index -= arm.count
+
     def __len__(self):
         """
         Total simulations to be built by builder.
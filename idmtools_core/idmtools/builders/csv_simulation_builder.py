@@ -74,3 +74,26 @@ class CsvExperimentBuilder(ArmSimulationBuilder):
                 arm.add_sweep_definition(func, value)
 
             self.add_arm(arm)
+
+    def add_sweep_table_from_file(self, file_path, function, tags=True, type_map=None, sep=","):
+        """
+        Create a single sweep over the rows of a CSV file, stored as columns.
+
+        Unlike :meth:`add_sweeps_from_file`, which creates one arm per row and calls one function per column, the
+        function is called once per row with the values of the row. See
+        :meth:`~idmtools.builders.SimulationBuilder.add_sweep_table`.
+
+        Args:
+            file_path: Path to file
+            function: Sweep function taking a simulation and the row
+            tags: Add all the columns (True), none (False) or the listed columns to the tags of the simulations
+            type_map: Type of the columns
+            sep: CSV Seperator
+
+        Returns:
+            None
+        """
+        df_sweeps = pd.read_csv(file_path, sep=sep, dtype=type_map)
+        arm = SweepArm()
+        arm.add_sweep_table(df_sweeps, function, tags=tags)
+        self.add_arm(arm)
@@ -8,8 +8,9 @@ import numpy as np
 import pandas as pd
 from functools import partial
 from inspect import signature
-from itertools import product
-from typing import Callable, Any, Iterable, Union, Dict, Sized, NoReturn
+from collections.abc import Sequence
+from itertools import product, islice
+from typing import Callable, Any, Iterable, Iterator, Union, Dict, Sized, NoReturn, List, Tuple
 from idmtools.entities.simulation import Simulation
 from idmtools.utils.collections import duplicate_list_of_generators
 
@@ -19,6 +20,293 @@ TSweepFunction = Union[
 ]
 
 
+def unravel_index(index: int, sizes: List[int]) -> List[int]:
+    """
+    Convert an index in a cartesian product to the index in each of its factors.
+
+    The last factor varies the fastest, like in :func:`itertools.product`.
+
+    Args:
+        index: Index in the product
+        sizes: Size of each factor
+
+    Returns:
+        Index in each factor
+    """
+    positions = [0] * len(sizes)
+    for i in range(len(sizes) - 1, -1, -1):
+        index, positions[i] = divmod(index, sizes[i])
+    return positions
+
+
+def lazy_product(sweeps: List[Sequence]) -> Iterator[Tuple]:
+    """
+    Cartesian product of sequences that only holds the current item of each sequence.
+
+    Unlike :func:`itertools.product`, the sequences are not converted to tuples first: each one is iterated again for
+    every combination of the items of the sequences before it, so items built on access are never all in memory.
+
+    Args:
+        sweeps: Sequences
+
+    Returns:
+        Iterator of tuples, the last sequence varies the fastest
+    """
+    if not sweeps:
+        yield ()
+        return
+    if len(sweeps) == 1:
+        for item in sweeps[0]:
+            yield item,
+        return
+    for item in sweeps[0]:
+        for rest in lazy_product(sweeps[1:]):
+            yield (item,) + rest
+
+
+def normalize_index(index: int, length: int) -> int:
+    """
+    Normalize a possibly negative index and check it is in range.
+
+    Args:
+        index: Index
+        length: Length of the sequence
+
+    Returns:
+        Positive index
+
+    Raises:
+        IndexError - If the index is out of range
+    """
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError(f"Index {index} is out of range for {length} simulations")
+    return index
+
+
+class SweepDefinition(Sequence):
+    """
+    Sweep functions of a sweep definition: the function bound to each combination of the parameter values.
+
+    The functions are built on access, so any of them can be addressed by index without enumerating the ones before.
+    """
+
+    def __init__(self, function: TSweepFunction, parameters: Iterable[str], values: Iterable[List[Any]],
+                 remainder: str = None):
+        """
+        Constructor.
+
+        Args:
+            function: Sweep function
+            parameters: Names of the parameters of the function to sweep
+            values: Values of each parameter
+            remainder: Remainder
+        """
+        self.function = function
+        self.parameters = list(parameters)
+        self.values = [list(v) for v in values]
+        self.remainder = remainder
+        self._sizes = [len(v) for v in self.values]
+        self._length = int(np.prod(self._sizes)) if self._sizes else 1
+
+    def __len__(self):
+        """
+        Number of combinations of parameter values.
+
+        Returns:
+            Number of sweep functions
+        """
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Get the sweep function of a combination of parameter values.
+
+        Args:
+            index: Index of the combination or slice of indexes
+
+        Returns:
+            Sweep function, or list of sweep functions for a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._length)[index]]
+        positions = unravel_index(normalize_index(index, self._length), self._sizes)
+        value_set = [values[p] for values, p in zip(self.values, positions)]
+        return partial(self.function,
+                       **SimulationBuilder._map_argument_array(self.parameters, value_set, self.remainder))
+
+    def __iter__(self):
+        """
+        Iterate over the sweep functions.
+
+        Returns:
+            Iterator of sweep functions
+        """
+        for value_set in product(*self.values):
+            yield partial(self.function,
+                          **SimulationBuilder._map_argument_array(self.parameters, value_set, self.remainder))
+
+
+class SweepTableFunction:
+    """
+    Sweep function of one row of a sweep table.
+    """
+    __slots__ = ('function', 'row_parameter', 'row', 'tags')
+
+    def __init__(self, function: Callable, row_parameter: str, row: Dict[str, Any], tags: Dict[str, Any]):
+        """
+        Constructor.
+
+        Args:
+            function: Sweep function
+            row_parameter: Name of the parameter of the function receiving the row
+            row: Values of the row by column
+            tags: Values of the tag columns of the row
+        """
+        self.function = function
+        self.row_parameter = row_parameter
+        self.row = row
+        self.tags = tags
+
+    def __call__(self, simulation: Simulation) -> Dict[str, Any]:
+        """
+        Apply the row to a simulation.
+
+        Args:
+            simulation: Simulation to update
+
+        Returns:
+            Tags of the row, updated with the tags returned by the function
+        """
+        tags = dict(self.tags)
+        new_tags = self.function(**{SimulationBuilder.SIMULATION_ATTR: simulation, self.row_parameter: self.row})
+        if new_tags:
+            tags.update(new_tags)
+        return tags
+
+
+class SweepTable(Sequence):
+    """
+    Sweep over the rows of a table, one simulation per row.
+
+    The table is stored once as one NumPy array per column. Rows are converted to Python values by batches of
+    :attr:`BATCH_SIZE` rows when the sweep is iterated.
+    """
+    #: Number of rows converted at once when iterating
+    BATCH_SIZE = 1024
+
+    def __init__(self, function: Callable, row_parameter: str, table: Any, tags: Union[bool, Iterable[str]] = True):
+        """
+        Constructor.
+
+        Args:
+            function: Sweep function
+            row_parameter: Name of the parameter of the function receiving the row
+            table: pandas DataFrame, NumPy structured array or dict of column name to values
+            tags: Add all the columns (True), none (False) or the listed columns to the tags of the simulations
+
+        Raises:
+            ValueError - If the table has no columns or columns of different lengths, or a tag column is unknown
+        """
+        self.function = function
+        self.row_parameter = row_parameter
+        self.columns = self._get_columns(table)
+        if not self.columns:
+            raise ValueError("The sweep table has no columns")
+        lengths = set(len(values) for values in self.columns.values())
+        if len(lengths) > 1:
+            raise ValueError(f"The columns of the sweep table have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop()
+        if tags is True:
+            self.tag_columns = list(self.columns)
+        elif not tags:
+            self.tag_columns = []
+        else:
+            self.tag_columns = list(tags)
+            unknown = [c for c in self.tag_columns if c not in self.columns]
+            if unknown:
+                raise ValueError(f"Unknown tag columns: {unknown}")
+
+    @staticmethod
+    def _get_columns(table: Any) -> Dict[str, np.ndarray]:
+        """
+        Get the columns of a table as NumPy arrays. Columns are not copied when possible.
+
+        Args:
+            table: pandas DataFrame, NumPy structured array or dict of column name to values
+
+        Returns:
+            Dict of column name to values
+        """
+        if isinstance(table, pd.DataFrame):
+            return {str(name): table[name].to_numpy() for name in table.columns}
+        if isinstance(table, np.ndarray):
+            if table.dtype.names is None:
+                raise ValueError("NumPy sweep tables must be structured arrays")
+            return {name: table[name] for name in table.dtype.names}
+        if isinstance(table, dict):
+            return {str(name): np.asarray(values) for name, values in table.items()}
+        raise ValueError(f"Unsupported sweep table type: {type(table)}")
+
+    def _functions(self, start: int, stop: int) -> List[SweepTableFunction]:
+        """
+        Build the sweep functions of a range of rows.
+
+        The columns of the range are converted to Python values at once, then the rows and their tags are assembled.
+
+        Args:
+            start: First row
+            stop: Row after the last one
+
+        Returns:
+            Sweep functions of the rows
+        """
+        names = list(self.columns)
+        values = {name: self.columns[name][start:stop].tolist() for name in names}
+        rows = [dict(zip(names, row)) for row in zip(*(values[name] for name in names))]
+        if self.tag_columns:
+            tags = [dict(zip(self.tag_columns, row)) for row in zip(*(values[name] for name in self.tag_columns))]
+        else:
+            # the functions copy their tags
+            tags = [dict()] * len(rows)
+        return [SweepTableFunction(self.function, self.row_parameter, row, row_tags) for row, row_tags in zip(rows, tags)]
+
+    def __len__(self):
+        """
+        Number of rows.
+
+        Returns:
+            Number of simulations
+        """
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Get the sweep function of a row.
+
+        Args:
+            index: Row index or slice of indexes
+
+        Returns:
+            Sweep function, or list of sweep functions for a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._length)[index]]
+        index = normalize_index(index, self._length)
+        return self._functions(index, index + 1)[0]
+
+    def __iter__(self):
+        """
+        Iterate over the sweep functions of the rows.
+
+        Returns:
+            Iterator of sweep functions
+        """
+        for start in range(0, self._length, self.BATCH_SIZE):
+            yield from self._functions(start, min(start + self.BATCH_SIZE, self._length))
+
+
 class SimulationBuilder:
     """
     Class that represents an experiment builder.
@@ -170,6 +458,45 @@ class SimulationBuilder:
             self.sweeps.append((function,))
             self.count = 1
 
+    def add_sweep_table(self, table: Any, function: TSweepFunction, tags: Union[bool, Iterable[str]] = True):
+        """
+        Add a sweep over the rows of a table, for example a latin hypercube sample. Each row is one simulation.
+
+        Unlike :meth:`add_sweep_definition`, the values are not a cross-product: the table is stored once as columns and
+        the callback receives the values of a row as a dict. Like any sweep definition, the table sweep is crossed with
+        the other sweeps of the builder.
+
+        Args:
+            table: pandas DataFrame, NumPy structured array or dict of column name to values
+            function: The sweep function, which must take a **simulation** parameter and a parameter receiving the row
+            tags: Add all the columns (True), none (False) or the listed columns to the tags of the simulations
+
+        Returns:
+            None. Updates the Sweeps
+
+        Examples:
+            Sweep the rows of a DataFrame::
+
+                def set_row(simulation, row):
+                    simulation.task.update_parameters(row)
+
+                df = pd.DataFrame(dict(a=np.random.rand(1000), b=np.random.rand(1000)))
+                builder = SimulationBuilder()
+                builder.add_sweep_table(df, set_row)
+        """
+        remaining_parameters = self._extract_remaining_parameters(function)
+        if len(remaining_parameters) < 1:
+            raise ValueError("The callback function passed to SimulationBuilder.add_sweep_table needs to take a "
+                             "parameter receiving the row")
+        required_params = self._extract_required_parameters(remaining_parameters)
+        if len(required_params) > 1:
+            raise ValueError(f"The callback function passed to SimulationBuilder.add_sweep_table can only have one "
+                             f"required parameter other than {self.SIMULATION_ATTR}: {list(required_params)}")
+        row_parameter = next(iter(required_params or remaining_parameters))
+        sweep = SweepTable(function, row_parameter, table, tags)
+        self.sweeps.append(sweep)
+        self.count = len(sweep)
+
     def _extract_remaining_parameters(self, function):
         # Retrieve all the parameters in the signature of the function
         parameters = signature(function).parameters
@@ -202,10 +529,7 @@ class SimulationBuilder:
                     f"Currently the callback has {len(required_params)} required parameters and callback has {len(remaining_parameters)} parameters but there were {len(values)} arguments passed.")
             else:
                 # Handle special case
-                generated_values = product(*_values)
-                self.sweeps.append(
-                    partial(function, **self._map_argument_array(list(remaining_parameters), v)) for v in
-                    generated_values)
+                self.sweeps.append(SweepDefinition(function, remaining_parameters, _values))
                 self.count = np.prod(list(map(len, _values)))
                 return
 
@@ -221,15 +545,10 @@ class SimulationBuilder:
         # 1. len(required_params) > 0 and len(required_params) == len(values)
         # 2. len(required_params) == 0 and len(remaining_parameters) == 1 and len(values) == 1
         # create sweeps using the multi-index
-        generated_values = product(*_values)
         if len(required_params) > 0:
-            self.sweeps.append(
-                partial(function, **self._map_argument_array(list(required_params), v)) for v in
-                generated_values)
+            self.sweeps.append(SweepDefinition(function, required_params, _values))
         else:
-            self.sweeps.append(
-                partial(function, **self._map_argument_array(list(remaining_parameters), v)) for v in
-                generated_values)
+            self.sweeps.append(SweepDefinition(function, remaining_parameters, _values))
 
         self.count = np.prod(list(map(len, _values)))
 
@@ -256,9 +575,7 @@ class SimulationBuilder:
 
         # validate each values in a dict
         _values = {key: self._validate_value(vals) for key, vals in values.items()}
-        generated_values = product(*_values.values())
-        self.sweeps.append(
-            partial(function, **self._map_argument_array(_values.keys(), v)) for v in generated_values)
+        self.sweeps.append(SweepDefinition(function, _values.keys(), _values.values()))
         self.count = np.prod(list(map(len, _values.values())))
 
     def add_multiple_parameter_sweep_definition(self, function: TSweepFunction, *args, **kwargs):
@@ -334,11 +651,40 @@ class SimulationBuilder:
         Returns:
             The iterator
         """
+        if all(isinstance(sweep, Sequence) for sweep in self.sweeps):
+            # sweeps build their functions on access, don't build them all upfront like product would
+            yield from lazy_product(self.sweeps)
+            return
         old_sw, new_sw = duplicate_list_of_generators(self.sweeps)
 
         yield from product(*old_sw)
         self.sweeps = new_sw
 
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[TSweepFunction, ...], List[Tuple[TSweepFunction, ...]]]:
+        """
+        Get the sweep functions of a simulation without building the simulations before it.
+
+        The index is converted to an index in each sweep definition with mixed radix arithmetic.
+
+        Args:
+            index: Index of the simulation or slice of indexes
+
+        Returns:
+            Tuple of the sweep functions of the simulation (as produced by iterating the builder), or list of tuples
+            for a slice
+
+        Raises:
+            IndexError - If the index is out of range
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        index = normalize_index(index, len(self))
+        if not all(isinstance(sweep, Sequence) for sweep in self.sweeps):
+            # Sweeps that are plain iterators can't be addressed by index
+            return next(islice(iter(self), index, None))
+        positions = unravel_index(index, [len(sweep) for sweep in self.sweeps])
+        return tuple(sweep[p] for sweep, p in zip(self.sweeps, positions))
+
     def __len__(self):
         """
         Total simulations to be built by builder. This is a Product of all total values for each sweep.
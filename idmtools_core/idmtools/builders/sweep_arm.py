@@ -5,9 +5,11 @@ Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 from enum import Enum
 from functools import partial
-from itertools import product, tee
+from collections.abc import Sequence
+from itertools import product, tee, islice
 from typing import Callable, Any, Iterable, Union, List, Tuple, Dict
 from idmtools.builders import SimulationBuilder
+from idmtools.builders.simulation_builder import normalize_index
 from idmtools.entities.simulation import Simulation
 
 TSweepFunction = Union[
@@ -92,6 +94,27 @@ class SweepArm(SimulationBuilder):
 
         self.__functions = result
 
+    def __getitem__(self, index):
+        """
+        Get the sweep functions of a simulation of the arm without building the simulations before it.
+
+        Args:
+            index: Index of the simulation or slice of indexes
+
+        Returns:
+            Tuple of the sweep functions of the simulation, or list of tuples for a slice
+
+        Raises:
+            IndexError - If the index is out of range
+        """
+        if self.type != ArmType.pair or isinstance(index, slice):
+            return super().__getitem__(index)
+        index = normalize_index(index, len(self))
+        if not all(isinstance(sweep, Sequence) for sweep in self.sweeps):
+            return next(islice(iter(self.functions), index, None))
+        # paired sweeps advance together
+        return tuple(sweep[index] for sweep in self.sweeps)
+
     def _update_count(self, values):
         """
         Update count of sweeps.
@@ -4,19 +4,22 @@ EntityContainer definition. EntityContainer provides an envelope for a Parent to
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import typing
+from collections import Counter
 
 
 if typing.TYPE_CHECKING:
     from idmtools.core.interfaces.ientity import IEntity
     from idmtools.core.enums import EntityStatus
-    from typing import List
+    from typing import Dict, Iterable, List, Optional
 
 
 class EntityContainer(list):
     """
     EntityContainer is a wrapper classes used by Experiments and Suites to wrap their children.
 
-    It provides utilities to set status on entities
+    It provides utilities to set status on entities. The container keeps an index of the children by id and counts the
+    children in each status so looking up a child or aggregating the status of the children does not require to go
+    through the whole list. Children notify the containers they belong to when their status changes.
     """
 
     def __init__(self, children: 'List[IEntity]' = None):
@@ -27,8 +30,332 @@ class EntityContainer(list):
             children: Children to initialize with
         """
         super().__init__()
+        # id -> position of the children. Built on the first lookup and after the list is reordered
+        self._index: 'Optional[Dict[str, int]]' = None
+        # Number of children in each status
+        self._status_counts: 'Counter' = Counter()
         self.extend(children or [])
 
+    def __reduce__(self):
+        """
+        Pickle the container as its list of children. The index and status counters are rebuilt on load.
+
+        Returns:
+            Reduce tuple
+        """
+        return self.__class__, (list(self),)
+
+    # region Tracking of the children
+    @staticmethod
+    def _get_stored_status(entity) -> 'Optional[EntityStatus]':
+        """
+        Get the status stored on a child.
+
+        Children whose status is aggregated from their own children, like experiments, have no stored status.
+
+        Args:
+            entity: Child
+
+        Returns:
+            Status of the child
+        """
+        state = getattr(entity, '__dict__', None)
+        if state is None:
+            return getattr(entity, 'status', None)
+        return state.get('status')
+
+    def _track(self, entities: 'Iterable[IEntity]'):
+        """
+        Add children to the status counters and register the container on them.
+
+        Args:
+            entities: Children added to the container
+
+        Returns:
+            None
+        """
+        for entity in entities:
+            self._status_counts[self._get_stored_status(entity)] += 1
+            state = getattr(entity, '__dict__', None)
+            if state is not None:
+                state.setdefault('_status_observers', []).append(self)
+        self._index = None
+
+    def _untrack(self, entities: 'Iterable[IEntity]'):
+        """
+        Remove children from the status counters and unregister the container from them.
+
+        Args:
+            entities: Children removed from the container
+
+        Returns:
+            None
+        """
+        for entity in entities:
+            status = self._get_stored_status(entity)
+            self._status_counts[status] -= 1
+            if self._status_counts[status] <= 0:
+                del self._status_counts[status]
+            observers = getattr(entity, '__dict__', {}).get('_status_observers', [])
+            for i, observer in enumerate(observers):
+                # containers compare by content so look for this container by identity
+                if observer is self:
+                    del observers[i]
+                    break
+        self._index = None
+
+    def _status_changed(self, old: 'Optional[EntityStatus]', new: 'Optional[EntityStatus]'):
+        """
+        Update the status counters when a child changes status.
+
+        Args:
+            old: Previous status of the child
+            new: New status of the child
+
+        Returns:
+            None
+        """
+        self._status_counts[old] -= 1
+        if self._status_counts[old] <= 0:
+            del self._status_counts[old]
+        self._status_counts[new] += 1
+
+    def _rebuild_index(self) -> 'Dict[str, int]':
+        """
+        Build the id to position index of the children.
+
+        Returns:
+            Index
+        """
+        index = dict()
+        for i, entity in enumerate(self):
+            index.setdefault(str(entity.uid), i)
+        self._index = index
+        return index
+
+    def _position(self, item_id) -> 'Optional[int]':
+        """
+        Find the position of a child.
+
+        Ids of children can change after the index was built, for example when the children are created on a platform.
+        A position that doesn't match the id anymore triggers a rebuild of the index.
+
+        Args:
+            item_id: Id of the child
+
+        Returns:
+            Position of the child or None when the id is not in the container
+        """
+        item_id = str(item_id)
+        index = self._index if self._index is not None else self._rebuild_index()
+        position = index.get(item_id)
+        if position is None or position >= len(self) or str(self[position].uid) != item_id:
+            position = self._rebuild_index().get(item_id)
+        return position
+    # endregion
+
+    # region List operations
+    def append(self, entity: 'IEntity'):
+        """
+        Append a child.
+
+        Args:
+            entity: Child to add
+
+        Returns:
+            None
+        """
+        super().append(entity)
+        self._track([entity])
+
+    def extend(self, entities: 'Iterable[IEntity]'):
+        """
+        Add children.
+
+        Args:
+            entities: Children to add
+
+        Returns:
+            None
+        """
+        entities = list(entities)
+        super().extend(entities)
+        self._track(entities)
+
+    def __iadd__(self, entities: 'Iterable[IEntity]'):
+        """
+        Add children.
+
+        Args:
+            entities: Children to add
+
+        Returns:
+            The container
+        """
+        self.extend(entities)
+        return self
+
+    def __imul__(self, n: int):
+        """
+        Repeat the children.
+
+        Args:
+            n: Number of repetitions
+
+        Returns:
+            The container
+        """
+        if n <= 0:
+            self.clear()
+        else:
+            self.extend(list(self) * (n - 1))
+        return self
+
+    def insert(self, position: int, entity: 'IEntity'):
+        """
+        Insert a child.
+
+        Args:
+            position: Position to insert at
+            entity: Child to insert
+
+        Returns:
+            None
+        """
+        super().insert(position, entity)
+        self._track([entity])
+
+    def remove(self, entity: 'IEntity'):
+        """
+        Remove a child.
+
+        Args:
+            entity: Child to remove
+
+        Returns:
+            None
+
+        Raises:
+            ValueError when the child is not in the container
+        """
+        del self[self.index(entity)]
+
+    def pop(self, position: int = -1) -> 'IEntity':
+        """
+        Remove a child and return it.
+
+        Args:
+            position: Position of the child
+
+        Returns:
+            Child removed
+        """
+        entity = super().pop(position)
+        self._untrack([entity])
+        return entity
+
+    def clear(self):
+        """
+        Remove all the children.
+
+        Returns:
+            None
+        """
+        self._untrack(self)
+        super().clear()
+
+    def __setitem__(self, key, value):
+        """
+        Replace children.
+
+        Args:
+            key: Position or slice
+            value: Child or children
+
+        Returns:
+            None
+        """
+        old = self[key]
+        if isinstance(key, slice):
+            value = list(value)
+        super().__setitem__(key, value)
+        self._untrack(old if isinstance(key, slice) else [old])
+        self._track(value if isinstance(key, slice) else [value])
+
+    def __delitem__(self, key):
+        """
+        Remove children.
+
+        Args:
+            key: Position or slice
+
+        Returns:
+            None
+        """
+        old = self[key]
+        super().__delitem__(key)
+        self._untrack(old if isinstance(key, slice) else [old])
+
+    def sort(self, *args, **kwargs):
+        """
+        Sort the children.
+
+        Args:
+            *args: Arguments of list.sort
+            **kwargs: Keyword arguments of list.sort
+
+        Returns:
+            None
+        """
+        super().sort(*args, **kwargs)
+        self._index = None
+
+    def reverse(self):
+        """
+        Reverse the order of the children.
+
+        Returns:
+            None
+        """
+        super().reverse()
+        self._index = None
+    # endregion
+
+    def get_item(self, item_id) -> 'Optional[IEntity]':
+        """
+        Get a child by id.
+
+        Args:
+            item_id: Id of the child
+
+        Returns:
+            Child or None when the id is not in the container
+        """
+        position = self._position(item_id)
+        return None if position is None else self[position]
+
+    @property
+    def status_counts(self) -> 'Dict[Optional[EntityStatus], int]':
+        """
+        Get the number of children in each status.
+
+        Returns:
+            Dict of status to number of children. Statuses without any children are omitted
+        """
+        return dict(self._status_counts)
+
+    def count_status(self, *statuses: 'Optional[EntityStatus]') -> int:
+        """
+        Count the children in any of the statuses.
+
+        Args:
+            *statuses: Statuses to count
+
+        Returns:
+            Number of children
+        """
+        return sum(self._status_counts.get(status, 0) for status in statuses)
+
     def set_status(self, status: 'EntityStatus'):
         """
         Set status on all the children.
@@ -56,9 +383,27 @@ class EntityContainer(list):
         Raises:
             ValueError when the item_id is not in the children list
         """
-        for entity in self:
-            if str(entity.uid) == str(item_id):
-                entity.status = status
-                return
+        position = self._position(item_id)
+        if position is None:
+            raise ValueError(f"Item with id {item_id} not found in the container")
+        self[position].status = status
+
+    def set_statuses(self, statuses: 'Dict[str, EntityStatus]'):
+        """
+        Set status for many sub-items at once.
+
+        Args:
+            statuses: Dict of item id to status
 
-        raise ValueError(f"Item with id {item_id} not found in the container")
+        Returns:
+            None
+
+        Raises:
+            ValueError when any of the ids is not in the children list. No status is set in that case
+        """
+        positions = [(self._position(item_id), item_id, status) for item_id, status in statuses.items()]
+        missing = [item_id for position, item_id, _ in positions if position is None]
+        if missing:
+            raise ValueError(f"Items with ids {', '.join(str(m) for m in missing)} not found in the container")
+        for position, _, status in positions:
+            self[position].status = status
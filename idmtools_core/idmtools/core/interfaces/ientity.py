@@ -236,6 +236,36 @@ class IEntity(IItem, metaclass=ABCMeta):
         """
         return id(self.uid)
 
+    def __setattr__(self, key, value):
+        """
+        Set an attribute. Status changes are reported to the containers of the entity to keep their status counters.
+
+        Args:
+            key: Attribute name
+            value: Value to set
+
+        Returns:
+            None
+        """
+        observers = self.__dict__.get('_status_observers') if key == 'status' else None
+        if not observers:
+            super().__setattr__(key, value)
+            return
+        old = self.__dict__.get('status')
+        super().__setattr__(key, value)
+        new = self.__dict__.get('status')
+        if old != new:
+            for container in observers:
+                container._status_changed(old, new)
+
+    def __getstate__(self):
+        """
+        Ignore the fields in pickle_ignore_fields and the containers of the entity during pickling.
+        """
+        state = super().__getstate__()
+        state.pop('_status_observers', None)
+        return state
+
     def _check_for_platform_from_context(self, platform) -> 'IPlatform':
         """
         Try to determine platform of current object from self or current platform.
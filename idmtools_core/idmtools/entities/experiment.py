@@ -139,7 +139,10 @@ class Experiment(IAssetsEnabled, INamedEntity, IRunnableEntity):
             status = EntityStatus.CREATED if self._platform_object else None
             return status
 
-        sim_statuses = set([s.status for s in self.simulations.items])
+        if isinstance(self.simulations.items, EntityContainer):
+            sim_statuses = set(self.simulations.items.status_counts)
+        else:
+            sim_statuses = set([s.status for s in self.simulations.items])
         any_succeeded_failed = any([s in [EntityStatus.FAILED, EntityStatus.SUCCEEDED] for s in sim_statuses])
         if len(self.simulations.items) == 0 or all([s is None for s in sim_statuses]):
             status = None  # this will trigger experiment creation on a platform
@@ -320,6 +323,9 @@ class Experiment(IAssetsEnabled, INamedEntity, IRunnableEntity):
         Returns:
             True if all simulations have ran, False otherwise
         """
+        if isinstance(self.simulations.items, EntityContainer):
+            sims = self.simulations.items
+            return sims.count_status(EntityStatus.SUCCEEDED, EntityStatus.FAILED) == len(sims)
         return all([s.done for s in self.simulations])
 
     @property
@@ -330,6 +336,9 @@ class Experiment(IAssetsEnabled, INamedEntity, IRunnableEntity):
         Returns:
             True if all simulations have succeeded, False otherwise
         """
+        if isinstance(self.simulations.items, EntityContainer):
+            sims = self.simulations.items
+            return sims.count_status(EntityStatus.SUCCEEDED) == len(sims)
         return all([s.succeeded for s in self.simulations])
 
     @property
@@ -340,6 +349,8 @@ class Experiment(IAssetsEnabled, INamedEntity, IRunnableEntity):
         Returns:
             True if all simulations have succeeded, False otherwise
         """
+        if isinstance(self.simulations.items, EntityContainer):
+            return self.simulations.items.count_status(EntityStatus.FAILED) > 0
         return any([s.failed for s in self.simulations])
 
     @property
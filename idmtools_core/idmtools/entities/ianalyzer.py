@@ -8,13 +8,14 @@ from logging import getLogger
 from typing import Any, NoReturn, List, TypeVar, Dict, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from idmtools.analysis.analysis_item_ref import AnalysisItemRef
     from idmtools.core.interfaces.iitem import IItemList
     from idmtools.entities.iworkflow_item import IWorkflowItem
     from idmtools.entities.simulation import Simulation
 
 logger = getLogger(__name__)
 # Items that we support analysis on
-ANALYZABLE_ITEM = Union['IWorkflowItem', 'Simulation']
+ANALYZABLE_ITEM = Union['IWorkflowItem', 'Simulation', 'AnalysisItemRef']
 # The item type we pass to analysis
 ANALYSIS_ITEM_MAP_DATA_TYPE = Dict[str, Any]
 # The datatype if the reduce input
@@ -25,9 +26,13 @@ class IAnalyzer(metaclass=ABCMeta):
     """
     An abstract base class carrying the lowest level analyzer interfaces called by :class:`~idmtools.managers.experiment_manager.ExperimentManager`.
     """
+    # Set to True by analyzers implementing the incremental reduce protocol (:meth:`combine` and :meth:`finalize`)
+    supports_incremental: bool = False
 
     @abstractmethod
-    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None):
+    def __init__(self, uid=None, working_dir: Optional[str] = None, parse: bool = True, filenames: Optional[List[str]] = None,
+                 columns: Optional[Union[List[str], Dict[str, List[str]]]] = None,
+                 json_paths: Optional[Union[List[str], Dict[str, List[str]]]] = None):
         """
         A constructor.
 
@@ -37,8 +42,15 @@ class IAnalyzer(metaclass=ABCMeta):
             parse: True to leverage the :class:`OutputParser`; False to get the raw
                 data in the :meth:`select_simulation_data`.
             filenames: The files for the analyzer to download.
+            columns: Columns to load from csv files when parsing. Either a list used for every csv file or a dict of
+                filename -> columns. All columns are loaded when None.
+            json_paths: Paths of the values to load from json files when parsing, for example
+                "Channels/Infected/Data". Either a list used for every json file or a dict of filename -> paths. The
+                whole document is loaded when None.
         """
         self.parse = parse
+        self.columns = columns
+        self.json_paths = json_paths
         self.working_dir = working_dir
         self.uid = uid or self.__class__.__name__
         self.results = None  # Store what finalize() is returning
@@ -129,6 +141,45 @@ class IAnalyzer(metaclass=ABCMeta):
         """
         pass
 
+    @property
+    def is_incremental(self) -> bool:
+        """
+        Whether the analyzer implements the incremental reduce protocol (:meth:`combine` and :meth:`finalize`).
+
+        Incremental analyzers have their map results folded into a partial result as soon as each item is mapped,
+        so the :class:`~idmtools.analysis.analyze_manager.AnalyzeManager` never holds all map results in memory.
+
+        Returns:
+            The :attr:`supports_incremental` flag of the analyzer
+        """
+        return self.supports_incremental
+
+    def combine(self, partial: Any, item: ANALYZABLE_ITEM, mapped: Any) -> Any:
+        """
+        Fold the :meth:`map` result of one item into the partial result. Used instead of :meth:`reduce` when :attr:`supports_incremental` is set.
+
+        Args:
+            partial: The partial result returned by the previous call. None on the first call.
+            item: :class:`~idmtools.entities.iitem.IItem` object that the mapped data is associated with.
+            mapped: The data returned by :meth:`map` for this item.
+
+        Returns:
+            The new partial result.
+        """
+        raise NotImplementedError("Incremental reduce is not implemented by this analyzer")
+
+    def finalize(self, partial: Any) -> Any:
+        """
+        Turn the partial result built by :meth:`combine` into the final result of the analyzer.
+
+        Args:
+            partial: The partial result returned by the last :meth:`combine` call. None if no item was mapped.
+
+        Returns:
+            The analyzer result. By default, the partial result itself.
+        """
+        return partial
+
     def destroy(self) -> NoReturn:
         """
         Call after the analysis is done.
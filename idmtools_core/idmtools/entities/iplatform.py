@@ -17,6 +17,7 @@ from pathlib import PureWindowsPath, PurePath
 from itertools import groupby
 from logging import getLogger, DEBUG
 from typing import Dict, List, NoReturn, Type, TypeVar, Any, Union, Tuple, Set, Iterator, Callable, Optional
+from idmtools.analysis.analysis_item_ref import AnalysisItemRef
 from idmtools.core.context import set_current_platform
 from idmtools import IdmConfigParser
 from idmtools.core import CacheEnabled, UnknownItemException, EntityContainer, UnsupportedPlatformType
@@ -39,6 +40,7 @@ from idmtools.entities.relation_type import RelationType
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.suite import Suite
 from idmtools.assets.asset_collection import AssetCollection
+from idmtools.services.file_cache import get_file_cache
 from idmtools.services.platforms import PlatformPersistService
 from idmtools.utils.caller import get_caller
 from idmtools.utils.entities import validate_user_inputs_against_dataclass
@@ -553,6 +555,21 @@ class IPlatform(IItem, CacheEnabled, metaclass=ABCMeta):
 
         return result
 
+    def to_analysis_item_ref(self, item: object) -> Optional[AnalysisItemRef]:
+        """
+        Build the lightweight reference of an item sent to analysis workers.
+
+        Platforms able to retrieve the files of an item from its reference (see :meth:`get_files`) should override
+        this method.
+
+        Args:
+            item: Item to analyze
+
+        Returns:
+            AnalysisItemRef or None to send the item itself
+        """
+        return None
+
     def flatten_item(self, item: object, **kwargs) -> List[object]:
         """
         Flatten an item: resolve the children until getting to the leaves.
@@ -609,8 +626,7 @@ class IPlatform(IItem, CacheEnabled, metaclass=ABCMeta):
             simulations described above
         """
         self.validate_type(item)
-        interface = ITEM_TYPE_TO_OBJECT_INTERFACE[item.item_type]
-        ret = getattr(self, interface).get_assets(item, files, **kwargs)
+        ret = self._get_assets_with_file_cache(item, files, **kwargs)
 
         if output:
             if item.item_type not in (ItemType.SIMULATION, ItemType.WORKFLOW_ITEM, ItemType.ASSETCOLLECTION):
@@ -627,6 +643,70 @@ class IPlatform(IItem, CacheEnabled, metaclass=ABCMeta):
 
         return ret
 
+    def get_file_signatures(self, item: IEntity, files: Union[Set[str], List[str]]) -> Optional[Dict[str, str]]:
+        """
+        Get signatures of an item's files used to key the local file cache.
+
+        A signature must change whenever the file content changes, for example the file size and checksum. Only remote
+        platforms should override this method: local files are read faster than they are hashed into the cache.
+
+        Args:
+            item: Item the files belong to
+            files: List of file names
+
+        Returns:
+            Dictionary of filename -> signature. Files without signature are never cached. None disables the cache for
+            the item.
+        """
+        return None
+
+    def _get_assets_with_file_cache(self, item: IEntity, files: Union[Set[str], List[str]], **kwargs) -> \
+            Union[Dict[str, Dict[str, bytearray]], Dict[str, bytearray]]:
+        """
+        Get assets of an item, using the local file cache when it is enabled in idmtools.ini.
+
+        Args:
+            item: Item to fetch files for
+            files: List of file names to get
+            kwargs: Platform arguments
+
+        Returns:
+            Same as the get_assets of the item's operations. Cached files are returned as bytearray too
+        """
+        interface = getattr(self, ITEM_TYPE_TO_OBJECT_INTERFACE[item.item_type])
+        file_cache = None
+        signatures = None
+        # platforms without file signatures, the local ones, don't open the cache at all
+        if files and item.item_type in (ItemType.SIMULATION, ItemType.WORKFLOW_ITEM) and \
+                type(self).get_file_signatures is not IPlatform.get_file_signatures:
+            file_cache = get_file_cache()
+            if file_cache:
+                signatures = self.get_file_signatures(item, files)
+        if not signatures:
+            return interface.get_assets(item, files, **kwargs)
+
+        platform_key = self.__class__.__name__
+        ret = dict()
+        missing = []
+        for filename in files:
+            signature = signatures.get(filename)
+            content = file_cache.get(file_cache.key(platform_key, item.uid, filename, signature)) if signature else None
+            if content is None:
+                missing.append(filename)
+            else:
+                ret[filename] = bytearray(content)
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(f"File cache: {len(ret)} hit(s) and {len(missing)} miss(es) for {item.uid}")
+        if missing:
+            fetched = interface.get_assets(item, missing, **kwargs)
+            for filename, content in fetched.items():
+                signature = signatures.get(filename)
+                if signature and isinstance(content, (bytes, bytearray, memoryview)):
+                    file_cache.set(file_cache.key(platform_key, item.uid, filename, signature), content)
+            ret.update(fetched)
+        return ret
+
     def get_files_by_id(self, item_id: str, item_type: ItemType, files: Union[Set[str], List[str]],
                         output: str = None) -> \
             Union[Dict[str, Dict[str, bytearray]], Dict[str, bytearray]]:
@@ -776,8 +856,13 @@ class IPlatform(IItem, CacheEnabled, metaclass=ABCMeta):
 
         # if we do have a progress bar, update it
         done = 0
+        children = getattr(item, child_attribute)
+        if isinstance(item, Experiment) and isinstance(children.items, EntityContainer):
+            # the container keeps count of the simulations in each status
+            done = children.items.count_status(*done_states)
+            children = []
         # iterate over the children
-        for child in getattr(item, child_attribute):
+        for child in children:
             # if the item is an experiment, use the status
             if isinstance(item, Experiment) and child.status in done_states:
                 done += 1
@@ -6,12 +6,17 @@ This is meant to be combined with builders.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import copy
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, fields, InitVar
 from functools import partial
 from itertools import chain
-from typing import Set, Generator, Dict, Any, List, TYPE_CHECKING, Union
-from more_itertools import grouper
+from typing import Set, Generator, Dict, Any, List, TYPE_CHECKING, Union, Callable, Iterable, Optional, Tuple
+from more_itertools import grouper, chunked
+from idmtools.assets import AssetCollection
 from idmtools.entities.itask import ITask
+from idmtools.frozen.copy_on_write import CopyOnWriteDict, CopyOnWriteList
 from idmtools.entities.simulation import Simulation
 from idmtools.utils.collections import ResetGenerator
 from idmtools.utils.hashing import ignore_fields_in_dataclass_on_pickle
@@ -21,6 +26,29 @@ if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.experiment import Experiment
 
 
+def build_simulation(new_sim_func: Callable[[], Simulation], simulation_functions: Iterable[Callable]) -> Simulation:
+    """
+    Build a simulation from the sweep functions of a builder.
+
+    Args:
+        new_sim_func: Build new simulation callback
+        simulation_functions: Sweep functions to apply to the simulation
+
+    Returns:
+        Simulation
+    """
+    simulation = new_sim_func()
+    tags = {}
+
+    for func in simulation_functions:
+        new_tags = func(simulation=simulation)
+        if new_tags:
+            tags.update(new_tags)
+
+    simulation.tags.update(tags)
+    return simulation
+
+
 def simulation_generator(builders, new_sim_func, additional_sims=None, batch_size=10):
     """
     Generates batches of simulations from the templated simulations.
@@ -39,20 +67,156 @@ def simulation_generator(builders, new_sim_func, additional_sims=None, batch_siz
     # Then the builders
     for groups in grouper(chain(*builders), batch_size):
         for simulation_functions in filter(None, groups):
-            simulation = new_sim_func()
-            tags = {}
+            yield build_simulation(new_sim_func, simulation_functions)
+
+    yield from additional_sims
+
+
+# Template and builders used by the simulation generation workers
+_GENERATION_TEMPLATE: Optional['TemplatedSimulations'] = None
+_GENERATION_BUILDERS: List[Optional[Union[SimulationBuilder, ArmSimulationBuilder]]] = []
+
+
+def is_index_addressable(builder: Union[SimulationBuilder, ArmSimulationBuilder]) -> bool:
+    """
+    Check if the sweep functions of any simulation of a builder can be built from its index.
+
+    Args:
+        builder: Builder
+
+    Returns:
+        True if all the sweeps of the builder are sequences
+    """
+    if isinstance(builder, ArmSimulationBuilder):
+        return all(is_index_addressable(arm) for arm in builder.arms)
+    if isinstance(builder, SimulationBuilder):
+        return all(isinstance(sweep, Sequence) for sweep in builder.sweeps)
+    return False
+
+
+def _generation_worker_initializer(base_simulation: Simulation, assets: AssetCollection, copy_on_write: bool,
+                                   builders: List[Optional[Union[SimulationBuilder, ArmSimulationBuilder]]] = None):
+    """
+    Initialize a simulation generation worker process with the base simulation and the builders.
+
+    Args:
+        base_simulation: Base simulation
+        assets: Assets of the base simulation. They are not pickled with the simulation
+        copy_on_write: Copy on write setting of the templated simulations
+        builders: Index addressable builders, None in place of the other ones
+
+    Returns:
+        None
+    """
+    global _GENERATION_TEMPLATE, _GENERATION_BUILDERS
+    base_simulation.assets = assets
+    _GENERATION_TEMPLATE = TemplatedSimulations(base_simulation=base_simulation, copy_on_write=copy_on_write)
+    _GENERATION_BUILDERS = builders or []
+
+
+def _generate_simulations(functions_chunk: List[Iterable[Callable]]) -> List[Tuple[Simulation, AssetCollection]]:
+    """
+    Build simulations from their sweep functions in a generation worker process.
 
-            for func in simulation_functions:
-                new_tags = func(simulation=simulation)
-                if new_tags:
-                    tags.update(new_tags)
+    Args:
+        functions_chunk: Sweep functions of each simulation
+
+    Returns:
+        Simulations with their assets. The assets are not pickled with the simulations
+    """
+    simulations = [build_simulation(_GENERATION_TEMPLATE.new_simulation, functions) for functions in functions_chunk]
+    return [(simulation, simulation.assets) for simulation in simulations]
+
+
+def _generate_range(builder_index: int, start: int, stop: int) -> List[Tuple[Simulation, AssetCollection]]:
+    """
+    Build the simulations of a range of sweep indexes of a builder in a generation worker process.
+
+    Args:
+        builder_index: Position of the builder in the builders of the worker
+        start: First index
+        stop: Index after the last one
+
+    Returns:
+        Simulations with their assets
+    """
+    return _generate_simulations(_GENERATION_BUILDERS[builder_index][start:stop])
+
+
+def parallel_simulation_generator(builders, template: 'TemplatedSimulations', workers: int, chunk_size: int,
+                                  additional_sims=None):
+    """
+    Generates simulations from the templated simulations in worker processes.
+
+    The sweep space of the builders is split in ranges of chunk_size consecutive indexes. Each range is built in a
+    worker process. Simulations are yielded in the same order as :func:`simulation_generator` as soon as their range
+    is built, and at most two ranges per worker are built ahead of the consumer.
+
+    The builders are sent once to each worker, which builds the sweep functions of a range from their indexes, so only
+    the bounds of the ranges are sent per task. The sweep functions of builders that aren't index addressable (see
+    :func:`is_index_addressable`) are enumerated here and sent to the workers instead. In both cases, the sweep
+    functions must be picklable (module level functions or partials of them).
 
-            simulation.tags.update(tags)
-            yield simulation
+    Args:
+        builders: List of builders to build
+        template: Templated simulations the builders belong to
+        workers: Number of worker processes
+        chunk_size: Number of simulations built per task
+        additional_sims: Additional simulations
+
+    Returns:
+        Generator for simulations
+    """
+    if additional_sims is None:
+        additional_sims = []
+    base_simulation = template.base_simulation
+    builders = list(builders)
+    indexed_builders = [builder if is_index_addressable(builder) else None for builder in builders]
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_generation_worker_initializer,
+                                   initargs=(base_simulation, base_simulation.assets, template.copy_on_write,
+                                             indexed_builders))
+    pending = deque()
+    try:
+        for builder_index, builder in enumerate(builders):
+            if indexed_builders[builder_index] is not None:
+                tasks = ((_generate_range, builder_index, start, min(start + chunk_size, len(builder)))
+                         for start in range(0, len(builder), chunk_size))
+            else:
+                tasks = ((_generate_simulations, functions_chunk) for functions_chunk in chunked(builder, chunk_size))
+            for task in tasks:
+                pending.append(executor.submit(*task))
+                while len(pending) >= 2 * workers:
+                    yield from _with_parent(pending.popleft().result(), template.parent)
+        while pending:
+            yield from _with_parent(pending.popleft().result(), template.parent)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
 
     yield from additional_sims
 
 
+def _with_parent(simulations: List[Tuple[Simulation, AssetCollection]], parent: Optional['Experiment']) -> \
+        List[Simulation]:
+    """
+    Set the assets and the parent of simulations built in a worker process.
+
+    Args:
+        simulations: Simulations with their assets
+        parent: Parent experiment
+
+    Returns:
+        Simulations
+    """
+    result = []
+    for simulation, assets in simulations:
+        simulation.assets = assets
+        simulation.parent = parent
+        result.append(simulation)
+    return result
+
+
 @dataclass(repr=False)
 class TemplatedSimulations:
     """
@@ -77,6 +241,14 @@ class TemplatedSimulations:
     parent: 'Experiment' = field(default=None)
     tags: InitVar[Dict] = None
     __extra_simulations: List[Simulation] = field(default_factory=list)
+    #: Share the dicts and lists of the base task with the simulations until they are modified. Only enable it when the
+    #: base task is not modified once the simulations are generated, see new_simulation
+    copy_on_write: bool = field(default=False, compare=False)
+    #: Number of worker processes building the simulations of the builders. Simulations are built on the calling
+    #: thread when not set. See parallel_simulation_generator
+    generation_workers: int = field(default=None, compare=False)
+    #: Number of simulations built per task by the generation workers
+    generation_chunk_size: int = field(default=64, compare=False)
 
     def __post_init__(self, tags):
         """
@@ -180,7 +352,11 @@ class TemplatedSimulations:
         Returns:
             Simulation iterator
         """
-        p = partial(simulation_generator, self.builders, self.new_simulation, self.__extra_simulations)
+        if self.generation_workers and self.generation_workers > 1:
+            p = partial(parallel_simulation_generator, self.builders, self, self.generation_workers,
+                        self.generation_chunk_size, self.__extra_simulations)
+        else:
+            p = partial(simulation_generator, self.builders, self.new_simulation, self.__extra_simulations)
         return ResetGenerator(p)
 
     def extra_simulations(self) -> List[Simulation]:
@@ -223,13 +399,26 @@ class TemplatedSimulations:
         """
         Return a new simulation object.
 
-        The simulation will be copied from the base simulation of the experiment.
+        The simulation will be copied from the base simulation of the experiment. When copy_on_write is enabled, the dicts
+        and lists of the task are :class:`~idmtools.frozen.copy_on_write.CopyOnWriteDict` and
+        :class:`~idmtools.frozen.copy_on_write.CopyOnWriteList` overlays of the base task ones, which become plain
+        containers when the simulation is pickled or deep copied.
 
         Returns:
             The created simulation.
         """
-        # TODO: the experiment should be frozen when the first simulation is created
-        sim = copy.deepcopy(self.base_simulation)
+        memo = dict()
+        if self.copy_on_write:
+            # The dicts and lists of the base task (parameters, configs) are the bulk of the simulation. Instead of deep
+            # copying them, give the simulation copy on write overlays that copy nested values only when they are
+            # accessed. The base task must not be modified once simulations are generated, since the values that were
+            # not accessed yet are shared with them.
+            for value in getattr(self.base_simulation.task, '__dict__', {}).values():
+                if isinstance(value, dict) and value:
+                    memo[id(value)] = CopyOnWriteDict(value)
+                elif isinstance(value, list) and value:
+                    memo[id(value)] = CopyOnWriteList(value)
+        sim = copy.deepcopy(self.base_simulation, memo)
         # Set UID=none to ensure it is regenerated
         sim._uid = None
         sim.assets = copy.deepcopy(self.base_simulation.assets)
@@ -0,0 +1,234 @@
+"""
+copy_on_write provides dict and list overlays sharing their nested values with a read-only base.
+
+A copy on write container is a shallow copy of its base. Nested mutable values stay shared with the base until they are
+accessed through the container, at which point they are replaced by a private copy (itself a copy on write overlay for
+dicts and lists). Writes therefore never reach the base, and only the parts of the base actually touched are copied.
+
+The containers are real dict/list subclasses so they can be serialized directly. They are pickled and deep copied as
+plain dicts/lists.
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import copy
+from enum import Enum
+from typing import Any
+
+_MISSING = object()
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), bytes, complex, frozenset)
+
+
+def _is_immutable(value: Any) -> bool:
+    """
+    Check if a value can be shared without copying.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        True if the value is immutable
+    """
+    return type(value) in _IMMUTABLE_TYPES or isinstance(value, Enum)
+
+
+def copy_on_write(value: Any) -> Any:
+    """
+    Get a private version of a value that shares as much as possible with the original.
+
+    Args:
+        value: Value to copy
+
+    Returns:
+        CopyOnWriteDict for dicts, CopyOnWriteList for lists, the value itself for immutable values and a deep copy
+        otherwise
+    """
+    if _is_immutable(value):
+        return value
+    if isinstance(value, dict):
+        return CopyOnWriteDict(value)
+    if isinstance(value, list):
+        return CopyOnWriteList(value)
+    return copy.deepcopy(value)
+
+
+class CopyOnWriteDict(dict):
+    """
+    Dict overlay over a base dict. Nested values are copied from the base on first access.
+    """
+    __slots__ = ('_base',)
+
+    def __init__(self, base: dict):
+        """
+        Initialize the overlay.
+
+        Args:
+            base: Dict to share values with. It should not be modified while the overlay is in use
+        """
+        super().__init__(base)
+        self._base = base
+
+    def _unshare(self, key, value):
+        """
+        Get a private version of a value of the dict.
+
+        Args:
+            key: Key of the value
+            value: Value stored in the overlay
+
+        Returns:
+            The value or a private copy when it is shared with the base
+        """
+        if _is_immutable(value) or dict.get(self._base, key, _MISSING) is not value:
+            return value
+        return copy_on_write(value)
+
+    def __getitem__(self, key):
+        """Get self[key], copying the value from the base if needed."""
+        value = dict.__getitem__(self, key)
+        private = self._unshare(key, value)
+        if private is not value:
+            dict.__setitem__(self, key, private)
+        return private
+
+    def __iter__(self):
+        """Iterate over the keys. Defined so dict(overlay) and {**overlay} go through __getitem__."""
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        """Get self[key] if key is in the dict, else default."""
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        """Get self[key] if key is in the dict, else set self[key] to default and return it."""
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *args):
+        """Remove key and return its value, or default if given and key is not in the dict."""
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        """Remove and return the last (key, value) pair."""
+        key, value = dict.popitem(self)
+        return key, self._unshare(key, value)
+
+    def values(self):
+        """Get the values, copying them from the base if needed."""
+        for key in dict.keys(self):
+            self[key]
+        return dict.values(self)
+
+    def items(self):
+        """Get the (key, value) pairs, copying the values from the base if needed."""
+        for key in dict.keys(self):
+            self[key]
+        return dict.items(self)
+
+    def copy(self) -> 'CopyOnWriteDict':
+        """Get a shallow copy."""
+        return CopyOnWriteDict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        """Deep copy as a plain dict."""
+        result = dict()
+        memo[id(self)] = result
+        for key, value in dict.items(self):
+            result[copy.deepcopy(key, memo)] = copy.deepcopy(value, memo)
+        return result
+
+    def __reduce__(self):
+        """Pickle as a plain dict."""
+        return dict, (), None, None, iter(dict.items(self))
+
+
+class CopyOnWriteList(list):
+    """
+    List overlay over a base list. Nested values are copied from the base on first access.
+    """
+    __slots__ = ('_base', '_shared')
+
+    def __init__(self, base: list):
+        """
+        Initialize the overlay.
+
+        Args:
+            base: List to share values with. It should not be modified while the overlay is in use
+        """
+        super().__init__(base)
+        self._base = base
+        self._shared = None
+
+    def _unshare(self, value):
+        """
+        Get a private version of an item of the list.
+
+        Args:
+            value: Item stored in the overlay
+
+        Returns:
+            The item or a private copy when it is shared with the base
+        """
+        if _is_immutable(value):
+            return value
+        if self._shared is None:
+            # ids of the mutable items of the base. Items stay shared until replaced in the overlay
+            self._shared = {id(v) for v in list.__iter__(self._base) if not _is_immutable(v)}
+        return copy_on_write(value) if id(value) in self._shared else value
+
+    def __getitem__(self, index):
+        """Get self[index], copying the item from the base if needed."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        value = list.__getitem__(self, index)
+        private = self._unshare(value)
+        if private is not value:
+            list.__setitem__(self, index, private)
+        return private
+
+    def __iter__(self):
+        """Iterate over the items, copying them from the base if needed."""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self):
+        """Iterate over the items in reverse order, copying them from the base if needed."""
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def pop(self, index=-1):
+        """Remove and return the item at index."""
+        return self._unshare(list.pop(self, index))
+
+    def copy(self) -> 'CopyOnWriteList':
+        """Get a shallow copy."""
+        return CopyOnWriteList(self)
+
+    __copy__ = copy
+
+    def __add__(self, other):
+        """Concatenate as a plain list."""
+        return list(self) + other
+
+    def __mul__(self, n):
+        """Repeat as a plain list."""
+        return list(self) * n
+
+    def __deepcopy__(self, memo):
+        """Deep copy as a plain list."""
+        result = list()
+        memo[id(self)] = result
+        for value in list.__iter__(self):
+            result.append(copy.deepcopy(value, memo))
+        return result
+
+    def __reduce__(self):
+        """Pickle as a plain list."""
+        return list, (), None, list.__iter__(self)
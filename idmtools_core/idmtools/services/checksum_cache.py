@@ -0,0 +1,237 @@
+"""
+ChecksumCache provides a persistent cache of the checksums of local files.
+
+Checksums are stored by absolute path, device, inode, size and modification time of the file so a file is only hashed
+again once it has been modified or replaced. Hashing a directory of assets a second time, for example when an experiment
+script is run again, then only requires a stat of every file.
+
+The cache is configured in the [COMMON] section of idmtools.ini::
+
+    [COMMON]
+    checksum_cache_enabled = on
+    checksum_cache_directory = ~/.idmtools/cache/checksum_cache
+    checksum_workers = 8
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger, DEBUG
+from pathlib import Path
+from typing import Generator, Iterable, Optional, Union, TYPE_CHECKING
+import diskcache
+from idmtools.core.enums import TRUTHY_VALUES, IDMTOOLS_USER_HOME
+from idmtools.utils.hashing import calculate_md5, FILE_HASH_CHUNK_SIZE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from idmtools.assets import Asset
+
+logger = getLogger(__name__)
+
+_CHECKSUM_CACHE: Optional['ChecksumCache'] = None
+_CHECKSUM_CACHE_KEY = None
+_CHECKSUM_CACHE_LOCK = threading.Lock()
+
+
+class ChecksumCache:
+    """
+    Cache of the md5 checksums of local files.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike]):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory of the cache. Created if it doesn't exist.
+        """
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._cache = diskcache.Cache(self.directory)
+
+    @staticmethod
+    def key(path: str, stat: os.stat_result) -> str:
+        """
+        Build the key of a file.
+
+        Args:
+            path: Absolute path of the file
+            stat: Stat of the file
+
+        Returns:
+            Key string
+        """
+        return f"{path}:{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the checksum of a file.
+
+        Args:
+            key: Key of the file. See :meth:`key`
+
+        Returns:
+            Checksum or None when the file is not cached
+        """
+        return self._cache.get(key, retry=True)
+
+    def set(self, key: str, checksum: str):
+        """
+        Store the checksum of a file.
+
+        Args:
+            key: Key of the file. See :meth:`key`
+            checksum: Checksum of the file
+
+        Returns:
+            None
+        """
+        self._cache.set(key, checksum, retry=True)
+
+    def clear(self):
+        """
+        Remove every checksum from the cache.
+
+        Returns:
+            None
+        """
+        self._cache.clear(retry=True)
+
+    def close(self):
+        """
+        Close the cache.
+
+        Returns:
+            None
+        """
+        self._cache.close()
+
+
+def get_checksum_cache() -> Optional[ChecksumCache]:
+    """
+    Get the checksum cache of the current process.
+
+    Returns:
+        ChecksumCache or None when the checksum cache is disabled in idmtools.ini
+    """
+    global _CHECKSUM_CACHE, _CHECKSUM_CACHE_KEY
+    from idmtools import IdmConfigParser
+    if IdmConfigParser.get_option(None, "checksum_cache_enabled", fallback="on").lower() not in TRUTHY_VALUES:
+        return None
+
+    directory = IdmConfigParser.get_option(None, "checksum_cache_directory", fallback="")
+    if not directory:
+        directory = IDMTOOLS_USER_HOME.joinpath("cache", "checksum_cache")
+    directory = str(Path(directory).expanduser())
+
+    with _CHECKSUM_CACHE_LOCK:
+        # diskcache connections cannot be shared with forked processes
+        key = (os.getpid(), directory)
+        if _CHECKSUM_CACHE is None or _CHECKSUM_CACHE_KEY != key:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Opening checksum cache in {directory}")
+            try:
+                _CHECKSUM_CACHE = ChecksumCache(directory)
+            except OSError as e:
+                # a read-only home directory should not prevent hashing files
+                logger.warning(f"Could not open the checksum cache in {directory}: {e}")
+                return None
+            _CHECKSUM_CACHE_KEY = key
+    return _CHECKSUM_CACHE
+
+
+def calculate_file_checksum(path: Union[str, os.PathLike]) -> str:
+    """
+    Calculate the md5 checksum of a file, using the checksum cache when it is enabled.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        md5 as string
+    """
+    path = os.path.abspath(path)
+    cache = get_checksum_cache()
+    if cache is None:
+        return calculate_md5(path, FILE_HASH_CHUNK_SIZE)
+    stat = os.stat(path)
+    key = ChecksumCache.key(path, stat)
+    checksum = cache.get(key)
+    if checksum is None:
+        checksum = calculate_md5(path, FILE_HASH_CHUNK_SIZE)
+        # the file may have been modified while it was hashed
+        if ChecksumCache.key(path, os.stat(path)) == key:
+            cache.set(key, checksum)
+    return checksum
+
+
+def get_checksum_workers() -> int:
+    """
+    Get the number of threads used to calculate checksums of many files.
+
+    Returns:
+        Number of threads from the checksum_workers option. Defaults to the number of cpus, up to 8
+    """
+    from idmtools import IdmConfigParser
+    workers = IdmConfigParser.get_option(None, "checksum_workers", fallback="")
+    return int(workers) if workers else min(8, os.cpu_count() or 1)
+
+
+def calculate_checksums(assets: Iterable['Asset'], workers: int = None) -> None:
+    """
+    Calculate the checksums of assets that don't have one yet.
+
+    Files are hashed in a thread pool. Hashing releases the GIL so the files are read and hashed concurrently.
+
+    Args:
+        assets: Assets
+        workers: Number of threads. Defaults to :func:`get_checksum_workers`
+
+    Returns:
+        None
+    """
+    pending = [asset for asset in assets if asset.checksum is None]
+    files = [asset for asset in pending if asset.absolute_path]
+    workers = workers or get_checksum_workers()
+    if len(files) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(files)), thread_name_prefix="checksum") as pool:
+            # consume the results so errors are raised
+            for _ in pool.map(lambda asset: asset.calculate_checksum(), files):
+                pass
+    for asset in pending:
+        asset.calculate_checksum()
+
+
+def iter_with_checksums(assets: Iterable['Asset'], workers: int = None) -> Generator['Asset', None, None]:
+    """
+    Calculate the checksums of a stream of assets concurrently.
+
+    Assets are yielded in their original order once their checksum is calculated. At most twice as many assets as
+    there are threads are hashed ahead of the consumer.
+
+    Args:
+        assets: Assets
+        workers: Number of threads. Defaults to :func:`get_checksum_workers`
+
+    Returns:
+        Generator of the assets
+    """
+    workers = workers or get_checksum_workers()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="checksum") as pool:
+        pending = deque()
+        try:
+            for asset in assets:
+                pending.append((asset, pool.submit(asset.calculate_checksum)))
+                if len(pending) >= 2 * workers:
+                    asset, future = pending.popleft()
+                    future.result()
+                    yield asset
+            while pending:
+                asset, future = pending.popleft()
+                future.result()
+                yield asset
+        finally:
+            for _, future in pending:
+                future.cancel()
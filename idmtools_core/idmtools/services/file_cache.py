@@ -0,0 +1,149 @@
+"""
+FileCache provides a persistent, size bounded cache of files retrieved from platforms.
+
+File contents are stored once per content digest. Each retrieved file is referenced by the platform, the item id, the
+file path and a platform provided signature of the file (size, modification time, checksum). When the signature of a
+file changes, the cached content is no longer used. Least recently used entries are evicted once the size limit is
+reached.
+
+The cache is configured in the [COMMON] section of idmtools.ini::
+
+    [COMMON]
+    file_cache_enabled = on
+    file_cache_directory = ~/.idmtools/cache/file_cache
+    file_cache_size = 8192
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import hashlib
+import os
+import threading
+from logging import getLogger, DEBUG
+from pathlib import Path
+from typing import Optional, Union
+import diskcache
+from idmtools.core.cache_enabled import MAX_CACHE_SIZE
+from idmtools.core.enums import TRUTHY_VALUES, IDMTOOLS_USER_HOME
+
+logger = getLogger(__name__)
+
+_FILE_CACHE: Optional['FileCache'] = None
+_FILE_CACHE_KEY = None
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+class FileCache:
+    """
+    Content addressed file cache with LRU eviction.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], size_limit: int = MAX_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory of the cache. Created if it doesn't exist.
+            size_limit: Maximum size of the cache in bytes
+        """
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._cache = diskcache.Cache(self.directory, size_limit=size_limit,
+                                      eviction_policy='least-recently-used')
+
+    @staticmethod
+    def key(platform: str, item_id: str, path: str, signature: str) -> str:
+        """
+        Build the reference key of a file.
+
+        Args:
+            platform: Platform identifier
+            item_id: Id of the item the file belongs to
+            path: Path of the file
+            signature: Platform specific signature of the file, for example size and modification time
+
+        Returns:
+            Key string
+        """
+        return f"ref:{platform}:{item_id}:{path}:{signature}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get the content of a file.
+
+        Args:
+            key: Reference key of the file. See :meth:`key`
+
+        Returns:
+            File content or None when the file is not cached
+        """
+        digest = self._cache.get(key, retry=True)
+        if digest is None:
+            return None
+        # the content may have been evicted before the reference
+        return self._cache.get(f"blob:{digest}", retry=True)
+
+    def set(self, key: str, content: Union[bytes, bytearray, memoryview]):
+        """
+        Store the content of a file.
+
+        Args:
+            key: Reference key of the file. See :meth:`key`
+            content: File content
+
+        Returns:
+            None
+        """
+        content = bytes(content)
+        digest = hashlib.sha256(content).hexdigest()
+        blob_key = f"blob:{digest}"
+        if blob_key not in self._cache:
+            self._cache.set(blob_key, content, retry=True)
+        self._cache.set(key, digest, retry=True)
+
+    def clear(self):
+        """
+        Remove every file from the cache.
+
+        Returns:
+            None
+        """
+        self._cache.clear(retry=True)
+
+    def close(self):
+        """
+        Close the cache.
+
+        Returns:
+            None
+        """
+        self._cache.close()
+
+
+def get_file_cache() -> Optional[FileCache]:
+    """
+    Get the file cache of the current process.
+
+    Returns:
+        FileCache or None when the file cache is disabled in idmtools.ini
+    """
+    global _FILE_CACHE, _FILE_CACHE_KEY
+    from idmtools import IdmConfigParser
+    if IdmConfigParser.get_option(None, "file_cache_enabled", fallback="off").lower() not in TRUTHY_VALUES:
+        return None
+
+    directory = IdmConfigParser.get_option(None, "file_cache_directory", fallback="")
+    if not directory:
+        directory = IDMTOOLS_USER_HOME.joinpath("cache", "file_cache")
+    directory = str(Path(directory).expanduser())
+    size_limit = IdmConfigParser.get_option(None, "file_cache_size", fallback="")
+    size_limit = int(size_limit) * 2 ** 20 if size_limit else MAX_CACHE_SIZE
+
+    with _FILE_CACHE_LOCK:
+        # diskcache connections cannot be shared with forked processes
+        key = (os.getpid(), directory, size_limit)
+        if _FILE_CACHE is None or _FILE_CACHE_KEY != key:
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(f"Opening file cache in {directory} with a size limit of {size_limit} bytes")
+            _FILE_CACHE = FileCache(directory, size_limit=size_limit)
+            _FILE_CACHE_KEY = key
+    return _FILE_CACHE
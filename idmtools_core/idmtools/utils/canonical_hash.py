@@ -0,0 +1,524 @@
+"""
+Canonical hashing of Python objects.
+
+Objects are walked once and encoded into a stable, type-tagged byte stream which is fed directly to the hash function.
+Equal structures give the same digest across processes, platforms and Python versions.
+
+Encoding (every value starts with a one byte tag, lengths and counts are 8 bytes big endian):
+
+=================================  ===  ===========================================================================
+Type                               Tag  Payload
+=================================  ===  ===========================================================================
+None                               N
+bool                               T/F
+int                                i    length, two's complement big endian bytes
+float                              f    IEEE 754 double big endian (NaNs are normalized)
+complex                            c    real and imaginary doubles
+str                                u    length, UTF-8 bytes
+bytes, bytearray, memoryview       b    length, bytes
+Decimal                            D    encoded str of the decimal
+list (and subclasses)              l    count, items
+tuple                              t    count, items
+dict (and subclasses)              d    count, (encoded key, value) pairs ordered by encoded key
+set, frozenset                     s    count, encoded items in sorted order
+UserDict, UserList                      encoded as their data
+Enum                               E    encoded class path, encoded value
+NumPy array                        a    encoded dtype str, encoded shape, length, C-ordered data
+NumPy scalar                            encoded as the equivalent Python value
+frozen item (idmtools.frozen)      h    length, digest of the item encoding
+dataclass                          o    encoded class path, count, (encoded field name, value) in field order,
+                                        fields marked pickle_ignore are skipped
+functools.partial                  p    encoded function, args and keywords
+function, class, module            g    encoded module and qualified name
+bound method                       m    encoded function name, encoded instance
+object with __dict__ or slots      o    encoded class path, encoded attributes as a dict
+cycle back to an ancestor          R    8 bytes distance to the ancestor
+skipped (loggers, iterators, ...)  X
+anything else                      P    length, pickle protocol 4 bytes
+=================================  ===  ===========================================================================
+
+Digests of frozen items (see :class:`~idmtools.frozen.ifrozen.IFrozen`) are memoized per object identity and hash
+algorithm since they can't change.
+
+Copyright 2025, Gates Foundation. All rights reserved.
+"""
+import abc
+import decimal
+import hashlib
+import math
+import pickle
+import struct
+import sys
+import types
+import weakref
+from collections import UserDict, UserList
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import partial
+from logging import Logger
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+# flush the encoded bytes to the hash function once the buffer reaches this size
+_FLUSH_SIZE = 1 << 16
+_NAN = struct.pack('>d', float('nan'))
+# digests of frozen items by id and hash algorithm
+_FROZEN_DIGESTS: Dict[Tuple[int, str], bytes] = dict()
+
+
+def _new_hash(hash_name: str):
+    """
+    Create a hash object.
+
+    Args:
+        hash_name: Name of a hashlib algorithm or, when the xxhash package is installed, of an xxhash algorithm
+            (xxh64, xxh3_64, xxh3_128...)
+
+    Returns:
+        Hash object
+    """
+    if hash_name.startswith('xxh'):
+        if xxhash is None:
+            raise ValueError(f"The xxhash package is required for {hash_name}")
+        return getattr(xxhash, hash_name)()
+    if hash_name == 'blake2b':
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(hash_name)
+
+
+def _length(n: int) -> bytes:
+    """
+    Encode a length or count.
+
+    Args:
+        n: Length
+
+    Returns:
+        8 bytes big endian
+    """
+    return n.to_bytes(8, 'big')
+
+
+def _float(value: float) -> bytes:
+    """
+    Encode a float.
+
+    Args:
+        value: Float
+
+    Returns:
+        8 bytes big endian
+    """
+    return _NAN if math.isnan(value) else struct.pack('>d', value)
+
+
+def _first(item):
+    """
+    Get the first element of a pair, used to sort entries by key.
+
+    Args:
+        item: Pair
+
+    Returns:
+        First element
+    """
+    return item[0]
+
+
+def _class_path(cls: type) -> str:
+    """
+    Get the qualified path of a class or function.
+
+    Args:
+        cls: Class or function
+
+    Returns:
+        module.qualname
+    """
+    return f"{getattr(cls, '__module__', None)}.{getattr(cls, '__qualname__', getattr(cls, '__name__', None))}"
+
+
+class CanonicalEncoder:
+    """
+    Encoder of objects into the canonical byte stream described in :mod:`idmtools.utils.canonical_hash`.
+    """
+
+    def __init__(self, hash_obj=None, hash_name: str = 'blake2b'):
+        """
+        Initialize the encoder.
+
+        Args:
+            hash_obj: Hash object receiving the stream. The stream is kept in :attr:`buffer` when None
+            hash_name: Hash algorithm used to hash frozen items
+        """
+        self.hash_obj = hash_obj
+        self.hash_name = hash_name
+        self.buffer = bytearray()
+        # ids of the containers being encoded, to detect cycles
+        self._path: Dict[int, int] = dict()
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            type(None): self._encode_none,
+            bool: self._encode_bool,
+            int: self._encode_int,
+            float: self._encode_float,
+            str: self._encode_str,
+            bytes: self._encode_bytes,
+            list: self._encode_list,
+            tuple: self._encode_tuple,
+            dict: self._encode_dict,
+            set: self._encode_set,
+            frozenset: self._encode_set,
+        }
+
+    def write(self, data) -> None:
+        """
+        Write bytes to the stream.
+
+        Args:
+            data: Bytes
+
+        Returns:
+            None
+        """
+        if self.hash_obj is not None and len(data) >= _FLUSH_SIZE:
+            self.flush()
+            self.hash_obj.update(data)
+        else:
+            self.buffer += data
+            if self.hash_obj is not None and len(self.buffer) >= _FLUSH_SIZE:
+                self.flush()
+
+    def flush_if_full(self) -> None:
+        """
+        Feed the buffered bytes to the hash object once the buffer is large enough.
+
+        Returns:
+            None
+        """
+        if self.hash_obj is not None and len(self.buffer) >= _FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Feed the buffered bytes to the hash object.
+
+        Returns:
+            None
+        """
+        if self.hash_obj is not None and self.buffer:
+            self.hash_obj.update(self.buffer)
+            self.buffer.clear()
+
+    def to_bytes(self, obj: Any) -> bytes:
+        """
+        Encode an object into bytes, with the same settings as this encoder.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            Encoding
+        """
+        if type(obj) is str:
+            data = obj.encode('utf-8', 'surrogatepass')
+            return b'u' + _length(len(data)) + data
+        buffer, hash_obj = self.buffer, self.hash_obj
+        self.buffer, self.hash_obj = bytearray(), None
+        try:
+            self.encode(obj)
+            return bytes(self.buffer)
+        finally:
+            self.buffer, self.hash_obj = buffer, hash_obj
+
+    def encode(self, obj: Any) -> None:
+        """
+        Encode an object into the stream.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            None
+        """
+        encode = self._dispatch.get(type(obj))
+        if encode is not None:
+            encode(obj)
+            return
+        self._encode_other(obj)
+
+    # region Encoders
+    def _encode_none(self, obj):
+        self.buffer += b'N'
+
+    def _encode_bool(self, obj):
+        self.buffer += b'T' if obj else b'F'
+
+    def _encode_int(self, obj):
+        data = obj.to_bytes(obj.bit_length() // 8 + 1, 'big', signed=True)
+        self.buffer += b'i' + _length(len(data)) + data
+
+    def _encode_float(self, obj):
+        self.buffer += b'f' + _float(obj)
+
+    def _encode_str(self, obj):
+        data = obj.encode('utf-8', 'surrogatepass')
+        if len(data) < 1024:
+            self.buffer += b'u' + _length(len(data)) + data
+        else:
+            self.buffer += b'u' + _length(len(data))
+            self.write(data)
+
+    def _encode_bytes(self, obj):
+        data = memoryview(obj).cast('B')
+        self.buffer += b'b' + _length(data.nbytes)
+        self.write(data)
+
+    def _enter(self, obj) -> bool:
+        """
+        Register a container as being encoded, or write a back reference if it is already on the path.
+
+        Args:
+            obj: Container
+
+        Returns:
+            True if the container has to be encoded
+        """
+        depth = self._path.get(id(obj))
+        if depth is not None:
+            self.buffer += b'R' + _length(len(self._path) - depth)
+            return False
+        self._path[id(obj)] = len(self._path)
+        return True
+
+    def _exit(self, obj):
+        del self._path[id(obj)]
+
+    def _encode_sequence(self, tag: bytes, obj):
+        if not self._enter(obj):
+            return
+        self.buffer += tag + _length(len(obj))
+        encode = self.encode
+        for item in obj:
+            encode(item)
+        self.flush_if_full()
+        self._exit(obj)
+
+    def _encode_list(self, obj):
+        self._encode_sequence(b'l', obj)
+
+    def _encode_tuple(self, obj):
+        self._encode_sequence(b't', obj)
+
+    def _encode_dict(self, obj):
+        if not self._enter(obj):
+            return
+        # order the entries by key encoding, so unorderable keys are supported
+        to_bytes = self.to_bytes
+        entries = [(to_bytes(key), value) for key, value in dict.items(obj)]
+        entries.sort(key=_first)
+        self.buffer += b'd' + _length(len(entries))
+        for key, value in entries:
+            self.buffer += key
+            self.encode(value)
+        self.flush_if_full()
+        self._exit(obj)
+
+    def _encode_set(self, obj):
+        if not self._enter(obj):
+            return
+        items = sorted(self.to_bytes(item) for item in obj)
+        self.buffer += b's' + _length(len(items))
+        for item in items:
+            self.write(item)
+        self._exit(obj)
+
+    def _encode_attributes(self, cls, attributes: Dict[str, Any], obj):
+        if not self._enter(obj):
+            return
+        # attribute names are strings so they are sorted directly
+        self.buffer += b'o'
+        self._encode_str(_class_path(cls))
+        self.buffer += b'd' + _length(len(attributes))
+        for key in sorted(attributes):
+            self._encode_str(key)
+            self.encode(attributes[key])
+        self._exit(obj)
+
+    def _encode_other(self, obj):
+        numpy = sys.modules.get('numpy')
+        if isinstance(obj, bool):
+            self._encode_bool(obj)
+        elif isinstance(obj, Enum):
+            self.buffer += b'E'
+            self._encode_str(_class_path(type(obj)))
+            self.encode(obj.value)
+        elif getattr(obj, '_frozen', False) is True:
+            self._encode_frozen(obj)
+        elif isinstance(obj, dict):
+            self._encode_dict(obj)
+        elif isinstance(obj, list):
+            self._encode_list(obj)
+        elif isinstance(obj, tuple):
+            self._encode_tuple(obj)
+        elif isinstance(obj, (set, frozenset)):
+            self._encode_set(obj)
+        elif isinstance(obj, (UserDict, UserList)):
+            self.encode(obj.data)
+        elif isinstance(obj, str):
+            self._encode_str(obj)
+        elif isinstance(obj, int):
+            self._encode_int(obj)
+        elif isinstance(obj, float):
+            self._encode_float(obj)
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            self._encode_bytes(obj)
+        elif isinstance(obj, complex):
+            self.buffer += b'c' + _float(obj.real) + _float(obj.imag)
+        elif isinstance(obj, decimal.Decimal):
+            self.buffer += b'D'
+            self._encode_str(str(obj))
+        elif numpy is not None and isinstance(obj, numpy.ndarray):
+            self._encode_array(obj, numpy)
+        elif numpy is not None and isinstance(obj, numpy.generic):
+            self.encode(obj.item())
+        elif isinstance(obj, (abc.ABCMeta, Logger)) or _is_skipped(obj):
+            self.buffer += b'X'
+        elif isinstance(obj, partial):
+            self.buffer += b'p'
+            self.encode(obj.func)
+            self.encode(obj.args)
+            self.encode(obj.keywords)
+        elif isinstance(obj, (types.MethodType, types.BuiltinMethodType)) and \
+                not isinstance(getattr(obj, '__self__', None), types.ModuleType) and getattr(obj, '__self__', None) is not None:
+            self.buffer += b'm'
+            self._encode_str(getattr(obj, '__func__', obj).__name__)
+            self.encode(obj.__self__)
+        elif isinstance(obj, (types.FunctionType, types.BuiltinFunctionType, type, types.ModuleType)):
+            self.buffer += b'g'
+            self._encode_str(obj.__name__ if isinstance(obj, types.ModuleType) else _class_path(obj))
+        elif is_dataclass(obj):
+            self._encode_dataclass(obj)
+        elif hasattr(obj, '__dict__') or hasattr(type(obj), '__slots__'):
+            self._encode_attributes(type(obj), _get_attributes(obj), obj)
+        else:
+            data = pickle.dumps(obj, protocol=4)
+            self.buffer += b'P' + _length(len(data))
+            self.write(data)
+
+    def _encode_dataclass(self, obj):
+        if not self._enter(obj):
+            return
+        self.buffer += b'o'
+        self._encode_str(_class_path(type(obj)))
+        # like pickling, fields such as the platform object of an entity are not part of its state
+        values = [(f.name, getattr(obj, f.name)) for f in fields(obj)
+                  if hasattr(obj, f.name) and not f.metadata.get("pickle_ignore", False)]
+        self.buffer += _length(len(values))
+        for name, value in values:
+            self._encode_str(name)
+            self.encode(value)
+        self._exit(obj)
+
+    def _encode_array(self, obj, numpy):
+        self.buffer += b'a'
+        self._encode_str(obj.dtype.str)
+        self._encode_tuple(tuple(int(s) for s in obj.shape))
+        if obj.dtype.hasobject:
+            # object arrays hold references, encode their items
+            self._encode_list(obj.ravel().tolist())
+            return
+        data = numpy.ascontiguousarray(obj).reshape(-1).view(numpy.uint8)
+        self.buffer += _length(data.nbytes)
+        self.write(memoryview(data))
+
+    def _encode_frozen(self, obj):
+        key = (id(obj), self.hash_name)
+        digest = _FROZEN_DIGESTS.get(key)
+        if digest is None:
+            if id(obj) in self._path:
+                self.buffer += b'R' + _length(len(self._path) - self._path[id(obj)])
+                return
+            hash_obj = _new_hash(self.hash_name)
+            encoder = CanonicalEncoder(hash_obj, self.hash_name)
+            encoder._path = self._path
+            encoder._encode_content(obj)
+            encoder.flush()
+            digest = hash_obj.digest()
+            try:
+                weakref.finalize(obj, _FROZEN_DIGESTS.pop, key, None)
+                _FROZEN_DIGESTS[key] = digest
+            except TypeError:
+                # the lifetime of the item can't be tracked, so it isn't memoized
+                pass
+        self.buffer += b'h' + _length(len(digest)) + digest
+
+    def _encode_content(self, obj):
+        if isinstance(obj, (UserDict, UserList)):
+            self.encode(obj.data)
+        elif isinstance(obj, dict):
+            self._encode_dict(obj)
+        elif isinstance(obj, list):
+            self._encode_list(obj)
+        elif isinstance(obj, tuple):
+            self._encode_tuple(obj)
+        elif isinstance(obj, (set, frozenset)):
+            self._encode_set(obj)
+        elif is_dataclass(obj):
+            self._encode_dataclass(obj)
+        else:
+            self._encode_attributes(type(obj), _get_attributes(obj), obj)
+    # endregion
+
+
+def _is_skipped(obj) -> bool:
+    """
+    Check if an object is not part of hashes, like the iterator linking simulations to their experiment.
+
+    Args:
+        obj: Object
+
+    Returns:
+        True if the object is skipped
+    """
+    from idmtools.utils.collections import ExperimentParentIterator
+    return isinstance(obj, ExperimentParentIterator)
+
+
+def _get_attributes(obj) -> Dict[str, Any]:
+    """
+    Get the attributes of an object from its __dict__ and slots.
+
+    Args:
+        obj: Object
+
+    Returns:
+        Dict of attribute name to value
+    """
+    attributes = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if slot not in ('__dict__', '__weakref__') and hasattr(obj, slot):
+                attributes.setdefault(slot, getattr(obj, slot))
+    return attributes
+
+
+def canonical_hash(obj: Any, hash_name: str = 'blake2b') -> str:
+    """
+    Hash an object with its canonical encoding.
+
+    Args:
+        obj: Object to hash
+        hash_name: Hash algorithm. Any hashlib algorithm, or xxh64/xxh3_64/xxh3_128 when xxhash is installed
+
+    Returns:
+        Hex digest
+    """
+    hash_obj = _new_hash(hash_name)
+    encoder = CanonicalEncoder(hash_obj, hash_name)
+    encoder.encode(obj)
+    encoder.flush()
+    return hash_obj.hexdigest()
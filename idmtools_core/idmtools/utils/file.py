@@ -3,10 +3,16 @@ utilities for files.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import mmap
 import os
-from io import BytesIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
 from os import DirEntry
-from typing import Iterable, Generator, List, Union
+from typing import Iterable, Generator, List, Optional, Tuple, Union
+
+#: Number of threads scanning directories by default in :func:`walk_files`
+DEFAULT_SCAN_WORKERS = 8
 
 
 def scan_directory(basedir: str, recursive: bool = True, ignore_directories: List[str] = None) -> Iterable[DirEntry]:
@@ -26,7 +32,140 @@ def scan_directory(basedir: str, recursive: bool = True, ignore_directories: Lis
             yield entry
         elif recursive:
             if ignore_directories is None or entry.name not in ignore_directories:
-                yield from scan_directory(entry.path)
+                yield from scan_directory(entry.path, recursive, ignore_directories)
+
+
+def _matches(name: str, relative_path: str, patterns: List[str]) -> bool:
+    """
+    Check if a file or directory matches any glob pattern.
+
+    Args:
+        name: Name of the file or directory
+        relative_path: Path relative to the scanned directory, with forward slashes
+        patterns: Glob patterns. Patterns are matched against the name and the relative path
+
+    Returns:
+        True if any pattern matches
+    """
+    return any(fnmatchcase(name, p) or fnmatchcase(relative_path, p) for p in patterns)
+
+
+def _scan_one_directory(path: str, relative_path: str, depth: int, recursive: bool, ignore_directories: Optional[List[str]],
+                        include: Optional[List[str]], exclude: Optional[List[str]],
+                        max_depth: Optional[int]) -> Tuple[List[DirEntry], List[Tuple[str, str, int]]]:
+    """
+    Scan a single directory for :func:`walk_files`.
+
+    Returns:
+        Files matching the patterns and subdirectories to scan as (path, relative path, depth)
+    """
+    files, directories = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            entry_relative_path = f"{relative_path}/{entry.name}" if relative_path else entry.name
+            # patterns are checked first, is_file/is_dir only need a stat for symlinks or on some filesystems
+            if exclude and _matches(entry.name, entry_relative_path, exclude):
+                continue
+            if entry.is_file():
+                if not include or _matches(entry.name, entry_relative_path, include):
+                    files.append(entry)
+            elif recursive and entry.is_dir() and (max_depth is None or depth < max_depth):
+                if ignore_directories is None or entry.name not in ignore_directories:
+                    directories.append((entry.path, entry_relative_path, depth + 1))
+    return files, directories
+
+
+def walk_files(basedir: Union[str, os.PathLike], recursive: bool = True, ignore_directories: List[str] = None,
+               include: List[str] = None, exclude: List[str] = None, max_depth: int = None,
+               workers: int = DEFAULT_SCAN_WORKERS) -> Generator[DirEntry, None, None]:
+    """
+    Scan a directory with a pool of threads, yielding the files as directories are scanned.
+
+    Subdirectories are scanned concurrently, which hides the latency of network filesystems. Files are yielded
+    directory by directory, in the order the directories were found, so the output is the same across runs.
+
+    Args:
+        basedir: The root directory to start from.
+        recursive: True to search the sub-folders recursively; False to stay in the root directory.
+        ignore_directories: Names of directories to skip
+        include: Glob patterns of the files to yield, matched against the file name and the path relative to basedir
+            with forward slashes. All files are yielded when empty
+        exclude: Glob patterns of the files and directories to skip, matched like include
+        max_depth: Maximum depth of directories scanned. Files of basedir have a depth of 0
+        workers: Number of threads scanning directories. Directories are scanned in the calling thread when 1 or less
+
+    Returns:
+        An iterator yielding all the files found.
+    """
+    options = (recursive, ignore_directories, include, exclude, max_depth)
+    if workers is None or workers <= 1:
+        pending = deque([(os.fspath(basedir), "", 0)])
+        while pending:
+            files, directories = _scan_one_directory(*pending.popleft(), *options)
+            pending.extend(directories)
+            yield from files
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+        pending = deque([pool.submit(_scan_one_directory, os.fspath(basedir), "", 0, *options)])
+        try:
+            while pending:
+                files, directories = pending.popleft().result()
+                # queue the subdirectories before handing the files over so scanning goes on meanwhile
+                pending.extend(pool.submit(_scan_one_directory, *directory, *options) for directory in directories)
+                yield from files
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def map_file(path: Union[str, os.PathLike]) -> memoryview:
+    """
+    Map a file in memory.
+
+    The content is read by the operating system as it is accessed and is never copied into the Python heap. The file is
+    unmapped once the view, and every view or array built on it, has been released.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Read-only view of the content of the file
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def read_file(path: Union[str, os.PathLike]) -> bytearray:
+    """
+    Read a whole file into a buffer allocated once, without intermediate copies.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Content of the file
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        content = bytearray(size)
+        read = 0
+        with memoryview(content) as view:
+            while read < size:
+                n = f.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+        if read < size:
+            # the file was truncated while it was read
+            del content[read:]
+        else:
+            # the file may have grown since its size was read
+            content += f.read()
+        return content
 
 
 def file_content_to_generator(absolute_path, chunk_size=128) -> Generator[bytearray, None, None]:
@@ -49,7 +188,7 @@ def file_content_to_generator(absolute_path, chunk_size=128) -> Generator[bytear
                 yield res
 
 
-def content_generator(content: Union[str, bytes], chunk_size=128) -> Generator[bytearray, None, None]:
+def content_generator(content: Union[str, bytes, bytearray, memoryview], chunk_size=128) -> Generator[memoryview, None, None]:
     """
     Create a generator from file contents in chunks(useful for streaming binary data and piping).
 
@@ -61,12 +200,12 @@ def content_generator(content: Union[str, bytes], chunk_size=128) -> Generator[b
         Generator that return bytes in chunks of size chunk_size
     """
     if isinstance(content, str):
-        content_io = BytesIO(content.encode())
-    else:
-        content_io = BytesIO(content)
-    while True:
-        chunk = content_io.read(chunk_size)
-        if chunk == b'':
-            break
-        else:
-            yield chunk
+        content = content.encode()
+    # chunks are views of the content, it is not copied
+    view = memoryview(content).cast('B')
+    if chunk_size == 0 or len(view) == 0:
+        return
+    if chunk_size < 0:
+        chunk_size = len(view)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
@@ -1,48 +1,101 @@
 """
 File parser utility. Used to automatically load data.
 
+The parser backend of each file type can be selected in the [COMMON] section of idmtools.ini::
+
+    [COMMON]
+    json_parser = orjson
+    csv_parser = pyarrow
+    raw_parser = memoryview
+    bin_parser = view
+
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import codecs
 import json
 import os
 from logging import getLogger
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Union
 
 import pandas as pd
 
 from io import StringIO, BytesIO
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow = pyarrow_csv = None
+
 logger = getLogger(__name__)
 
+# Backends available for each kind of file. The first available one is the default
+PARSER_BACKENDS = {
+    'json': ['orjson', 'json'],
+    'csv': ['pandas', 'pyarrow'],
+    'raw': ['bytesio', 'memoryview'],
+    'bin': ['dict', 'view']
+}
+# Path of a value in a json document. Either a "/" separated string or a sequence of keys
+JSON_PATH = Union[str, Sequence[Union[str, int]]]
+
 
 class FileParser:
     """
     FileParser to load contents in analysis.
     """
 
+    @staticmethod
+    def get_backend(kind: str) -> str:
+        """
+        Get the parser backend of a kind of file.
+
+        Args:
+            kind: Kind of file. One of json, csv, raw or bin
+
+        Returns:
+            Name of the backend configured as <kind>_parser in idmtools.ini, or the default backend of the kind. The
+            default is used when the configured backend is unknown or its package is not installed.
+        """
+        from idmtools import IdmConfigParser
+        available = [b for b in PARSER_BACKENDS[kind]
+                     if (b != 'orjson' or orjson is not None) and (b != 'pyarrow' or pyarrow_csv is not None)]
+        backend = IdmConfigParser.get_option(None, f"{kind}_parser", fallback=available[0]).lower()
+        if backend not in available:
+            logger.warning(f"{kind} parser '{backend}' is not available, using '{available[0]}'")
+            backend = available[0]
+        return backend
+
     @classmethod
-    def parse(cls, filename, content=None):
+    def parse(cls, filename, content=None, columns: Optional[List[str]] = None,
+              json_paths: Optional[List[JSON_PATH]] = None):
         """
         Parse filename and load the content.
 
         Args:
             filename: Filename to load
             content: Content to load
+            columns: Columns to load from csv files. All columns are loaded when None
+            json_paths: Paths of the values to load from json files. The whole document is loaded when None
 
         Returns:
             Content loaded
         """
         file_extension = os.path.splitext(filename)[1][1:].lower()
-        content = BytesIO(content)
 
         if file_extension == 'json':
-            return cls.load_json_file(filename, content)
+            return cls.load_json_file(filename, content, json_paths=json_paths)
 
         if file_extension == 'csv':
-            return cls.load_csv_file(filename, content)
+            return cls.load_csv_file(filename, content, columns=columns)
 
         if file_extension == 'xlsx':
-            return cls.load_xlsx_file(filename, content)
+            return cls.load_xlsx_file(filename, BytesIO(content))
 
         if file_extension == 'txt':
             return cls.load_txt_file(filename, content)
@@ -53,18 +106,67 @@ class FileParser:
         return cls.load_raw_file(filename, content)
 
     @classmethod
-    def load_json_file(cls, filename, content) -> Dict:
+    def load_json_file(cls, filename, content, json_paths: Optional[List[JSON_PATH]] = None) -> Dict:
         """
         Load JSON File.
 
         Args:
             filename: Filename to load
             content: Content
+            json_paths: Paths of the values to keep, for example "Channels/Infected/Data". Keep everything when None
 
         Returns:
             JSOn as dict
         """
-        return json.load(content)
+        if isinstance(content, (StringIO, BytesIO)):
+            content = content.getvalue()
+        data = None
+        if cls.get_backend('json') == 'orjson':
+            try:
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # orjson is strict, for example it rejects NaN. Let the standard parser try
+                logger.debug(f"orjson could not parse {filename}, using json")
+        if data is None:
+            # the standard parser does not accept buffers such as memoryview
+            data = json.loads(content if isinstance(content, (str, bytes, bytearray)) else bytes(content))
+        if json_paths is not None:
+            data = cls.select_json_paths(filename, data, json_paths)
+        return data
+
+    @staticmethod
+    def select_json_paths(filename, data, json_paths: List[JSON_PATH]) -> Dict:
+        """
+        Keep only some values of a json document.
+
+        Args:
+            filename: Filename the document was loaded from
+            data: Loaded document
+            json_paths: Paths of the values to keep
+
+        Returns:
+            Document with the same structure as data containing only the selected values
+
+        Raises:
+            KeyError - If a path is not in the document
+        """
+        selected = dict()
+        for path in json_paths:
+            keys = [k for k in path.split("/") if k] if isinstance(path, str) else list(path)
+            if not keys:
+                return data
+            src, dst = data, selected
+            try:
+                for i, key in enumerate(keys):
+                    if isinstance(src, list):
+                        key = int(key)
+                    src = src[key]
+                    if i < len(keys) - 1:
+                        dst = dst.setdefault(key, dict())
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise KeyError(f"Path {path} is not in {filename}")
+            dst[key] = src
+        return selected
 
     @classmethod
     def load_raw_file(self, filename, content):
@@ -76,28 +178,66 @@ class FileParser:
             content: Content to load
 
         Returns:
-            Content as it was
+            Content as a BytesIO, or a memoryview when the raw parser is memoryview
         """
-        return content
+        if isinstance(content, (StringIO, BytesIO)):
+            return content
+        if self.get_backend('raw') == 'memoryview':
+            return memoryview(content)
+        return BytesIO(content)
 
     @classmethod
-    def load_csv_file(cls, filename, content) -> pd.DataFrame:
+    def load_csv_file(cls, filename, content, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load csv file.
 
         Args:
             filename: Filename to load
             content: Content is loading
+            columns: Columns to load. Load all columns when None
 
         Returns:
             Loaded csv file
         """
-        if not isinstance(content, StringIO) and not isinstance(content, BytesIO):
+        if isinstance(content, (bytes, bytearray, memoryview)) and cls.get_backend('csv') == 'pyarrow':
+            return cls._load_csv_file_with_pyarrow(content, columns)
+
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            content = BytesIO(content)
+        elif not isinstance(content, StringIO) and not isinstance(content, BytesIO):
             content = StringIO(content)
 
-        csv_read = pd.read_csv(content, skipinitialspace=True)
+        csv_read = pd.read_csv(content, skipinitialspace=True, usecols=columns)
         return csv_read
 
+    @staticmethod
+    def _load_csv_file_with_pyarrow(content, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load csv file with the multithreaded pyarrow reader.
+
+        Unlike the pandas reader, leading spaces are only removed from the header.
+
+        Args:
+            content: Content to load
+            columns: Columns to load. Load all columns when None
+
+        Returns:
+            Loaded csv file
+        """
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        end = content.find(b"\n")
+        header = bytes(content[:end if end >= 0 else None]).decode().rstrip("\r")
+        names = {name: name.lstrip() for name in header.split(",")}
+        reader = pyarrow.BufferReader(pyarrow.py_buffer(content))
+        convert_options = None
+        if columns is not None:
+            wanted = set(columns)
+            convert_options = pyarrow_csv.ConvertOptions(
+                include_columns=[name for name, stripped in names.items() if stripped in wanted])
+        table = pyarrow_csv.read_csv(reader, convert_options=convert_options)
+        return table.to_pandas().rename(columns=names)
+
     @classmethod
     def load_xlsx_file(cls, filename, content) -> Dict[str, pd.ExcelFile]:
         """
@@ -125,7 +265,12 @@ class FileParser:
         Returns:
             Content
         """
-        return str(content.getvalue().decode())
+        if isinstance(content, (StringIO, BytesIO)):
+            content = content.getvalue()
+        if isinstance(content, str):
+            return content
+        # decoding a buffer does not copy it first
+        return codecs.decode(content, 'utf-8')
 
     @classmethod
     def load_bin_file(cls, filename, content):
@@ -137,14 +282,19 @@ class FileParser:
             content: Content to load
 
         Returns:
-            Loaded bin file
+            Loaded bin file as a dict, or the SpatialOutput itself when the bin parser is view. Its nodeids and data are
+            then read-only views of the content, see :meth:`SpatialOutput.from_bytes`
 
         Notes:
             We should move this to a plugin in emodpy. We need to figure out how to structure that.
         """
         try:
             from idmtools_platform_comps.utils.spatial_output import SpatialOutput
-            so = SpatialOutput.from_bytes(content.read(), 'Filtered' in filename)
+            if isinstance(content, (StringIO, BytesIO)):
+                content = content.getvalue()
+            if cls.get_backend('bin') == 'view':
+                return SpatialOutput.from_bytes(content, 'Filtered' in filename, view=True)
+            so = SpatialOutput.from_bytes(content, 'Filtered' in filename)
             return so.to_dict()
         except ImportError as ex:
             logger.exception(ex)
@@ -12,9 +12,12 @@ import pickle
 import types
 from dataclasses import fields, MISSING
 from logging import getLogger, Logger
+from idmtools.utils.canonical_hash import canonical_hash
 
 logger = getLogger(__name__)
 Pickler = pickle._Pickler
+#: Size of the chunks read when hashing files
+FILE_HASH_CHUNK_SIZE = 1 << 20
 
 
 class _ConsistentSet(object):
@@ -155,12 +158,15 @@ def hash_obj(obj, hash_name='md5'):
     """
     Quick calculation of a hash to identify uniquely Python objects.
 
+    The object is hashed with its canonical encoding, see :mod:`idmtools.utils.canonical_hash`. Use :class:`Hasher`
+    to get the pickle based digests of previous versions.
+
     Args:
         obj: Object to hash
-        hash_name: The hashing algorithm to use. 'md5' is faster; 'sha1' is considered safer.
+        hash_name: The hashing algorithm to use. 'md5' is faster; 'sha1' is considered safer. 'blake2b' and, when
+            xxhash is installed, 'xxh3_64' are faster than both
     """
-    hasher = Hasher(hash_name=hash_name)
-    return hasher.hash(obj)
+    return canonical_hash(obj, hash_name=hash_name)
 
 
 def ignore_fields_in_dataclass_on_pickle(item):
@@ -197,7 +203,7 @@ def ignore_fields_in_dataclass_on_pickle(item):
     return state
 
 
-def calculate_md5(filename: str, chunk_size: int = 8192) -> str:
+def calculate_md5(filename: str, chunk_size: int = FILE_HASH_CHUNK_SIZE) -> str:
     """
     Calculate MD5.
 
@@ -208,8 +214,16 @@ def calculate_md5(filename: str, chunk_size: int = 8192) -> str:
     Returns:
         md5 as string
     """
-    with open(filename, "rb") as f:
-        return calculate_md5_stream(f, chunk_size)
+    file_hash = hashlib.md5()
+    # read every chunk into the same buffer instead of allocating one per chunk
+    buffer = bytearray(chunk_size)
+    with open(filename, "rb", buffering=0) as f, memoryview(buffer) as view:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            file_hash.update(view[:n])
+    return file_hash.hexdigest()
 
 
 def calculate_md5_stream(stream: Union[io.BytesIO, BinaryIO], chunk_size: int = 8192, hash_type: str = 'md5', file_hash=None):
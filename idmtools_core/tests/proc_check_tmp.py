@@ -0,0 +1,29 @@
+import copy
+from idmtools.analysis.analyze_manager import AnalyzeManager
+from idmtools.core.enums import EntityStatus, ItemType
+from idmtools.core.platform_factory import Platform
+from idmtools.entities.experiment import Experiment
+from idmtools.entities.ianalyzer import IAnalyzer
+from idmtools.entities.simulation import Simulation
+from idmtools_test.utils.test_task import TestTask
+
+class CountAnalyzer(IAnalyzer):
+    def __init__(self):
+        super().__init__(parse=False)
+    def map(self, data, item):
+        return 1
+    def reduce(self, all_data):
+        return sum(all_data.values())
+
+if __name__ == "__main__":
+    platform = Platform('Test')
+    exp = Experiment()
+    for i in range(50):
+        exp.simulations.append(Simulation(task=TestTask()))
+    exp.run()
+    platform._simulations.set_simulation_status(exp.uid, EntityStatus.SUCCEEDED)
+    a = CountAnalyzer()
+    am = AnalyzeManager(platform, ids=[(exp.uid, ItemType.EXPERIMENT)], analyzers=[a], max_workers=2, max_download_workers=4)
+    print(am._get_chunk_size(50))
+    am.analyze()
+    print(a.results)
@@ -1,7 +1,11 @@
 import copy
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 import allure
 import unittest
+from unittest import mock
 from typing import Any
 import pytest
 from idmtools.analysis.analyze_manager import AnalyzeManager
@@ -35,6 +39,28 @@ class TestAnalyzeManager(unittest.TestCase):
         def reduce(self, all_data: dict) -> 'Any':
             pass
 
+    class CountAnalyzer(IAnalyzer):
+        def __init__(self):
+            super().__init__(parse=False)
+
+        def map(self, data: 'Any', item: 'IItem') -> 'Any':
+            return 1
+
+        def reduce(self, all_data: dict) -> 'Any':
+            return sum(all_data.values())
+
+    class IncrementalCountAnalyzer(CountAnalyzer):
+        supports_incremental = True
+
+        def reduce(self, all_data: dict) -> 'Any':
+            raise AssertionError("reduce should not be called for incremental analyzers")
+
+        def combine(self, partial: 'Any', item: 'IItem', mapped: 'Any') -> 'Any':
+            return (partial or 0) + mapped
+
+        def finalize(self, partial: 'Any') -> 'Any':
+            return {'count': partial}
+
     def setUp(self) -> None:
         self.platform = Platform('Test')
         self.platform.cleanup()
@@ -198,3 +224,185 @@ class TestAnalyzeManager(unittest.TestCase):
             actual = [analyzer.working_dir for analyzer in am.analyzers]
             self.assertEqual(actual, expected[force_wd])
 
+
+    def test_incremental_reduce(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(7):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        incremental = self.IncrementalCountAnalyzer()
+        regular = self.CountAnalyzer()
+        self.assertTrue(incremental.is_incremental)
+        self.assertFalse(regular.is_incremental)
+
+        # a combine helper of its own doesn't make an analyzer incremental
+        class CombineHelperAnalyzer(self.CountAnalyzer):
+            def combine(self, all_data):
+                return all_data
+
+        self.assertFalse(CombineHelperAnalyzer().is_incremental)
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[incremental, regular],
+                            executor_type='thread', max_workers=2, max_in_flight=3)
+        self.assertTrue(am.analyze())
+        self.assertEqual(incremental.results, {'count': 7})
+        self.assertEqual(regular.results, 7)
+
+    def test_incremental_without_combine(self):
+        class NoCombineAnalyzer(self.CountAnalyzer):
+            supports_incremental = True
+
+        with self.assertRaisesRegex(ValueError, 'NoCombineAnalyzer'):
+            AnalyzeManager(self.platform, analyzers=[NoCombineAnalyzer()])
+        am = AnalyzeManager(self.platform, analyzers=[self.IncrementalCountAnalyzer()])
+        with self.assertRaisesRegex(ValueError, 'NoCombineAnalyzer'):
+            am.add_analyzer(NoCombineAnalyzer())
+        self.assertEqual(len(am.analyzers), 1)
+
+    def test_max_in_flight_validation(self):
+        with self.assertRaises(ValueError):
+            AnalyzeManager(self.platform, max_in_flight=0)
+
+    def test_map_cache_reduce_only(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(5):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            analyzer = self.CountAnalyzer()
+            am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                executor_type='thread', max_workers=2, map_cache_directory=cache_dir)
+            self.assertTrue(am.analyze())
+            self.assertEqual(analyzer.results, 5)
+
+            # reduce again from the cached map results only
+            analyzer = self.CountAnalyzer()
+            am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                executor_type='thread', max_workers=2, map_cache_directory=cache_dir,
+                                reduce_only=True)
+            with mock.patch('idmtools.analysis.analyze_manager.map_items') as map_items:
+                self.assertTrue(am.analyze())
+            map_items.assert_not_called()
+            self.assertEqual(analyzer.results, 5)
+
+            # a different analyzer has nothing cached, so every item is skipped
+            analyzer = self.IncrementalCountAnalyzer()
+            am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                executor_type='thread', max_workers=2, map_cache_directory=cache_dir,
+                                reduce_only=True)
+            self.assertTrue(am.analyze())
+            self.assertEqual(analyzer.results, {'count': None})
+
+    def test_map_cache_analyzer_arguments(self):
+        class ChannelAnalyzer(IAnalyzer):
+            def __init__(self, channel):
+                super().__init__(parse=False)
+                self.channel = channel
+
+            def map(self, data: 'Any', item: 'IItem') -> 'Any':
+                return self.channel
+
+            def reduce(self, all_data: dict) -> 'Any':
+                return set(all_data.values())
+
+        test_exp = Experiment()
+        for i in range(3):
+            test_exp.simulations.append(Simulation(task=TestTask()))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for channel, reduce_only, expected in [("Infected", False, {"Infected"}), ("Deaths", False, {"Deaths"}),
+                                                   ("Infected", True, {"Infected"})]:
+                analyzer = ChannelAnalyzer(channel)
+                am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                    executor_type='thread', max_workers=2, map_cache_directory=cache_dir,
+                                    reduce_only=reduce_only)
+                self.assertTrue(am.analyze())
+                self.assertEqual(analyzer.results, expected)
+
+    def test_reduce_only_requires_cache_directory(self):
+        with self.assertRaises(ValueError):
+            AnalyzeManager(self.platform, reduce_only=True)
+
+    def test_chunked_mapping(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(10):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        incremental = self.IncrementalCountAnalyzer()
+        regular = self.CountAnalyzer()
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[incremental, regular],
+                            executor_type='thread', max_workers=2, max_in_flight=2, chunk_size=3)
+        self.assertEqual(am._get_chunk_size(10), 3)
+        self.assertTrue(am.analyze())
+        self.assertEqual(incremental.results, {'count': 10})
+        self.assertEqual(regular.results, 10)
+
+    def test_chunk_size(self):
+        am = AnalyzeManager(self.platform, max_workers=2)
+        self.assertEqual(am._get_chunk_size(1000), AnalyzeManager.MAX_AUTO_CHUNK_SIZE)
+        self.assertEqual(am._get_chunk_size(40), 5)
+        self.assertEqual(am._get_chunk_size(3), 1)
+        am = AnalyzeManager(self.platform, max_workers=2, executor_type='thread')
+        self.assertEqual(am._get_chunk_size(1000), 1)
+        for chunk_size in (0, 'big'):
+            with self.assertRaises(ValueError):
+                AnalyzeManager(self.platform, chunk_size=chunk_size)
+
+    def test_download_pipeline(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(9):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        incremental = self.IncrementalCountAnalyzer()
+        regular = self.CountAnalyzer()
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[incremental, regular],
+                            executor_type='thread', max_workers=2, max_in_flight=2, chunk_size=2,
+                            max_download_workers=3)
+        with mock.patch('idmtools.analysis.analyze_manager.map_items') as map_items:
+            self.assertTrue(am.analyze())
+        map_items.assert_not_called()
+        self.assertEqual(incremental.results, {'count': 9})
+        self.assertEqual(regular.results, 9)
+        with self.assertRaises(ValueError):
+            AnalyzeManager(self.platform, max_download_workers=0)
+
+    def test_download_pipeline_processes(self):
+        test_exp = Experiment()
+        base_sim = Simulation(task=TestTask())
+        for i in range(6):
+            test_exp.simulations.append(copy.deepcopy(base_sim))
+        test_exp.run()
+        self.platform._simulations.set_simulation_status(test_exp.uid, EntityStatus.SUCCEEDED)
+        self.platform.refresh_status(test_exp)
+
+        incremental = self.IncrementalCountAnalyzer()
+        regular = self.CountAnalyzer()
+        am = AnalyzeManager(self.platform, ids=[(test_exp.uid, ItemType.EXPERIMENT)], analyzers=[incremental, regular],
+                            executor_type='process', max_workers=2, max_in_flight=2, chunk_size=2,
+                            max_download_workers=2)
+        with mock.patch.object(ProcessPoolExecutor, 'submit', autospec=True,
+                               side_effect=ProcessPoolExecutor.submit) as submit:
+            self.assertTrue(am.analyze())
+        # the worker processes are started before the download threads
+        self.assertEqual([c.args[1] for c in submit.call_args_list[:2]], [os.getpid, os.getpid])
+        self.assertNotIn(os.getpid, [c.args[1] for c in submit.call_args_list[2:]])
+        self.assertEqual(incremental.results, {'count': 6})
+        self.assertEqual(regular.results, 6)
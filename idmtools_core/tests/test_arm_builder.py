@@ -76,6 +76,27 @@ class TestArmBuilder(ITestWithPersistence):
         arm.add_sweep_definition(setB, [1, 2, 3])
         self.builder.add_arm(arm)
 
+    def test_random_access(self):
+        self.create_simple_arm()
+        arm = SweepArm(type=ArmType.pair)
+        arm.add_sweep_definition(setC, [10, 20, 30])
+        arm.add_sweep_definition(setD, [40, 50, 60])
+        self.builder.add_arm(arm)
+
+        def apply(functions):
+            simulation = Simulation(task=TestTask())
+            for func in functions:
+                func(simulation=simulation)
+            return simulation.task.parameters
+
+        expected = [apply(functions) for functions in self.builder]
+        self.assertEqual(len(expected), 18)
+        self.assertEqual([apply(self.builder[i]) for i in range(18)], expected)
+        self.assertEqual(apply(self.builder[16]), {"c": 20, "d": 50})
+        self.assertEqual([apply(f) for f in self.builder[-4:]], expected[-4:])
+        with self.assertRaises(IndexError):
+            self.builder[18]
+
     def test_reverse_order(self):
         self.create_simple_arm()
 
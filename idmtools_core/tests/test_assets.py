@@ -2,8 +2,10 @@ from pathlib import PurePath
 from unittest.mock import patch, mock_open
 
 import allure
+import hashlib
 import json
 import os
+import tempfile
 import unittest
 from functools import partial
 import pytest
@@ -11,7 +13,7 @@ from tqdm import tqdm
 from idmtools.assets import Asset, AssetCollection
 from idmtools.assets.errors import DuplicatedAssetError
 from idmtools.core import FilterMode
-from idmtools.utils.file import content_generator, file_content_to_generator
+from idmtools.utils.file import content_generator, file_content_to_generator, map_file, read_file
 from idmtools.utils.filters.asset_filters import asset_in_directory, file_name_is
 from idmtools_test import COMMON_INPUT_PATH
 from idmtools_test.utils.decorators import run_in_temp_dir
@@ -331,6 +333,113 @@ class TestAssets(unittest.TestCase):
             assets2.add_asset(Asset(content=f"{i}", filename=f"{i}"))
         assets1.add_assets(assets2)
 
+    def test_asset_collection_lookups(self):
+        ac = AssetCollection()
+        for i in range(1000):
+            ac.add_asset(Asset(content=f"{i}", filename=f"{i}.txt", relative_path=f"dir{i % 10}"))
+        self.assertEqual(1000, len(ac))
+
+        # windows separators share the remote path of forward slashes
+        ac.add_asset(Asset(content="a", filename="a.txt", relative_path="a\\b"))
+        with self.assertRaises(DuplicatedAssetError):
+            ac.add_asset(Asset(content="a", filename="a.txt", relative_path="a/b"))
+        self.assertTrue(ac.has_asset(filename="a.txt", relative_path="a/b"))
+        self.assertEqual("a", ac.get_asset("a/b", "a.txt").content)
+        self.assertIsNone(ac.get_asset("a/b", "missing.txt"))
+
+        self.assertEqual("5", ac.get_one(filename="5.txt", relative_path="dir5").content)
+        self.assertIsNone(ac.get_one(filename="5.txt", relative_path="dir6"))
+        self.assertEqual(5, ac.find_index_of_asset(Asset(filename="5.txt", relative_path="dir5", content="")))
+
+        # replacing keeps the position, re-adding moves the asset at the end
+        ac.add_or_replace_asset(Asset(content="new", filename="0.txt", relative_path="dir0"))
+        self.assertEqual("new", ac.assets[0].content)
+        ac.add_asset(Asset(content="newer", filename="0.txt", relative_path="dir0"), fail_on_duplicate=False)
+        self.assertEqual("newer", ac.assets[-1].content)
+        self.assertEqual(1001, len(ac))
+
+        ac.remove(filename="1.txt", relative_path="dir1")
+        self.assertFalse(ac.has_asset(filename="1.txt", relative_path="dir1"))
+        self.assertEqual("a", ac.pop(filename="a.txt", relative_path="a\\b").content)
+        self.assertEqual(999, len(ac))
+
+    def test_asset_collection_list_changes(self):
+        ac = AssetCollection([Asset(content="1", filename="1.txt")])
+        ac.assets.append(Asset(content="2", filename="2.txt"))
+        self.assertTrue(ac.has_asset(filename="2.txt"))
+        self.assertEqual(2, ac.count)
+        del ac.assets[0]
+        self.assertFalse(ac.has_asset(filename="1.txt"))
+        self.assertEqual(["2.txt"], [a.filename for a in ac])
+
+        ac.assets = [Asset(content="3", filename="3.txt"), Asset(content="4", filename="4.txt")]
+        self.assertEqual(["3.txt", "4.txt"], [a.filename for a in ac.assets])
+
+    def test_asset_collection_list_appends(self):
+        ac = AssetCollection()
+        assets = ac.assets
+        ac.find_by_checksum("index")
+        with patch.object(AssetCollection, '_set_assets', wraps=ac._set_assets) as set_assets:
+            for i in range(1000):
+                ac.assets.append(Asset(content=str(i), filename=f"{i}.txt"))
+            ac.assets.extend([Asset(content="a", filename="a.txt"), Asset(content="b", filename="b.txt")])
+            ac.assets.insert(len(ac.assets), Asset(content="c", filename="c.txt"))
+            ac.assets[0] = Asset(content="new", filename="0.txt")
+            # appends don't rebuild the collection
+            set_assets.assert_not_called()
+        self.assertIs(assets, ac.assets)
+        self.assertEqual(1003, len(ac))
+        self.assertEqual("new", ac.get_one(filename="0.txt").content)
+        self.assertEqual(["a.txt"], [a.filename for a in ac.find_by_checksum(ac.get_one(filename="a.txt").checksum)])
+        self.assertEqual([], ac.find_by_checksum(Asset(content="0", filename="x.txt").calculate_checksum()))
+
+        # an asset with a key already in the collection replaces it, as when the list is assigned
+        ac.assets.append(Asset(content="replaced", filename="1.txt"))
+        self.assertEqual(1003, len(ac))
+        self.assertEqual("replaced", ac.get_one(filename="1.txt").content)
+        ac.assets.insert(0, Asset(content="first", filename="first.txt"))
+        self.assertEqual("first.txt", ac.assets[0].filename)
+
+    def test_asset_collection_find_by_checksum(self):
+        a = Asset(content="same", filename="a.txt")
+        b = Asset(content="same", filename="b.txt")
+        c = Asset(content="other", filename="c.txt")
+        ac = AssetCollection([a, b, c])
+        self.assertEqual([a, b], ac.find_by_checksum(a.calculate_checksum()))
+        d = Asset(content="other", filename="d.txt")
+        ac.add_asset(d)
+        ac.remove(asset=c)
+        self.assertEqual([d], ac.find_by_checksum(c.calculate_checksum()))
+        self.assertEqual([], ac.find_by_checksum("missing"))
+
+    def test_asset_collection_add_shares_assets(self):
+        a = Asset(content="1", filename="1.txt")
+        ac = AssetCollection() + AssetCollection([a])
+        self.assertIs(a, ac.assets[0])
+
+    def test_checksum_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as data_dir, \
+                patch.dict(os.environ, {"IDMTOOLS_CHECKSUM_CACHE_ENABLED": "on",
+                                        "IDMTOOLS_CHECKSUM_CACHE_DIRECTORY": cache_dir}):
+            paths = []
+            for i in range(10):
+                paths.append(os.path.join(data_dir, f"{i}.txt"))
+                with open(paths[-1], "w") as f:
+                    f.write(f"content {i}")
+            ac = AssetCollection(paths)
+            ac.calculate_checksums(workers=4)
+            self.assertEqual([hashlib.md5(f"content {i}".encode()).hexdigest() for i in range(10)], [a.checksum for a in ac])
+
+            # new assets for the same files reuse the cached checksums
+            with patch("idmtools.services.checksum_cache.calculate_md5") as calculate_md5:
+                self.assertEqual(ac.assets[0].checksum, Asset(absolute_path=paths[0]).calculate_checksum())
+                calculate_md5.assert_not_called()
+
+            # modified files are hashed again
+            with open(paths[0], "w") as f:
+                f.write("modified content")
+            self.assertEqual(hashlib.md5(b"modified content").hexdigest(), Asset(absolute_path=paths[0]).calculate_checksum())
+
     @run_in_temp_dir
     def test_ignore_git(self):
         # make test data
@@ -353,6 +462,28 @@ class TestAssets(unittest.TestCase):
         ac.add_directory(bd, no_ignore=True)
         self.assertEqual(len(ac), 2)
 
+    def test_assets_from_directory_patterns(self):
+        def paths(assets):
+            return [(a.relative_path, a.filename) for a in assets]
+
+        serial = AssetCollection.assets_from_directory(self.base_path, workers=1)
+        self.assertEqual(paths(serial), paths(AssetCollection.assets_from_directory(self.base_path, workers=4)))
+        self.assertEqual(4, len(serial))
+
+        self.assertSetEqual({("1", "a.txt"), ("2", "c.txt")},
+                            set(paths(AssetCollection.assets_from_directory(self.base_path, include=["a.txt", "2/*"]))))
+        self.assertSetEqual({("", "d.txt"), ("2", "c.txt")},
+                            set(paths(AssetCollection.assets_from_directory(self.base_path, exclude=["1"]))))
+
+        assets = AssetCollection.iter_assets_from_directory(self.base_path, include=["*.txt"], checksums=True)
+        self.assertNotIsInstance(assets, list)
+        for asset in assets:
+            self.assertIsNotNone(asset.checksum)
+
+        ac = AssetCollection.from_directory(self.base_path, exclude=["d.txt"], relative_path="inputs")
+        self.assertSetEqual({("inputs/1", "a.txt"), ("inputs/1", "b.txt"), ("inputs/2", "c.txt")},
+                            set((a.relative_path.replace("\\", "/"), a.filename) for a in ac))
+
     # downloads an asset with absolute path and saves it to destination file
     def test_download_asset_with_absolute_path(self):
         # Initialize the asset object with an absolute path
@@ -519,6 +650,33 @@ class TestAssets(unittest.TestCase):
         chunks = list(generator)
         self.assertEqual(len(chunks), 0)
 
+    def test_read_file_and_map_file(self):
+        path = os.path.join(COMMON_INPUT_PATH, "python", "Assets", "MyExternalLibrary", "functions.py")
+        with open(path, "rb") as f:
+            expected = f.read()
+        content = read_file(path)
+        self.assertIsInstance(content, bytearray)
+        self.assertEqual(content, expected)
+        view = map_file(path)
+        self.assertTrue(view.readonly)
+        self.assertEqual(view, expected)
+        view.release()
+        with tempfile.TemporaryDirectory() as tmp:
+            empty = os.path.join(tmp, "empty.txt")
+            open(empty, "wb").close()
+            self.assertEqual(read_file(empty), b"")
+            self.assertEqual(map_file(empty), b"")
+
+    def test_asset_bytes(self):
+        path = os.path.join(COMMON_INPUT_PATH, "python", "Assets", "MyExternalLibrary", "functions.py")
+        asset = Asset(absolute_path=path)
+        self.assertEqual(hashlib.md5(asset.bytes).hexdigest(), asset.calculate_checksum())
+        asset = Asset(filename="example.txt", content="example content")
+        self.assertEqual(asset.bytes, b"example content")
+        self.assertEqual(asset.calculate_checksum(), hashlib.md5(b"example content").hexdigest())
+        asset = Asset(filename="example.bin", content=bytearray(b"binary"))
+        self.assertIs(asset.bytes, asset.content)
+
     def test_save_as(self):
         # Initialize the asset object
         asset = Asset(filename="example.txt", content="example content")
@@ -21,6 +21,12 @@ setC = partial(param_update, param="c")
 setD = partial(param_update, param="d")
 
 
+def set_row_without_nan(simulation, row):
+    for k, v in row.items():
+        if not np.isnan(v):
+            simulation.task.set_parameter(k, int(v))
+
+
 @pytest.mark.smoke
 @allure.story("Sweeps")
 @allure.suite("idmtools_core")
@@ -60,3 +66,16 @@ class TestCsvBuilder(ITestWithPersistence):
         for i, simulation in enumerate(simulations):
             self.assertEqual(simulation.task.parameters, expected_values[i])
 
+    def test_sweep_table_from_file(self):
+        file_path = os.path.join(self.base_path, 'sweeps.csv')
+        self.builder.add_sweep_table_from_file(file_path, set_row_without_nan, tags=['a', 'c'])
+        self.assertEqual(self.builder.count, 5)
+
+        templated_sim = TemplatedSimulations(base_task=TestTask())
+        templated_sim.builder = self.builder
+        simulations = list(templated_sim)
+
+        self.assertEqual(len(simulations), 5)
+        self.assertEqual(simulations[0].task.parameters, {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(simulations[4].task.parameters, {'a': 2, 'c': 3, 'd': 6})
+        self.assertEqual(simulations[4].tags, {'a': 2, 'c': 3})
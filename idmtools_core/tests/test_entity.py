@@ -8,7 +8,7 @@ import unittest
 from dataclasses import dataclass, field, fields
 import pytest
 from idmtools.builders import SimulationBuilder
-from idmtools.core import NoPlatformException, ItemType
+from idmtools.core import NoPlatformException, ItemType, EntityContainer, EntityStatus
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.core.platform_factory import Platform
 from idmtools.entities.experiment import Experiment
@@ -348,6 +348,59 @@ class TestEntity(ITestWithPersistence):
         assert sim.parent is None
         assert sim.parent_id is None
 
+    def test_entity_container_index_and_statuses(self):
+        sims = [Simulation(_uid=f"sim{i}") for i in range(5)]
+        container = EntityContainer(sims)
+        self.assertEqual(container.status_counts, {None: 5})
+        self.assertIs(container.get_item("sim3"), sims[3])
+
+        container.set_statuses({"sim0": EntityStatus.SUCCEEDED, "sim1": EntityStatus.FAILED})
+        container.set_status_for_item("sim2", EntityStatus.RUNNING)
+        self.assertEqual(container.status_counts, {EntityStatus.SUCCEEDED: 1, EntityStatus.FAILED: 1,
+                                                   EntityStatus.RUNNING: 1, None: 2})
+        # status set directly on the child is counted as well
+        sims[3].status = EntityStatus.SUCCEEDED
+        self.assertEqual(container.count_status(EntityStatus.SUCCEEDED, EntityStatus.FAILED), 3)
+
+        # unknown ids leave every status untouched
+        with self.assertRaises(ValueError):
+            container.set_statuses({"sim4": EntityStatus.FAILED, "missing": EntityStatus.FAILED})
+        self.assertIsNone(sims[4].status)
+
+        # the index follows removals and id changes
+        container.remove(sims[0])
+        container.pop(0)
+        sims[4].uid = "renamed"
+        self.assertIsNone(container.get_item("sim1"))
+        self.assertIs(container.get_item("renamed"), sims[4])
+        self.assertEqual(container.status_counts, {EntityStatus.RUNNING: 1, EntityStatus.SUCCEEDED: 1, None: 1})
+        sims[0].status = EntityStatus.FAILED
+        self.assertEqual(container.count_status(EntityStatus.FAILED), 0)
+
+        # copies rebuild their counters and track the copied children
+        copied = pickle.loads(pickle.dumps(container))
+        self.assertEqual(copied.status_counts, container.status_counts)
+        copied[0].status = EntityStatus.FAILED
+        self.assertEqual(copied.count_status(EntityStatus.FAILED), 1)
+        self.assertEqual(container.count_status(EntityStatus.FAILED), 0)
+
+    def test_experiment_status_from_counters(self):
+        exp = Experiment("exp")
+        exp.simulations = [Simulation(_uid=f"sim{i}") for i in range(3)]
+        self.assertIsNone(exp.status)
+        exp.simulations.set_statuses({"sim0": EntityStatus.SUCCEEDED, "sim1": EntityStatus.FAILED,
+                                      "sim2": EntityStatus.RUNNING})
+        self.assertEqual(exp.status, EntityStatus.RUNNING)
+        self.assertTrue(exp.any_failed)
+        self.assertFalse(exp.done)
+        exp.simulations[2].status = EntityStatus.SUCCEEDED
+        self.assertTrue(exp.done)
+        self.assertFalse(exp.succeeded)
+        self.assertEqual(exp.status, EntityStatus.FAILED)
+        exp.simulations.set_status(EntityStatus.SUCCEEDED)
+        self.assertTrue(exp.succeeded)
+        self.assertEqual(exp.status, EntityStatus.SUCCEEDED)
+
 
 if __name__ == '__main__':
     unittest.main()
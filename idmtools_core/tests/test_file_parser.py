@@ -0,0 +1,85 @@
+import json
+import os
+import struct
+import unittest
+from io import BytesIO
+from unittest import mock
+import allure
+import pytest
+from idmtools.utils import file_parser
+from idmtools.utils.file_parser import FileParser
+
+try:
+    from idmtools_platform_comps.utils.spatial_output import SpatialOutput
+except ImportError:
+    SpatialOutput = None
+
+CSV_CONTENT = b"Time, Infected, Population\n0, 1, 100\n1, 2, 100\n"
+# 2 nodes (ids 10 and 20) and 2 time steps
+SPATIAL_CONTENT = struct.pack('ii', 2, 2) + struct.pack('2I', 10, 20) + struct.pack('4f', 1, 2, 3, 4)
+JSON_CONTENT = json.dumps({"Header": {"Timesteps": 2},
+                           "Channels": {"Infected": {"Data": [1, 2]}, "Population": {"Data": [100, 100]}}}).encode()
+
+
+@pytest.mark.smoke
+@allure.story("Analyzers")
+@allure.suite("idmtools_core")
+class TestFileParser(unittest.TestCase):
+
+    def test_parse_csv(self):
+        df = FileParser.parse("output/ReportA.csv", CSV_CONTENT)
+        self.assertListEqual(list(df.columns), ["Time", "Infected", "Population"])
+        df = FileParser.parse("output/ReportA.csv", CSV_CONTENT, columns=["Time", "Infected"])
+        self.assertListEqual(list(df.columns), ["Time", "Infected"])
+        self.assertListEqual(df["Infected"].tolist(), [1, 2])
+
+    def test_parse_json(self):
+        self.assertDictEqual(FileParser.parse("output/InsetChart.json", JSON_CONTENT), json.loads(JSON_CONTENT))
+        data = FileParser.parse("output/InsetChart.json", JSON_CONTENT,
+                                json_paths=["Channels/Infected/Data", ("Header", "Timesteps")])
+        self.assertDictEqual(data, {"Channels": {"Infected": {"Data": [1, 2]}}, "Header": {"Timesteps": 2}})
+        with self.assertRaises(KeyError):
+            FileParser.parse("output/InsetChart.json", JSON_CONTENT, json_paths=["Channels/Deaths"])
+
+    def test_json_backends(self):
+        content = b'{"a": NaN, "b": [1, 2]}'
+        for backend in ("json", "orjson"):
+            with self.subTest(backend=backend), mock.patch.dict(os.environ, {"IDMTOOLS_JSON_PARSER": backend}):
+                data = FileParser.parse("output/result.json", content)
+                self.assertEqual(data["b"], [1, 2])
+                self.assertNotEqual(data["a"], data["a"])  # NaN
+
+    def test_unavailable_backend_falls_back(self):
+        with mock.patch.object(file_parser, "pyarrow_csv", None), \
+                mock.patch.dict(os.environ, {"IDMTOOLS_CSV_PARSER": "pyarrow"}):
+            self.assertEqual(FileParser.get_backend("csv"), "pandas")
+            self.assertListEqual(FileParser.parse("output/ReportA.csv", CSV_CONTENT)["Time"].tolist(), [0, 1])
+
+    def test_raw_backends(self):
+        self.assertIsInstance(FileParser.parse("output/data.dat", b"abc"), BytesIO)
+        with mock.patch.dict(os.environ, {"IDMTOOLS_RAW_PARSER": "memoryview"}):
+            raw = FileParser.parse("output/data.dat", b"abc")
+            self.assertIsInstance(raw, memoryview)
+            self.assertEqual(raw.tobytes(), b"abc")
+
+    @pytest.mark.skipif(SpatialOutput is None, reason="idmtools_platform_comps is not installed")
+    def test_bin_backends(self):
+        data = FileParser.parse("output/SpatialReport_Population.bin", SPATIAL_CONTENT)
+        self.assertIsInstance(data, dict)
+        self.assertEqual(data["data"].tolist(), [[1, 2], [3, 4]])
+        with mock.patch.dict(os.environ, {"IDMTOOLS_BIN_PARSER": "view"}):
+            so = FileParser.parse("output/SpatialReport_Population.bin", SPATIAL_CONTENT)
+            self.assertIsInstance(so, SpatialOutput)
+            self.assertFalse(so.data.flags.writeable)
+            self.assertEqual(so.select(nodes=[20]).data.tolist(), [[2], [4]])
+
+    @pytest.mark.skipif(file_parser.pyarrow_csv is None, reason="pyarrow is not installed")
+    def test_pyarrow_csv(self):
+        with mock.patch.dict(os.environ, {"IDMTOOLS_CSV_PARSER": "pyarrow"}):
+            df = FileParser.parse("output/ReportA.csv", CSV_CONTENT, columns=["Infected"])
+            self.assertListEqual(list(df.columns), ["Infected"])
+            self.assertListEqual(df["Infected"].tolist(), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
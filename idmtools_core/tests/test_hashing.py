@@ -0,0 +1,121 @@
+import allure
+import unittest
+from dataclasses import dataclass, field
+from functools import partial
+import numpy as np
+import pytest
+from idmtools.entities.command_task import CommandTask
+from idmtools.entities.simulation import Simulation
+from idmtools.frozen.copy_on_write import CopyOnWriteDict
+from idmtools.frozen.frozen_utils import frozen_transform
+from idmtools.utils import canonical_hash as canonical_hash_module
+from idmtools.utils.canonical_hash import canonical_hash, CanonicalEncoder
+from idmtools.utils.hashing import hash_obj
+
+
+@dataclass
+class Point:
+    x: int = 0
+    y: int = 0
+    labels: dict = field(default_factory=dict)
+
+
+def scale(value, factor=1):
+    return value * factor
+
+
+@pytest.mark.smoke
+@allure.story("Hashing")
+@allure.suite("idmtools_core")
+class TestHashing(unittest.TestCase):
+
+    def test_dict_order(self):
+        a = {"a": 1, "b": {"c": [1, 2], "d": None}, 3: "int key"}
+        b = {3: "int key", "b": {"d": None, "c": [1, 2]}, "a": 1}
+        self.assertEqual(canonical_hash(a), canonical_hash(b))
+        self.assertEqual(hash_obj(a), hash_obj(b))
+        self.assertNotEqual(canonical_hash(a), canonical_hash({**a, "a": 2}))
+        # list order matters
+        self.assertNotEqual(canonical_hash([1, 2]), canonical_hash([2, 1]))
+
+    def test_set_order(self):
+        self.assertEqual(canonical_hash({"b", "a", 1}), canonical_hash({1, "a", "b"}))
+        self.assertEqual(canonical_hash(frozenset([3, 2])), canonical_hash({2, 3}))
+
+    def test_types_are_tagged(self):
+        values = [1, 1.0, True, "1", b"1", (1,), [1], None, 1 + 0j]
+        self.assertEqual(len(set(canonical_hash(v) for v in values)), len(values))
+        self.assertNotEqual(canonical_hash(["ab", "c"]), canonical_hash(["a", "bc"]))
+
+    def test_encoding_is_stable(self):
+        encoder = CanonicalEncoder()
+        encoder.encode({"a": [1, None]})
+        self.assertEqual(
+            bytes(encoder.buffer),
+            b'd' + (1).to_bytes(8, 'big') + b'u' + (1).to_bytes(8, 'big') + b'a' + b'l' + (2).to_bytes(8, 'big') +
+            b'i' + (1).to_bytes(8, 'big') + b'\x01' + b'N'
+        )
+
+    def test_dataclass_and_functions(self):
+        self.assertEqual(canonical_hash(Point(1, 2, {"a": 1})), canonical_hash(Point(1, 2, {"a": 1})))
+        self.assertNotEqual(canonical_hash(Point(1, 2)), canonical_hash(Point(2, 1)))
+        self.assertEqual(canonical_hash(partial(scale, factor=2)), canonical_hash(partial(scale, factor=2)))
+        self.assertNotEqual(canonical_hash(partial(scale, factor=2)), canonical_hash(partial(scale, factor=3)))
+
+    def test_numpy(self):
+        a = np.arange(12).reshape(3, 4)
+        self.assertEqual(canonical_hash(a), canonical_hash(a.copy()))
+        # non contiguous views hash like their contiguous copy
+        self.assertEqual(canonical_hash(a.T), canonical_hash(np.ascontiguousarray(a.T)))
+        self.assertNotEqual(canonical_hash(a), canonical_hash(a.astype(float)))
+        self.assertNotEqual(canonical_hash(a), canonical_hash(a.reshape(4, 3)))
+        self.assertEqual(canonical_hash(np.int64(3)), canonical_hash(3))
+
+    def test_copy_on_write_dict(self):
+        base = {"a": {"b": [1, 2]}, "c": 3}
+        self.assertEqual(canonical_hash(CopyOnWriteDict(base)), canonical_hash(base))
+
+    def test_cycles(self):
+        a = [1]
+        a.append(a)
+        b = [1]
+        b.append(b)
+        self.assertEqual(canonical_hash(a), canonical_hash(b))
+        d = {"a": 1}
+        d["self"] = d
+        self.assertNotEqual(canonical_hash(a), canonical_hash(d))
+
+    def test_frozen_items_are_memoized(self):
+        frozen = frozen_transform({"a": [1, 2], "b": {"c": 1}})
+        digest = canonical_hash({"config": frozen})
+        self.assertIn((id(frozen), 'blake2b'), canonical_hash_module._FROZEN_DIGESTS)
+        self.assertEqual(digest, canonical_hash({"config": frozen}))
+        self.assertEqual(digest, canonical_hash({"config": frozen_transform({"b": {"c": 1}, "a": [1, 2]})}))
+        frozen_id = id(frozen)
+        del frozen
+        self.assertNotIn((frozen_id, 'blake2b'), canonical_hash_module._FROZEN_DIGESTS)
+
+    def test_frozen_digests_per_algorithm(self):
+        def digests():
+            frozen = frozen_transform({"a": [1, 2]})
+            return canonical_hash({"c": frozen}, 'md5'), canonical_hash({"c": frozen}, 'sha256')
+
+        md5_first = digests()
+        frozen = frozen_transform({"a": [1, 2]})
+        sha256_first = canonical_hash({"c": frozen}, 'sha256'), canonical_hash({"c": frozen}, 'md5')
+        self.assertEqual(md5_first, sha256_first[::-1])
+
+    def test_pickle_ignore_fields(self):
+        sim = Simulation(task=CommandTask(command="python model.py"))
+        digest = hash_obj(sim)
+        sim._platform_object = object()
+        self.assertEqual(digest, hash_obj(sim))
+        sim.tags["a"] = 1
+        self.assertNotEqual(digest, hash_obj(sim))
+
+    def test_hash_algorithms(self):
+        self.assertEqual(len(hash_obj({"a": 1})), 32)
+        self.assertEqual(len(hash_obj({"a": 1}, hash_name='sha1')), 40)
+        self.assertNotEqual(canonical_hash({"a": 1}), hash_obj({"a": 1}))
+        with self.assertRaises(ValueError):
+            canonical_hash({"a": 1}, hash_name='not_a_hash')
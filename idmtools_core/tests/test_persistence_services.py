@@ -1,11 +1,15 @@
 import allure
+import os
 import pickle
+import tempfile
 import unittest
+from unittest import mock
 
 import pytest
 from idmtools.core.platform_factory import Platform
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
+from idmtools.services.file_cache import FileCache, get_file_cache
 from idmtools.services.platforms import PlatformPersistService
 from idmtools_test.utils.itest_with_persistence import ITestWithPersistence
 from idmtools_test.utils.test_task import TestTask
@@ -50,6 +54,48 @@ class TestPersistenceServices(ITestWithPersistence):
         PlatformPersistService.clear()
         self.assertEqual(PlatformPersistService.length(), 0)
 
+    def test_file_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = FileCache(cache_dir)
+            key = FileCache.key("Test", "sim1", "output/result.json", "10:1")
+            self.assertIsNone(cache.get(key))
+            cache.set(key, bytearray(b"0123456789"))
+            self.assertEqual(cache.get(key), b"0123456789")
+            # changed signature is a miss
+            self.assertIsNone(cache.get(FileCache.key("Test", "sim1", "output/result.json", "10:2")))
+            # identical content is stored once
+            cache.set(FileCache.key("Test", "sim2", "output/result.json", "10:1"), b"0123456789")
+            self.assertEqual(len([k for k in cache._cache.iterkeys() if k.startswith("blob:")]), 1)
+            cache.close()
+
+    def test_get_files_from_file_cache(self):
+        platform = Platform('Test')
+        simulation = Simulation(task=TestTask())
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(os.environ, {"IDMTOOLS_FILE_CACHE_ENABLED": "on",
+                                             "IDMTOOLS_FILE_CACHE_DIRECTORY": cache_dir}), \
+                mock.patch.object(type(platform), 'get_file_signatures', return_value={"out.txt": "5:1"}), \
+                mock.patch.object(platform._simulations, 'get_assets',
+                                  return_value={"out.txt": bytearray(b"12345")}) as get_assets:
+            self.assertEqual(platform.get_files(simulation, ["out.txt"]), {"out.txt": bytearray(b"12345")})
+            content = platform.get_files(simulation, ["out.txt"])["out.txt"]
+            get_assets.assert_called_once()
+            # same type as a download
+            self.assertIsInstance(content, bytearray)
+            self.assertEqual(content, b"12345")
+            get_file_cache().close()
+
+    def test_file_cache_disabled_by_default(self):
+        with mock.patch.dict(os.environ, {"IDMTOOLS_FILE_CACHE_ENABLED": "off"}):
+            self.assertIsNone(get_file_cache())
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(os.environ, {"IDMTOOLS_FILE_CACHE_ENABLED": "on",
+                                             "IDMTOOLS_FILE_CACHE_DIRECTORY": cache_dir}):
+            cache = get_file_cache()
+            self.assertEqual(cache.directory, cache_dir)
+            self.assertIs(get_file_cache(), cache)
+            cache.close()
+
 
 if __name__ == '__main__':
     unittest.main()
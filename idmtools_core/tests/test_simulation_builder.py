@@ -1,6 +1,7 @@
 import allure
 import itertools
 from functools import partial
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -19,6 +20,11 @@ setA = partial(param_update, param="a")
 setB = partial(param_update, param="b")
 
 
+def set_row(simulation, row):
+    simulation.task.parameters.update(row)
+    return {"row_sum": sum(row.values())}
+
+
 def update_parameter_callback(simulation, a, b, c):
     simulation.task.set_parameter("param_a", a)
     simulation.task.set_parameter("param_b", b)
@@ -67,6 +73,73 @@ class TestSimulationBuilder(ITestWithPersistence):
             expected_dict = {"a": value[0], "b": value[1]}
             self.assertEqual(simulation.task.parameters, expected_dict)
 
+    def test_random_access(self):
+        self.create_simple_sweep()
+        self.builder.add_sweep_definition(update_parameter_callback, a=[1, 2], b=["x"], c=[True, False])
+
+        def apply(functions):
+            simulation = Simulation(task=TestTask())
+            for func in functions:
+                func(simulation=simulation)
+            return simulation.task.parameters
+
+        expected = [apply(functions) for functions in self.builder]
+        self.assertEqual(len(expected), 60)
+        for i in (0, 1, 7, 31, 59, -1, -60):
+            self.assertEqual(apply(self.builder[i]), expected[i])
+        self.assertEqual([apply(f) for f in self.builder[10:20:3]], expected[10:20:3])
+        with self.assertRaises(IndexError):
+            self.builder[60]
+        with self.assertRaises(IndexError):
+            self.builder[-61]
+        # random access doesn't consume the sweeps
+        self.assertEqual([apply(functions) for functions in self.builder], expected)
+
+    def test_add_sweep_table(self):
+        import numpy as np
+        df = pd.DataFrame(dict(x=np.arange(2500, dtype=np.int64), y=np.linspace(0, 1, 2500)))
+        structured = np.array([(1, 0.5), (2, 0.25)], dtype=[("x", "i8"), ("y", "f8")])
+        for table, n in ((df, 2500), (structured, 2), (dict(x=[1, 2], y=[0.5, 0.25]), 2)):
+            builder = SimulationBuilder()
+            builder.add_sweep_table(table, set_row, tags=["x"])
+            builder.add_sweep_definition(setA, [1, 2])
+            self.assertEqual(len(builder), n * 2)
+
+            simulations = self.get_simulations_with_builder(builder)
+            self.assertEqual(len(simulations), n * 2)
+            self.assertEqual(simulations[3].task.parameters, {"x": table["x"][1], "y": table["y"][1], "a": 2})
+            self.assertIs(type(simulations[3].task.parameters["x"]), int)
+            self.assertEqual(simulations[3].tags["x"], table["x"][1])
+            self.assertEqual(simulations[3].tags["row_sum"], table["x"][1] + table["y"][1])
+            # random access matches iteration
+            simulation = Simulation(task=TestTask())
+            for func in builder[3]:
+                func(simulation=simulation)
+            self.assertEqual(simulation.task.parameters, simulations[3].task.parameters)
+
+    def test_sweep_table_is_iterated_lazily(self):
+        import numpy as np
+        from idmtools.builders.simulation_builder import SweepTable
+        n = 10 * SweepTable.BATCH_SIZE
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(setA, [1, 2])
+        builder.add_sweep_table(dict(x=np.arange(n)), set_row)
+        with patch.object(SweepTable, '_functions', autospec=True, side_effect=SweepTable._functions) as functions:
+            iterator = iter(builder)
+            for _ in range(SweepTable.BATCH_SIZE):
+                next(iterator)
+            # only the first batch of rows is built
+            functions.assert_called_once()
+            self.assertEqual(len(list(iterator)), 2 * n - SweepTable.BATCH_SIZE)
+
+    def test_add_sweep_table_validation(self):
+        with self.assertRaises(ValueError):
+            self.builder.add_sweep_table(dict(x=[1, 2], y=[1]), set_row)
+        with self.assertRaises(ValueError):
+            self.builder.add_sweep_table(dict(x=[1, 2]), set_row, tags=["z"])
+        with self.assertRaises(ValueError):
+            self.builder.add_sweep_table(dict(x=[1, 2]), update_parameter_callback)
+
     def test_reverse_order(self):
         self.create_simple_sweep()
 
@@ -1,13 +1,20 @@
 import allure
+import copy
+import json
+import pickle
 from typing import Dict
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
+from idmtools.assets import Asset
 from idmtools.builders import SimulationBuilder
 from idmtools.entities.command_task import CommandTask
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.templated_simulation import TemplatedSimulations
+from idmtools.frozen.copy_on_write import CopyOnWriteDict
+from idmtools_test.utils.test_task import TestTask
 
 
 def print_sweep(simulation: Simulation, value) -> Dict:
@@ -15,6 +22,21 @@ def print_sweep(simulation: Simulation, value) -> Dict:
     return dict()
 
 
+def set_parameter_a(simulation: Simulation, value) -> Dict:
+    simulation.task.parameters["a"] = value
+    return dict(a=value)
+
+
+def set_parameter_b(simulation: Simulation, value) -> Dict:
+    simulation.task.parameters["b"] = value
+    return dict(b=value)
+
+
+def add_asset(simulation: Simulation, value) -> Dict:
+    simulation.assets.add_asset(Asset(filename=f"f{value}.txt", content=str(value)))
+    return dict(f=value)
+
+
 @pytest.mark.tasks
 @pytest.mark.smoke
 @allure.story("Sweeps")
@@ -36,3 +58,105 @@ class TestTemplatedSimulation(TestCase):
 
         sims = [s for s in ts]
         self.assertEqual(len(sims), total)
+
+    def test_copy_on_write_simulations(self):
+        base_parameters = {"a": 1, "nested": {"b": 2, "list": [{"c": 3}]}, "untouched": {"d": [4]}}
+        task = TestTask(parameters=base_parameters)
+
+        def set_nested(simulation: Simulation, value) -> Dict:
+            simulation.task.parameters["nested"]["b"] = value
+            simulation.task.parameters["nested"]["list"][0]["c"] = value
+            simulation.task.parameters["a"] = value
+            return dict(value=value)
+
+        ts = TemplatedSimulations(base_task=task, copy_on_write=True)
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(set_nested, range(3))
+        ts.add_builder(builder)
+        sims = list(ts)
+
+        # untouched values are shared until accessed
+        self.assertIs(dict.__getitem__(sims[2].task.parameters, "untouched"), base_parameters["untouched"])
+        sims[2].task.parameters["untouched"]["d"].append(5)
+        self.assertEqual(base_parameters["untouched"], {"d": [4]})
+
+        # the base task is never modified
+        self.assertEqual(task.parameters, {"a": 1, "nested": {"b": 2, "list": [{"c": 3}]}, "untouched": {"d": [4]}})
+        for i, sim in enumerate(sims):
+            self.assertIsInstance(sim.task.parameters, CopyOnWriteDict)
+            self.assertEqual(json.loads(json.dumps(sim.task.parameters)),
+                             {"a": i, "nested": {"b": i, "list": [{"c": i}]}, "untouched": {"d": [4, 5] if i == 2 else [4]}})
+            self.assertEqual(sim.tags, dict(value=i))
+
+        # pickled and deep copied simulations hold plain containers
+        for copied in (pickle.loads(pickle.dumps(sims[1])), copy.deepcopy(sims[1])):
+            self.assertIs(type(copied.task.parameters), dict)
+            self.assertIs(type(copied.task.parameters["nested"]["list"]), list)
+            self.assertEqual(copied.task.parameters["nested"]["b"], 1)
+
+    def test_copy_on_write_disabled(self):
+        task = TestTask(parameters={"nested": {"x": [1, 2]}})
+        ts = TemplatedSimulations(base_task=task)
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(print_sweep, range(2))
+        ts.add_builder(builder)
+        sims = list(ts)
+        for sim in sims:
+            self.assertIs(type(sim.task.parameters), dict)
+        # simulations are deep copies, changing the base task afterwards doesn't change them
+        task.parameters["nested"]["x"].append(99)
+        self.assertEqual([sim.task.parameters["nested"]["x"] for sim in sims], [[1, 2], [1, 2]])
+
+    def test_parallel_generation(self):
+        task = TestTask(parameters={"a": 0})
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(set_parameter_a, range(25))
+        builder.add_sweep_definition(set_parameter_b, ["x", "y"])
+
+        serial = TemplatedSimulations(base_task=task)
+        serial.add_builder(builder)
+        parallel = TemplatedSimulations(base_task=task, generation_workers=2, generation_chunk_size=4)
+        parallel.add_builder(builder)
+        parallel.add_simulation(Simulation(task=TestTask(parameters={"extra": True})))
+
+        expected = [(s.task.parameters, s.tags) for s in serial]
+        sims = list(parallel)
+        self.assertEqual(len(sims), 51)
+        self.assertEqual([(s.task.parameters, s.tags) for s in sims[:50]], expected)
+        self.assertEqual(sims[-1].task.parameters, {"extra": True})
+        self.assertEqual(len(set(s.id for s in sims)), 51)
+        self.assertEqual(task.parameters, {"a": 0})
+
+    def test_parallel_generation_keeps_assets(self):
+        base_simulation = Simulation(task=TestTask(parameters={"a": 0}))
+        base_simulation.assets.add_asset(Asset(filename="base.txt", content="base"))
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(add_asset, range(4))
+
+        results = []
+        for workers in (1, 2):
+            ts = TemplatedSimulations(base_simulation=base_simulation, generation_workers=workers,
+                                      generation_chunk_size=2)
+            ts.add_builder(builder)
+            results.append([sorted(a.filename for a in s.assets) for s in ts])
+        self.assertEqual(results[0], [["base.txt", f"f{i}.txt"] for i in range(4)])
+        self.assertEqual(results[1], results[0])
+
+    def test_parallel_generation_sends_index_ranges(self):
+        task = TestTask(parameters={"a": 0})
+        builder = SimulationBuilder()
+        builder.add_sweep_definition(set_parameter_a, range(10))
+        generated = SimulationBuilder()
+        generated.add_sweep_definition(set_parameter_b, (v for v in ["x", "y", "z"]))
+
+        parallel = TemplatedSimulations(base_task=task, generation_workers=2, generation_chunk_size=3)
+        parallel.add_builder(builder)
+        parallel.add_builder(generated)
+        expected = sorted([{"a": a} for a in range(10)] + [{"a": 0, "b": b} for b in ["x", "y", "z"]], key=str)
+
+        # the index addressable builder is only enumerated in the workers, from the bounds of the ranges
+        original_iter = SimulationBuilder.__iter__
+        with patch.object(SimulationBuilder, '__iter__', autospec=True,
+                          side_effect=lambda b: original_iter(b) if b is generated else self.fail("enumerated")):
+            sims = list(parallel)
+        self.assertEqual(sorted([s.task.parameters for s in sims], key=str), expected)
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/0142fa71-add1-46f3-9f0e-4f27f6e0aacd/Assets/model.py
\ No newline at end of file
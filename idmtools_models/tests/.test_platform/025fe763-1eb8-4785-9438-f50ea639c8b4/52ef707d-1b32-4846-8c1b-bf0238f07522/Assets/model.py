@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/025fe763-1eb8-4785-9438-f50ea639c8b4/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/06cd9f9f-536f-43f1-937e-6212674c2c77/Assets/wrapper.sh
\ No newline at end of file
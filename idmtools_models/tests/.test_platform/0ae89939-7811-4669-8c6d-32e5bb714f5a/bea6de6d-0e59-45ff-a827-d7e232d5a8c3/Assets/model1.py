@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/0ae89939-7811-4669-8c6d-32e5bb714f5a/Assets/model1.py
\ No newline at end of file
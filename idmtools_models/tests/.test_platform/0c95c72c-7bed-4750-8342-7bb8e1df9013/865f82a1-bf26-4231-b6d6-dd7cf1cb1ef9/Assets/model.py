@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/0c95c72c-7bed-4750-8342-7bb8e1df9013/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/121d3dc8-d972-4447-883c-796ddb874608/Assets/model1.py
\ No newline at end of file
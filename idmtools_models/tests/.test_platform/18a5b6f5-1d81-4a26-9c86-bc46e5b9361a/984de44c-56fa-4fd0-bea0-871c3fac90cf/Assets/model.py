@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/18a5b6f5-1d81-4a26-9c86-bc46e5b9361a/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/19e9ea67-a1f5-43b2-9962-2befd4a4ac93/Assets/model1.py
\ No newline at end of file
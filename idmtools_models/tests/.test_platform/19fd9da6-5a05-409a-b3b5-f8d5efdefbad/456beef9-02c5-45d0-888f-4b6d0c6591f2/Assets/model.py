@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/19fd9da6-5a05-409a-b3b5-f8d5efdefbad/Assets/model.py
\ No newline at end of file
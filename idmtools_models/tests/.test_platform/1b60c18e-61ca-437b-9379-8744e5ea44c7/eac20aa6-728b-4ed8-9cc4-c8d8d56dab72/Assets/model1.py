@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/1b60c18e-61ca-437b-9379-8744e5ea44c7/Assets/model1.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/1e99dfb1-4676-458b-9b2b-b70520fb6071/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/26b4bec1-35e3-4cb9-b6ad-4cb2eff65c4e/Assets/model.py
\ No newline at end of file
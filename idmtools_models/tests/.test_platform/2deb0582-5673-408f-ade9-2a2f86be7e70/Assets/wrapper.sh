@@ -0,0 +1,3 @@
+export PYTHONPATH=$(pwd)/Assets/site-packages:$(pwd)/Assets/:$PYTHONPATH
+echo Running args $@
+"$@"
\ No newline at end of file
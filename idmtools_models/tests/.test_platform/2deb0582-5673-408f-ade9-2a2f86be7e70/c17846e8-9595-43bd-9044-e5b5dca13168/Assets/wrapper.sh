@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/2deb0582-5673-408f-ade9-2a2f86be7e70/Assets/wrapper.sh
\ No newline at end of file
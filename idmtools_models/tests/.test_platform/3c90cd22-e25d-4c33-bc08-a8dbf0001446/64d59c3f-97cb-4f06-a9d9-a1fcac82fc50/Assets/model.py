@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/3c90cd22-e25d-4c33-bc08-a8dbf0001446/Assets/model.py
\ No newline at end of file
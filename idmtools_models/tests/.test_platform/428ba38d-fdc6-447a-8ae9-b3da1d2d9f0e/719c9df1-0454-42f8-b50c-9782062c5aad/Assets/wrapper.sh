@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/428ba38d-fdc6-447a-8ae9-b3da1d2d9f0e/Assets/wrapper.sh
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/4e3ac48c-db94-4612-841d-b5b033b7bf8d/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6098dc17-32a8-4ece-b40c-905ac9059b5d/Assets/wrapper.sh
\ No newline at end of file
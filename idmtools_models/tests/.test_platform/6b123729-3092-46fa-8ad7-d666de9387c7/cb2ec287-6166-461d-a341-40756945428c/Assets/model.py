@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6b123729-3092-46fa-8ad7-d666de9387c7/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6ba5b033-9101-43c4-abf2-56289fe6c670/Assets/model.py
\ No newline at end of file
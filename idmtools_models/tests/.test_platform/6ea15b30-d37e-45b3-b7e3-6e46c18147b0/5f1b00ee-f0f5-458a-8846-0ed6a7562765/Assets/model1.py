@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/6ea15b30-d37e-45b3-b7e3-6e46c18147b0/Assets/model1.py
\ No newline at end of file
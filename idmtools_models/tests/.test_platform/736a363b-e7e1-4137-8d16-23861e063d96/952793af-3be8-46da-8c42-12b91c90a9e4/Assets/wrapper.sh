@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/736a363b-e7e1-4137-8d16-23861e063d96/Assets/wrapper.sh
\ No newline at end of file
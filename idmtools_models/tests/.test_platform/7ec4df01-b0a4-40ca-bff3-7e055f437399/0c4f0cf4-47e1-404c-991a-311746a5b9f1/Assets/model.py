@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/7ec4df01-b0a4-40ca-bff3-7e055f437399/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/835e3397-411b-49c7-a0d4-af40bb6a2a50/Assets/model1.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/88c69d3a-f88c-4d5c-9399-09c5cfbd2693/Assets/model1.py
\ No newline at end of file
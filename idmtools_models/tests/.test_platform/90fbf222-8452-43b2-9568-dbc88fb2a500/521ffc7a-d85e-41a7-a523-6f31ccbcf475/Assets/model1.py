@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/90fbf222-8452-43b2-9568-dbc88fb2a500/Assets/model1.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/a5a6bb06-46b5-4431-b30f-c587acb842a9/Assets/wrapper.sh
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/a6473305-98c0-4f61-8504-7079a273b5ad/Assets/model1.py
\ No newline at end of file
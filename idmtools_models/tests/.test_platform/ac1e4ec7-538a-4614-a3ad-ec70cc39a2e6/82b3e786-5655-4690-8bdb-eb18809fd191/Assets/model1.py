@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/ac1e4ec7-538a-4614-a3ad-ec70cc39a2e6/Assets/model1.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/b285056f-0066-4282-a3c5-a686d822bef8/Assets/model.py
\ No newline at end of file
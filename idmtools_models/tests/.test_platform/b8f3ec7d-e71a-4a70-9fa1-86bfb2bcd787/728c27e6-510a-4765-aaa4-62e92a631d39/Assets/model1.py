@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/b8f3ec7d-e71a-4a70-9fa1-86bfb2bcd787/Assets/model1.py
\ No newline at end of file
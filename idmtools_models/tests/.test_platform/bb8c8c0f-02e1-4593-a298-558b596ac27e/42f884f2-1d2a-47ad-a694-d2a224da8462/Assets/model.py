@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/bb8c8c0f-02e1-4593-a298-558b596ac27e/Assets/model.py
\ No newline at end of file
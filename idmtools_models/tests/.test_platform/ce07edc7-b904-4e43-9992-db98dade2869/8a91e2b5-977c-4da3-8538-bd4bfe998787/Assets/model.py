@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/ce07edc7-b904-4e43-9992-db98dade2869/Assets/model.py
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/e2bffdc3-0d43-4ea9-b3ce-33220c186ef8/Assets/model.py
\ No newline at end of file
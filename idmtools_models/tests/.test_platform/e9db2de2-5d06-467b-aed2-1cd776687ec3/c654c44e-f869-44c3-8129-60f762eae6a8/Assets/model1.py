@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/e9db2de2-5d06-467b-aed2-1cd776687ec3/Assets/model1.py
\ No newline at end of file
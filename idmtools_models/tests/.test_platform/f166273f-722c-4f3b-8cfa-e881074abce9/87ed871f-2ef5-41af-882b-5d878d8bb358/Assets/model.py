@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f166273f-722c-4f3b-8cfa-e881074abce9/Assets/model.py
\ No newline at end of file
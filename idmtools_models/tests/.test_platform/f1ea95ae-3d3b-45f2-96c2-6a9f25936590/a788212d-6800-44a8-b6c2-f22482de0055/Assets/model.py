@@ -0,0 +1 @@
+/root/package/idmtools_models/tests/.test_platform/f1ea95ae-3d3b-45f2-96c2-6a9f25936590/Assets/model.py
\ No newline at end of file
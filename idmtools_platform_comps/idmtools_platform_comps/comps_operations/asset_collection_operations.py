@@ -67,6 +67,8 @@ class CompsPlatformAssetCollectionOperations(IPlatformAssetCollectionOperations)
         ac = COMPSAssetCollection()
         ac_files = set()
         ac_map = dict()
+        # hash the local files concurrently, reusing the checksums of files that didn't change since the last run
+        asset_collection.calculate_checksums()
         for asset in asset_collection:
             # using checksum is not accurate and not all systems will support de-duplication
             if asset.checksum is None:
@@ -121,13 +123,15 @@ class CompsPlatformAssetCollectionOperations(IPlatformAssetCollectionOperations)
                             file_path=asset.absolute_path
                         )
                     else:
-                        total_size += len(asset.bytes)
+                        # str content is encoded on every access to bytes
+                        data = asset.bytes
+                        total_size += len(data)
                         ac2.add_asset(
                             AssetCollectionFile(
                                 file_name=asset.filename,
                                 relative_path=asset.relative_path
                             ),
-                            data=asset.bytes
+                            data=data
                         )
                 else:
                     ac2.add_asset(AssetCollectionFile(
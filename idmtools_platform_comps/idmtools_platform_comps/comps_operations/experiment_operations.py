@@ -383,8 +383,7 @@ class CompsPlatformExperimentOperations(IPlatformExperimentOperations):
         """
         simulations = self.get_children(experiment.get_platform_object(), force=True, columns=["id", "state"],
                                         load_children=[])
-        for s in simulations:
-            experiment.simulations.set_status_for_item(s.id, convert_comps_status(s.state))
+        experiment.simulations.set_statuses({s.id: convert_comps_status(s.state) for s in simulations})
 
     def to_entity(self, experiment: COMPSExperiment, parent: Optional[COMPSSuite] = None, children: bool = True,
                   **kwargs) -> Experiment:
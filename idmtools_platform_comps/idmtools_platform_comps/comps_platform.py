@@ -200,6 +200,33 @@ class COMPSPlatform(IPlatform, CacheEnabled):
         file_data = super().get_files(self._normalized_item_fields(item), files, output, **kwargs)
         return file_data
 
+    def get_file_signatures(self, item: Union[COMPSSimulation, COMPSWorkItem], files: Union[Set[str], List[str]]) -> \
+            Dict[str, str]:
+        """
+        Get signatures (size and md5 checksum) of output files used to key the local file cache.
+
+        Files from the Assets directory are not included.
+
+        Args:
+            item: COMPS Simulation or WorkItem
+            files: List of output file names
+
+        Returns:
+            Dictionary of filename -> signature
+        """
+        if not isinstance(item, (COMPSSimulation, COMPSWorkItem)):
+            return dict()
+        transients = [f for f in files if not f.lower().startswith("assets")]
+        if not transients:
+            return dict()
+        try:
+            file_info = item.retrieve_output_file_info(transients)
+        except Exception as e:
+            # let the regular download surface the error
+            logger.debug(f"Could not retrieve output file info of {item.id}: {e}")
+            return dict()
+        return {filename: f"{info.length}:{info.md5_checksum}" for filename, info in zip(transients, file_info)}
+
     def flatten_item(self, item: object, raw: bool = False, **kwargs) -> List[object]:
         """
         Flatten an item: resolve the children until getting to the leaves.
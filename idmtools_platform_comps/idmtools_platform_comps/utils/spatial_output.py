@@ -3,13 +3,22 @@ idmtools utility.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
-import struct
+import os
+from typing import Iterable, Optional, Tuple, Union
 import numpy as np
 
+# Layout of the binary file: header (number of nodes and timesteps, plus start and interval when filtered),
+# node ids, then the data stored timestep by timestep
+NODE_ID_DTYPE = np.dtype('I')
+DATA_DTYPE = np.dtype('f')
+
 
 class SpatialOutput:
     """
     SpatialOutput class is used to parse data from binary file (.bin).
+
+    The data is a numpy array with one row per timestep and one column per node. By default it is a writable float64
+    array; with view=True it is a read-only float32 view of the bytes (or of the memory mapped file), nothing is copied.
     """
 
     def __init__(self):
@@ -24,43 +33,139 @@ class SpatialOutput:
         self.start = 0
         self.interval = 1
 
+    @staticmethod
+    def _read_header(buffer, filtered: bool) -> Tuple[int, int, int, int, int]:
+        """
+        Read the header of a spatial output.
+
+        Args:
+            buffer: Buffer containing at least the header
+            filtered: flag for applying filter
+
+        Returns:
+            Tuple of number of nodes, number of timesteps, start, interval and header size
+        """
+        n_nodes, n_tstep = np.frombuffer(buffer, dtype=np.dtype('i'), count=2)
+        start, interval = 0, 1
+        # The header size changes if the file is a filtered one
+        if filtered:
+            start, interval = np.frombuffer(buffer, dtype=np.dtype('f'), count=2, offset=8)
+        return int(n_nodes), int(n_tstep), int(start), int(interval), 16 if filtered else 8
+
+    def _decode(self, view: bool) -> None:
+        """
+        Convert the views of the nodeids and data to writable arrays of int64 and float64 unless view is set.
+
+        Args:
+            view: keep the read-only views
+
+        Returns:
+            None
+        """
+        if not view:
+            self.nodeids = self.nodeids.astype(np.int64)
+            self.data = self.data.astype(np.float64)
+
     @classmethod
-    def from_bytes(cls, bytes, filtered=False):
+    def from_bytes(cls, bytes, filtered=False, view: bool = False):
         """
         Convert from bytes to class object.
 
         Args:
             bytes: bytes
             filtered: flag for applying filter
+            view: return read-only float32 views of bytes instead of copying the data to float64 arrays
         """
-        # The header size changes if the file is a filtered one
-        headersize = 16 if filtered else 8
-
         # Create the class
         so = cls()
+        so.n_nodes, so.n_tstep, so.start, so.interval, headersize = cls._read_header(bytes, filtered)
 
-        # Retrive the number of nodes and number of timesteps
-        so.n_nodes, = struct.unpack('i', bytes[0:4])
-        so.n_tstep, = struct.unpack('i', bytes[4:8])
-
-        # If filtered, retrieve the start and interval
-        if filtered:
-            start, = struct.unpack('f', bytes[8:12])
-            interval, = struct.unpack('f', bytes[12:16])
-            so.start = int(start)
-            so.interval = int(interval)
-
-        # Get the nodeids
-        so.nodeids = struct.unpack(str(so.n_nodes) + 'I', bytes[headersize:headersize + so.n_nodes * 4])
-        so.nodeids = np.asarray(so.nodeids)
-
-        # Retrieve the data
-        so.data = struct.unpack(str(so.n_nodes * so.n_tstep) + 'f',
-                                bytes[
-                                headersize + so.n_nodes * 4:headersize + so.n_nodes * 4 + so.n_nodes * so.n_tstep * 4])
-        so.data = np.asarray(so.data)
+        # Get the nodeids and data without copying the buffer
+        so.nodeids = np.frombuffer(bytes, dtype=NODE_ID_DTYPE, count=so.n_nodes, offset=headersize)
+        so.data = np.frombuffer(bytes, dtype=DATA_DTYPE, count=so.n_nodes * so.n_tstep,
+                                offset=headersize + so.n_nodes * NODE_ID_DTYPE.itemsize)
         so.data = so.data.reshape(so.n_tstep, so.n_nodes)
+        so._decode(view)
+
+        return so
+
+    @classmethod
+    def from_file(cls, path: Union[str, os.PathLike], filtered: bool = False, view: bool = True):
+        """
+        Load from a binary file.
+
+        Args:
+            path: Path of the binary file
+            filtered: flag for applying filter
+            view: memory map the data, which is only read when accessed, instead of loading it to float64 arrays
+        """
+        with open(path, 'rb') as f:
+            header = f.read(16 if filtered else 8)
+        so = cls()
+        so.n_nodes, so.n_tstep, so.start, so.interval, headersize = cls._read_header(header, filtered)
+        so.nodeids = np.asarray(np.memmap(path, dtype=NODE_ID_DTYPE, mode='r', offset=headersize,
+                                          shape=(so.n_nodes,)))
+        if so.n_nodes * so.n_tstep:
+            so.data = np.memmap(path, dtype=DATA_DTYPE, mode='r', offset=headersize + so.n_nodes * NODE_ID_DTYPE.itemsize,
+                                shape=(so.n_tstep, so.n_nodes))
+        else:
+            # numpy can't map an empty region
+            so.data = np.empty((so.n_tstep, so.n_nodes), dtype=DATA_DTYPE)
+        so._decode(view)
+        return so
+
+    def node_indexes(self, nodes: Iterable[int]) -> np.ndarray:
+        """
+        Get the column index of nodes in data.
+
+        Args:
+            nodes: Node ids
+
+        Returns:
+            Array of column indexes
+
+        Raises:
+            KeyError - If a node is not in the output
+        """
+        nodes = np.asarray(list(nodes), dtype=np.int64)
+        order = np.argsort(self.nodeids, kind='stable')
+        sorted_ids = self.nodeids[order]
+        positions = np.searchsorted(sorted_ids, nodes)
+        found = positions < len(sorted_ids)
+        found[found] = sorted_ids[positions[found]] == nodes[found]
+        if not found.all():
+            raise KeyError(f"Nodes {nodes[~found].tolist()} are not in the spatial output")
+        return order[positions]
 
+    def select(self, nodes: Optional[Iterable[int]] = None, timesteps: Optional[Union[slice, Iterable[int]]] = None) \
+            -> 'SpatialOutput':
+        """
+        Select some nodes and/or timesteps.
+
+        Args:
+            nodes: Node ids to keep. All nodes are kept when None
+            timesteps: Slice or indexes of the timesteps to keep. All timesteps are kept when None
+
+        Returns:
+            New SpatialOutput. Data is still a view when timesteps is a slice and nodes is None
+        """
+        so = type(self)()
+        so.start, so.interval = self.start, self.interval
+        so.nodeids, so.data = self.nodeids, self.data
+        if timesteps is not None:
+            if isinstance(timesteps, slice):
+                step = timesteps.step or 1
+                first = range(self.n_tstep)[timesteps]
+                so.start = self.start + (first[0] if len(first) else 0) * self.interval
+                so.interval = self.interval * step
+            else:
+                timesteps = np.asarray(list(timesteps), dtype=int)
+            so.data = so.data[timesteps]
+        if nodes is not None:
+            indexes = self.node_indexes(nodes)
+            so.nodeids = self.nodeids[indexes]
+            so.data = so.data[:, indexes]
+        so.n_tstep, so.n_nodes = so.data.shape
         return so
 
     def to_dict(self):
@@ -0,0 +1,75 @@
+import os
+import struct
+import tempfile
+import unittest
+import allure
+import numpy as np
+import pytest
+from idmtools_platform_comps.utils.spatial_output import SpatialOutput
+
+
+def make_spatial_bytes(nodeids, data, start=None, interval=None):
+    n_tstep, n_nodes = data.shape
+    header = struct.pack('ii', n_nodes, n_tstep)
+    if start is not None:
+        header += struct.pack('ff', start, interval)
+    return header + struct.pack(f'{n_nodes}I', *nodeids) + data.astype('f').tobytes()
+
+
+@pytest.mark.smoke
+@allure.story("COMPS")
+@allure.suite("idmtools_platform_comps")
+class TestSpatialOutput(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nodeids = [30, 10, 20]
+        self.data = np.arange(12, dtype='f').reshape(4, 3)
+
+    def test_from_bytes(self):
+        so = SpatialOutput.from_bytes(make_spatial_bytes(self.nodeids, self.data))
+        self.assertEqual((so.n_tstep, so.n_nodes), (4, 3))
+        self.assertListEqual(so.nodeids.tolist(), self.nodeids)
+        np.testing.assert_array_equal(so.data, self.data)
+
+        so = SpatialOutput.from_bytes(make_spatial_bytes(self.nodeids, self.data, start=5, interval=2), filtered=True)
+        self.assertEqual((so.start, so.interval), (5, 2))
+        np.testing.assert_array_equal(so.data, self.data)
+
+    def test_view(self):
+        content = make_spatial_bytes(self.nodeids, self.data)
+        so = SpatialOutput.from_bytes(content)
+        self.assertEqual(so.data.dtype, np.float64)
+        # analyzers may update the data in place
+        so.data[0, 0] = 100
+        so = SpatialOutput.from_bytes(content, view=True)
+        self.assertEqual(so.data.dtype, np.float32)
+        self.assertFalse(so.data.flags.writeable)
+        np.testing.assert_array_equal(so.data, self.data)
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "SpatialReport_Population.bin")
+            with open(path, 'wb') as f:
+                f.write(make_spatial_bytes(self.nodeids, self.data))
+            so = SpatialOutput.from_file(path)
+            self.assertListEqual(so.nodeids.tolist(), self.nodeids)
+            np.testing.assert_array_equal(so.data, self.data)
+            del so
+            so = SpatialOutput.from_file(path, view=False)
+            self.assertEqual(so.data.dtype, np.float64)
+            np.testing.assert_array_equal(so.data, self.data)
+
+    def test_select(self):
+        so = SpatialOutput.from_bytes(make_spatial_bytes(self.nodeids, self.data, start=5, interval=2), filtered=True)
+        selected = so.select(nodes=[20, 30], timesteps=slice(1, None, 2))
+        self.assertListEqual(selected.nodeids.tolist(), [20, 30])
+        self.assertEqual((selected.n_tstep, selected.n_nodes), (2, 2))
+        self.assertEqual((selected.start, selected.interval), (7, 4))
+        np.testing.assert_array_equal(selected.data, self.data[1::2][:, [2, 0]])
+        np.testing.assert_array_equal(so.select(timesteps=[0, 3]).data, self.data[[0, 3]])
+        with self.assertRaises(KeyError):
+            so.select(nodes=[40])
+
+
+if __name__ == '__main__':
+    unittest.main()
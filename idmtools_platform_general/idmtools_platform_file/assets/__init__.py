@@ -17,7 +17,7 @@ DEFAULT_SIMULATION_TEMPLATE = Path(__file__).parent.parent.joinpath("assets/_run
 
 
 def generate_script(platform: 'FilePlatform', experiment: Experiment, max_job: int = None, run_sequence: bool = None,
-                    **kwargs) -> None:
+                    supervisor: str = None, **kwargs) -> None:
     """
     Generate batch file batch.sh.
     Args:
@@ -25,6 +25,7 @@ def generate_script(platform: 'FilePlatform', experiment: Experiment, max_job: i
         experiment: idmtools Experiment
         max_job: int
         run_sequence: bool
+        supervisor: command running the simulations in place of xargs
         kwargs: keyword arguments used to expand functionality
     Returns:
         None
@@ -42,6 +43,8 @@ def generate_script(platform: 'FilePlatform', experiment: Experiment, max_job: i
                 tvars['modules'] = platform.modules
             if platform.extra_packages:
                 tvars['packages'] = platform.extra_packages
+            if supervisor:
+                tvars['supervisor'] = supervisor
             tout.write(t.render(tvars))
 
     # Make executable
@@ -6,11 +6,14 @@ Copyright 2025, Gates Foundation. All rights reserved.
 import os
 import shlex
 import shutil
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from logging import getLogger
 from pathlib import Path
-from typing import Union
+from typing import Union, Dict, Set, Tuple, Optional
 from idmtools.core import ItemType, EntityStatus
+from idmtools.core.interfaces.ientity import IEntity
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
@@ -23,12 +26,20 @@ from idmtools.utils.decorators import check_symlink_capabilities, cache_director
 logger = getLogger(__name__)
 user_logger = getLogger('user')
 
+# Number of experiments whose simulation statuses are cached
+STATUS_CACHE_EXPERIMENTS = 16
+# Status file path -> ((st_mtime_ns, st_size), status) of the last read
+StatusCache = Dict[str, Tuple[Tuple[int, int], EntityStatus]]
+
 
 @dataclass
 class FileOperations(IOperations):
     """
     Implement operations_interface.
     """
+    # Experiment directory -> status cache of its simulations, least recently polled first
+    _status_cache: 'OrderedDict[str, StatusCache]' = field(default_factory=OrderedDict, init=False, repr=False,
+                                                           compare=False)
 
     def entity_display_name(self, item: Union[Suite, Experiment, Simulation]) -> str:
         """
@@ -92,9 +103,9 @@ class FileOperations(IOperations):
         Returns:
             item file directory
         """
-        metas = self.platform._metas.filter(item_type=item_type, property_filter={'id': str(item_id)})
-        if len(metas) > 0:
-            return Path(metas[0]['dir'])
+        item_dir = self.platform._metas.get_directory_by_id(str(item_id), item_type)
+        if item_dir is not None:
+            return Path(item_dir)
         else:
             raise RuntimeError(f"Not found path for item_id: {item_id} with type: {item_type}.")
 
@@ -244,6 +255,40 @@ class FileOperations(IOperations):
         except:
             logger.debug(f"Failed to change file mode for executable: {exe}")
 
+    @staticmethod
+    def _read_status_file(job_status_path: Union[Path, str], cache: Optional[StatusCache] = None) -> EntityStatus:
+        """
+        Read simulation status from job_status.txt.
+        With a cache, the file is only re-read when its modification time or size changed since the last read.
+        Args:
+            job_status_path: path of job_status.txt
+            cache: status cache of the experiment of the simulation
+        Returns:
+            EntityStatus
+        """
+        job_status_path = str(job_status_path)
+        try:
+            stat = os.stat(job_status_path)
+        except FileNotFoundError:
+            if cache is not None:
+                cache.pop(job_status_path, None)
+            return FILE_MAPS['None']
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(job_status_path) if cache is not None else None
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(job_status_path) as f:
+            status = f.read().strip()
+        if status in ['100', '0', '-1']:
+            status = FILE_MAPS[status]
+        else:
+            status = FILE_MAPS['100']  # To be safe
+        if cache is not None:
+            cache[job_status_path] = (signature, status)
+        return status
+
     def get_simulation_status(self, sim_id: str, **kwargs) -> EntityStatus:
         """
         Retrieve simulation status.
@@ -256,17 +301,89 @@ class FileOperations(IOperations):
         sim_dir = self.get_directory_by_id(sim_id, ItemType.SIMULATION)
 
         # Check process status
-        job_status_path = sim_dir.joinpath('job_status.txt')
-        if job_status_path.exists():
-            status = open(job_status_path).read().strip()
-            if status in ['100', '0', '-1']:
-                status = FILE_MAPS[status]
-            else:
-                status = FILE_MAPS['100']  # To be safe
+        return self._read_status_file(sim_dir.joinpath('job_status.txt'))
+
+    @staticmethod
+    def _get_simulation_ids(experiment: Union[Experiment, FileExperiment]) -> Set[str]:
+        """
+        Get simulation ids of an experiment without resolving the simulation objects.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+        Returns:
+            set of simulation ids
+        """
+        if isinstance(experiment, FileExperiment):
+            sims = experiment._metas.get('simulations', [])
         else:
-            status = FILE_MAPS['None']
+            sims = experiment.simulations
+        return {str(sim.id) if isinstance(sim, IEntity) else str(sim) for sim in sims}
 
-        return status
+    @staticmethod
+    def _match_simulation_id(dir_name: str, sim_ids: Set[str]) -> Union[str, None]:
+        """
+        Find the simulation id of a simulation directory name ('<id>' or '<name>_<id>').
+        Args:
+            dir_name: simulation directory name
+            sim_ids: set of simulation ids
+        Returns:
+            simulation id or None if the directory doesn't belong to any of the simulations
+        """
+        if dir_name in sim_ids:
+            return dir_name
+        pos = dir_name.find('_')
+        while pos != -1:
+            if dir_name[pos + 1:] in sim_ids:
+                return dir_name[pos + 1:]
+            pos = dir_name.find('_', pos + 1)
+        return None
+
+    def get_simulation_statuses(self, experiment: Union[Experiment, FileExperiment], max_workers: int = None,
+                                **kwargs) -> Dict[str, EntityStatus]:
+        """
+        Retrieve the status of all simulations of an experiment in bulk.
+
+        The experiment directory is scanned once and the status files are read with a bounded thread pool.
+        Status files unchanged since the last poll are not re-read. Only the statuses of the simulations of the last
+        STATUS_CACHE_EXPERIMENTS polled experiments are cached.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+            max_workers: maximum number of threads used to read status files
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Dict of simulation id as key and EntityStatus as value
+        """
+        sim_ids = self._get_simulation_ids(experiment)
+        if not sim_ids:
+            return {}
+
+        sim_dirs = {}
+        exp_dir = self.get_directory(experiment)
+        if os.path.isdir(exp_dir):
+            with os.scandir(exp_dir) as entries:
+                for entry in entries:
+                    if entry.name == 'Assets' or not entry.is_dir():
+                        continue
+                    sim_id = self._match_simulation_id(entry.name, sim_ids)
+                    if sim_id is not None:
+                        sim_dirs[sim_id] = entry.path
+
+        # Simulations not located under the experiment directory
+        for sim_id in sim_ids.difference(sim_dirs):
+            sim_dirs[sim_id] = str(self.get_directory_by_id(sim_id, ItemType.SIMULATION))
+
+        if max_workers is None:
+            max_workers = getattr(self.platform, 'max_status_workers', 16)
+        ids = list(sim_dirs)
+        paths = [os.path.join(sim_dirs[sim_id], 'job_status.txt') for sim_id in ids]
+        # keep the entries of the simulations polled now only
+        previous = self._status_cache.pop(str(exp_dir), {})
+        cache = {path: previous[path] for path in paths if path in previous}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as pool:
+            statuses = list(pool.map(lambda path: self._read_status_file(path, cache), paths))
+        self._status_cache[str(exp_dir)] = cache
+        while len(self._status_cache) > STATUS_CACHE_EXPERIMENTS:
+            self._status_cache.popitem(last=False)
+        return dict(zip(ids, statuses))
 
     def create_file(self, file_path: str, content: str) -> None:
         """
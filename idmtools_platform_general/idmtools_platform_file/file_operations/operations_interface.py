@@ -6,7 +6,7 @@ Copyright 2025, Gates Foundation. All rights reserved.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Type, Union, Any
+from typing import Type, Union, Any, Dict
 from idmtools.core import ItemType
 from idmtools.core.interfaces.ientity import IEntity
 from idmtools.entities.simulation import Simulation
@@ -68,6 +68,11 @@ class IOperations(ABC):
         """Get simulation status."""
         pass
 
+    @abstractmethod
+    def get_simulation_statuses(self, experiment: IEntity, **kwargs) -> Dict[str, Any]:
+        """Get the status of all simulations of an experiment."""
+        pass
+
     @abstractmethod
     def create_file(self, file_path: str, content: str) -> None:
         """Create file."""
@@ -6,10 +6,11 @@ Copyright 2025, Gates Foundation. All rights reserved.
 import os
 from pathlib import Path
 from logging import getLogger
-from typing import Union, List
+from typing import Union, List, Dict, Optional
 from dataclasses import dataclass, field
 
 from idmtools import IdmConfigParser
+from idmtools.analysis.analysis_item_ref import AnalysisItemRef
 from idmtools.core import ItemType, EntityStatus, TRUTHY_VALUES
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
@@ -48,6 +49,8 @@ class FilePlatform(IPlatform):
     # extra packages to install
     extra_packages: list = field(default_factory=list, metadata=dict(help="Extra packages to install"))
     maxlen: int = field(default=30, metadata=dict(help="Maximum length of suite/experiment name"))
+    max_status_workers: int = field(default=16,
+                                    metadata=dict(help="Maximum number of threads used to read simulation status files"))
 
     _suites: FilePlatformSuiteOperations = field(**op_defaults, repr=False, init=False)
     _experiments: FilePlatformExperimentOperations = field(**op_defaults, repr=False, init=False)
@@ -97,14 +100,18 @@ class FilePlatform(IPlatform):
         """
         self._op_client.mk_directory(item, dest, exist_ok)
 
-    def get_directory(self, item: Union[Suite, Experiment, Simulation]) -> Path:
+    def get_directory(self, item: Union[Suite, Experiment, Simulation, AnalysisItemRef]) -> Path:
         """
         Get item's path.
         Args:
-            item: Suite, Experiment, Simulation
+            item: Suite, Experiment, Simulation or AnalysisItemRef
         Returns:
             item file directory
         """
+        if isinstance(item, AnalysisItemRef):
+            if item.location:
+                return Path(item.location)
+            return self.get_directory_by_id(item.uid, item.item_type)
         return self._op_client.get_directory(item)
 
     def get_directory_by_id(self, item_id: str, item_type: ItemType) -> Path:
@@ -234,6 +241,23 @@ class FilePlatform(IPlatform):
                     result = True
         return result
 
+    def to_analysis_item_ref(self, item: Union[Simulation, FileSimulation]) -> Optional[AnalysisItemRef]:
+        """
+        Build the lightweight reference of a simulation sent to analysis workers.
+        Args:
+            item: Simulation or FileSimulation
+        Returns:
+            AnalysisItemRef with the simulation directory as location, or None for other items
+        """
+        if isinstance(item, FileSimulation):
+            location = str(item.get_directory())
+        elif isinstance(item, Simulation):
+            location = None
+        else:
+            return None
+        return AnalysisItemRef(item.id, ItemType.SIMULATION, name=item.name, tags=item.tags, status=item.status,
+                               parent_id=item.parent_id, location=location)
+
     def link_file(self, target: Union[Path, str], link: Union[Path, str]) -> None:
         """
         Link files.
@@ -277,6 +301,17 @@ class FilePlatform(IPlatform):
         """
         return self._op_client.get_simulation_status(sim_id, **kwargs)
 
+    def get_simulation_statuses(self, experiment: Union[Experiment, FileExperiment], **kwargs) -> Dict[str, EntityStatus]:
+        """
+        Retrieve the status of all simulations of an experiment in bulk.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Dict of simulation id as key and EntityStatus as value
+        """
+        return self._op_client.get_simulation_statuses(experiment, **kwargs)
+
     def entity_display_name(self, item: Union[Suite, Experiment, Simulation]) -> str:
         """
         Get display name for entity.
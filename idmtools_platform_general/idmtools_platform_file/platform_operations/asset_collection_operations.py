@@ -3,17 +3,20 @@ Here we implement the FilePlatform asset collection operations.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import glob
 import shutil
 from uuid import UUID
 from pathlib import Path
 from dataclasses import field, dataclass
 from logging import getLogger
 from typing import TYPE_CHECKING, Type, List, Dict, Union, Optional
+from idmtools.analysis.analysis_item_ref import AnalysisItemRef
 from idmtools.core import ItemType
 from idmtools.assets import AssetCollection, Asset
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.iplatform_ops.iplatform_asset_collection_operations import IPlatformAssetCollectionOperations
+from idmtools.utils.file import map_file, read_file
 from idmtools_platform_file.platform_operations.utils import FileSimulation, validate_file_copy_path_length, \
     validate_file_path_length
 
@@ -73,30 +76,34 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
         self.platform.link_dir(common_asset_dir, link_dir)
 
     @staticmethod
-    def _get_assets_from_dir(sim_dir: Path, files: List[str]) -> Dict[str, bytearray]:
+    def _get_assets_from_dir(sim_dir: Path, files: List[str], as_view: bool = False) -> Dict[str, Union[bytearray, memoryview]]:
         ret = {}
         for file in files:
             asset_file = sim_dir / file
-            if asset_file.exists():
-                asset = Asset(absolute_path=asset_file.absolute())
-                ret[file] = bytearray(asset.bytes)
+            if asset_file.is_file():
+                # files are read once into their buffer, or mapped without being read at all
+                ret[file] = map_file(asset_file) if as_view else read_file(asset_file)
             else:
                 raise RuntimeError(f"Couldn't find asset for path '{file}'.")
         return ret
 
-    def get_assets(self, simulation: Union[Simulation, FileSimulation], files: List[str], **kwargs) -> Dict[str, bytearray]:
+    def get_assets(self, simulation: Union[Simulation, FileSimulation, AnalysisItemRef], files: List[str], **kwargs) -> Dict[str, bytearray]:
         """
         Get assets for simulation.
         Args:
-            simulation: Simulation or FileSimulation
+            simulation: Simulation, FileSimulation or AnalysisItemRef
             files: files to be retrieved
-            kwargs: keyword arguments used to expand functionality.
+            kwargs: keyword arguments used to expand functionality. When as_view is True, files are memory mapped and
+                returned as read-only memoryview instead of being read into a bytearray
         Returns:
-            Dict[str, bytearray]
+            Dict[str, bytearray], or Dict[str, memoryview] when as_view is True
         """
-        if isinstance(simulation, (Simulation, FileSimulation)):
+        as_view = kwargs.get('as_view', False)
+        if isinstance(simulation, AnalysisItemRef):
+            return self._get_assets_from_dir(self.platform.get_directory(simulation), files, as_view)
+        elif isinstance(simulation, (Simulation, FileSimulation)):
             sim_dir = self.platform.get_directory_by_id(simulation.id, ItemType.SIMULATION)
-            return self._get_assets_from_dir(sim_dir, files)
+            return self._get_assets_from_dir(sim_dir, files, as_view)
         else:
             raise NotImplementedError(
                 f"get_assets() for items of type {type(simulation)} is not supported on FilePlatform.")
@@ -107,19 +114,23 @@ class FilePlatformAssetCollectionOperations(IPlatformAssetCollectionOperations):
         Args:
             item: Experiment/Simulation
             exclude: list of file path
-            kwargs: keyword arguments used to expand functionality.
+            kwargs: keyword arguments used to expand functionality. include, workers and checksums are passed to
+                :meth:`~idmtools.assets.asset_collection.AssetCollection.iter_assets_from_directory`
         Returns:
             list of Asset
         """
         exclude = exclude if exclude is not None else EXCLUDE_FILES
+        if isinstance(exclude, str):
+            exclude = [exclude]
+        scan_options = {k: kwargs[k] for k in ('include', 'workers', 'checksums') if k in kwargs}
         if isinstance(item, Experiment):
             assets_dir = Path(self.platform.get_directory(item), 'Assets')
-            return AssetCollection.assets_from_directory(assets_dir, recursive=True)
+            return AssetCollection.assets_from_directory(assets_dir, recursive=True, **scan_options)
         elif isinstance(item, Simulation):
             assets_dir = self.platform.get_directory(item)
-            asset_list = AssetCollection.assets_from_directory(assets_dir, recursive=True)
-            assets = [asset for asset in asset_list if asset.filename not in exclude]
-            return assets
+            # excluded files are skipped while the directory is scanned
+            return AssetCollection.assets_from_directory(assets_dir, recursive=True,
+                                                         exclude=[glob.escape(f) for f in exclude], **scan_options)
         else:
             raise NotImplementedError("List assets for this item is not supported on FilePlatform.")
 
@@ -83,9 +83,10 @@ class FilePlatformExperimentOperations(IPlatformExperimentOperations):
         """
         sim_list = []
         sim_meta_list = self.platform._metas.get_children(experiment)
+        statuses = self.platform.get_simulation_statuses(experiment) if sim_meta_list else {}
         for meta in sim_meta_list:
             file_sim = FileSimulation(meta)
-            file_sim.status = self.platform.get_simulation_status(file_sim.id)
+            file_sim.status = statuses.get(file_sim.id) or self.platform.get_simulation_status(file_sim.id)
             if raw:
                 sim_list.append(file_sim)
             else:
@@ -221,9 +222,10 @@ class FilePlatformExperimentOperations(IPlatformExperimentOperations):
         Returns:
             Dict of simulation id as key and working dir as value
         """
-        # Refresh status for each simulation
+        # Refresh status for all simulations at once
+        statuses = self.platform.get_simulation_statuses(experiment, **kwargs)
         for sim in experiment.simulations:
-            sim.status = self.platform.get_simulation_status(sim.id, **kwargs)
+            sim.status = statuses[sim.id]
 
     def create_sim_directory_map(self, experiment_id: str) -> Dict:
         """
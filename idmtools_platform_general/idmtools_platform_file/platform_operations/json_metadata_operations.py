@@ -14,6 +14,7 @@ from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.utils.json import IDMJSONEncoder
+from idmtools_platform_file.platform_operations.metadata_index import MetadataIndex
 from idmtools_platform_file.platform_operations.utils import FileSuite, FileExperiment
 
 if TYPE_CHECKING:
@@ -28,6 +29,60 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
     platform: 'FilePlatform'  # noqa: F821
     platform_type: Type = field(default=None)
     metadata_filename: str = field(default='metadata.json')
+    _index: MetadataIndex = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def index(self) -> MetadataIndex:
+        """
+        Persistent id to directory index of the platform job directory.
+        Returns:
+            MetadataIndex
+        """
+        if self._index is None:
+            self._index = MetadataIndex(self.platform.job_directory, metadata_filename=self.metadata_filename)
+        return self._index
+
+    @staticmethod
+    def _item_type(item: Union[Suite, Experiment, Simulation]) -> ItemType:
+        """
+        Utility: get ItemType of an entity.
+        Args:
+            item: idmtools entity (Suite, Experiment and Simulation)
+        Returns:
+            ItemType
+        """
+        if isinstance(item, Suite):
+            return ItemType.SUITE
+        elif isinstance(item, Experiment):
+            return ItemType.EXPERIMENT
+        return ItemType.SIMULATION
+
+    def _update_index(self, item: Union[Suite, Experiment, Simulation], meta: Dict, meta_file: Path) -> None:
+        """
+        Utility: keep the id index in sync with item's metadata file.
+        Args:
+            item: idmtools entity (Suite, Experiment and Simulation)
+            meta: metadata written to meta_file
+            meta_file: metadata file path
+        Returns:
+            None
+        """
+        item_type = self._item_type(item)
+        if meta.get('id') is not None:
+            self.index.add(item_type, meta['id'], meta_file.parent)
+        else:
+            self.index.remove(item_type, item.id)
+
+    def get_directory_by_id(self, item_id: str, item_type: ItemType) -> Union[Path, None]:
+        """
+        Look up item's directory in the id index.
+        Args:
+            item_id: item id
+            item_type: the type of item (simulation, experiment, suite)
+        Returns:
+            item directory or None if item can't be found
+        """
+        return self.index.get(item_type, item_id)
 
     @staticmethod
     def _read_from_file(filepath: Union[Path, str]) -> Dict:
@@ -129,6 +184,7 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
         dest = self.get_metadata_filepath(item)
         meta = self.get(item)
         self._write_to_file(dest, meta)
+        self._update_index(item, meta, dest)
 
         # Also write tags.json file
         keys_to_extract = ["id", "item_type", "tags"]
@@ -185,6 +241,7 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
             meta.update(metadata)
         meta_file = self.get_metadata_filepath(item)
         self._write_to_file(meta_file, meta)
+        self._update_index(item, meta, meta_file)
 
     def clear(self, item: Union[Suite, Experiment, Simulation]) -> None:
         """
@@ -226,6 +283,7 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
     def get_all(self, item_type: ItemType, item_id: str = '') -> List[Dict]:
         """
         Obtain all the metadata for a given item type.
+        Lookups by item_id are served from the id index, which scans the job directory for unknown ids.
         Args:
             item_type: the type of metadata to search for matches (simulation, experiment, suite, etc.)
             item_id: item id
@@ -235,6 +293,12 @@ class JSONMetadataOperations(imetadata_operations.IMetadataOperations):
         root = Path(self.platform.job_directory)
         item_list = []
 
+        if item_id and item_type in (ItemType.SUITE, ItemType.EXPERIMENT, ItemType.SIMULATION):
+            item_dir = self.get_directory_by_id(item_id, item_type)
+            if item_dir is None:
+                return []
+            return [self.load_from_file(Path(item_dir, self.metadata_filename))]
+
         if item_type is ItemType.SIMULATION:
             # Match sim under experiment, under optional suite
             patterns = [
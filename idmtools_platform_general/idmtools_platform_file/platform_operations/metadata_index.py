@@ -0,0 +1,273 @@
+"""
+Here we implement the persistent id index used by the File Platform metadata operations.
+
+The index is an append-only JSONL file stored under the job directory. Every line records the directory
+(relative to the job directory) of a suite/experiment/simulation, or a tombstone when the item's metadata is cleared.
+Lookups are served from memory; new lines appended by other processes are picked up incrementally. The index is built
+from the job tree when it is missing, and unknown or stale ids are looked up in the job tree one at a time. The file is
+only ever appended to, so lines written concurrently by other processes are never lost.
+
+Copyright 2025, Gates Foundation. All rights reserved.
+"""
+import os
+import json
+import threading
+from pathlib import Path
+from logging import getLogger
+from typing import Dict, List, Optional, Tuple, Union
+from idmtools.core import ItemType
+
+logger = getLogger(__name__)
+
+INDEX_FILENAME = '.metadata_index.jsonl'
+
+# Relative glob patterns (from the job directory) of item directories, per item type
+ITEM_DIR_PATTERNS = {
+    ItemType.SUITE: ["s_*"],
+    ItemType.EXPERIMENT: ["s_*/e_*", "e_*"],
+    ItemType.SIMULATION: ["s_*/e_*/*", "e_*/*"]
+}
+
+
+class MetadataIndex:
+    """
+    Persistent id -> directory index for File Platform items.
+    """
+
+    def __init__(self, job_directory: Union[Path, str], metadata_filename: str = 'metadata.json'):
+        """
+        Constructor.
+        Args:
+            job_directory: platform job directory
+            metadata_filename: name of the metadata file stored in each item directory
+        """
+        self.job_directory = Path(job_directory)
+        self.metadata_filename = metadata_filename
+        self.index_file = self.job_directory.joinpath(INDEX_FILENAME)
+        self._entries: Dict[Tuple[str, str], str] = {}
+        self._offset = 0
+        self._inode = None
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(item_type: ItemType, item_id: str) -> Tuple[str, str]:
+        """
+        Utility: build index key.
+        Args:
+            item_type: ItemType
+            item_id: item id
+        Returns:
+            tuple of (item type, item id)
+        """
+        return ItemType(item_type).value, str(item_id)
+
+    def _relative(self, item_dir: Union[Path, str]) -> str:
+        """
+        Utility: convert a directory to a path relative to the job directory when possible.
+        Args:
+            item_dir: item directory
+        Returns:
+            relative (posix) path or absolute path if item_dir is outside the job directory
+        """
+        item_dir = Path(os.path.abspath(item_dir))
+        try:
+            return item_dir.relative_to(os.path.abspath(self.job_directory)).as_posix()
+        except ValueError:
+            return str(item_dir)
+
+    def _append(self, records) -> None:
+        """
+        Utility: append records to the index file and load them into the in-memory index.
+        Args:
+            records: list of dict records
+        Returns:
+            None
+        """
+        if not records:
+            return
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock:
+            # Pick up lines written by other processes first so our offset stays accurate
+            self._sync()
+            self.job_directory.mkdir(parents=True, exist_ok=True)
+            with self.index_file.open(mode='a') as f:
+                f.write(lines)
+            self._sync()
+
+    def _apply(self, record: Dict) -> None:
+        """
+        Utility: apply a single record to the in-memory index.
+        Args:
+            record: dict with keys 'type', 'id' and 'dir' (None for tombstone)
+        Returns:
+            None
+        """
+        key = (record['type'], record['id'])
+        if record.get('dir') is None:
+            self._entries.pop(key, None)
+        else:
+            self._entries[key] = record['dir']
+
+    def _sync(self) -> None:
+        """
+        Read the lines appended to the index file since the last read.
+        The whole file is re-read if it was replaced or truncated.
+        Returns:
+            None
+        """
+        try:
+            stat = self.index_file.stat()
+        except FileNotFoundError:
+            self._entries.clear()
+            self._offset = 0
+            self._inode = None
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._entries.clear()
+            self._offset = 0
+            self._inode = stat.st_ino
+
+        if stat.st_size == self._offset:
+            return
+
+        with self.index_file.open(mode='rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Only consume complete lines, a writer may still be appending the last one
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError):
+                logger.debug(f"Skip malformed metadata index line: {line}")
+        self._offset += end
+
+    def add(self, item_type: ItemType, item_id: str, item_dir: Union[Path, str]) -> None:
+        """
+        Record item's directory.
+        Args:
+            item_type: ItemType
+            item_id: item id
+            item_dir: item directory
+        Returns:
+            None
+        """
+        item_type, item_id = self._key(item_type, item_id)
+        rel_dir = self._relative(item_dir)
+        with self._lock:
+            self._sync()
+            if self._entries.get((item_type, item_id)) == rel_dir:
+                return
+            self._append([dict(type=item_type, id=item_id, dir=rel_dir)])
+
+    def remove(self, item_type: ItemType, item_id: str) -> None:
+        """
+        Remove item from the index.
+        Args:
+            item_type: ItemType
+            item_id: item id
+        Returns:
+            None
+        """
+        item_type, item_id = self._key(item_type, item_id)
+        with self._lock:
+            self._sync()
+            if (item_type, item_id) not in self._entries:
+                return
+            self._append([dict(type=item_type, id=item_id, dir=None)])
+
+    def _resolve(self, item_type: ItemType, item_id: str) -> Optional[Path]:
+        """
+        Utility: resolve item's directory from the in-memory index.
+        Args:
+            item_type: ItemType
+            item_id: item id
+        Returns:
+            item directory if indexed and its metadata file still exists, otherwise None
+        """
+        rel_dir = self._entries.get(self._key(item_type, item_id))
+        if rel_dir is None:
+            return None
+        item_dir = self.job_directory.joinpath(rel_dir)
+        if not item_dir.joinpath(self.metadata_filename).exists():
+            return None
+        return item_dir
+
+    def get(self, item_type: ItemType, item_id: str) -> Optional[Path]:
+        """
+        Get item's directory.
+        The index is built from the job directory when it doesn't exist yet. An unknown or stale item is looked up in
+        the job directory by its id only, and recorded when found.
+        Args:
+            item_type: ItemType
+            item_id: item id
+        Returns:
+            item directory or None if item can't be found
+        """
+        with self._lock:
+            self._sync()
+            item_dir = self._resolve(item_type, item_id)
+            if item_dir is not None:
+                return item_dir
+            if not self.index_file.exists():
+                self.rebuild()
+                return self._resolve(item_type, item_id)
+        records = self._scan(item_type, str(item_id))
+        self._store(records)
+        return self.job_directory.joinpath(records[0]['dir']) if records else None
+
+    def _scan(self, item_type: ItemType = None, item_id: str = '') -> List[Dict]:
+        """
+        Utility: find item directories in the job directory.
+        Args:
+            item_type: only scan directories of this type, all types if None
+            item_id: only scan directories whose name ends with this id
+        Returns:
+            list of dict records
+        """
+        records = []
+        item_types = [ItemType(item_type)] if item_type is not None else list(ITEM_DIR_PATTERNS)
+        for item_type in item_types:
+            for pattern in ITEM_DIR_PATTERNS[item_type]:
+                if item_id:
+                    # the patterns end with a wildcard matching the optional name prefix of the directory
+                    pattern = f"{pattern}{item_id}"
+                for meta_file in self.job_directory.glob(f"{pattern}/{self.metadata_filename}"):
+                    try:
+                        with meta_file.open(mode='r') as f:
+                            meta = json.load(f)
+                    except (OSError, ValueError) as e:
+                        logger.debug(f"Failed to load metadata from {meta_file}: {e}")
+                        continue
+                    if meta.get('item_type') != item_type.value or 'id' not in meta:
+                        continue
+                    if item_id and str(meta['id']) != item_id:
+                        continue
+                    records.append(dict(type=item_type.value, id=str(meta['id']),
+                                        dir=self._relative(meta_file.parent)))
+        return records
+
+    def _store(self, records: List[Dict]) -> None:
+        """
+        Utility: append the records that are not in the index yet.
+        Args:
+            records: list of dict records
+        Returns:
+            None
+        """
+        with self._lock:
+            self._sync()
+            self._append([r for r in records if self._entries.get((r['type'], r['id'])) != r['dir']])
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the index by scanning the job directory.
+        The items that are missing or stale in the index are appended to it. The file is never replaced so lines
+        appended concurrently by other processes are kept.
+        Returns:
+            None
+        """
+        if not self.job_directory.exists():
+            return
+        self._store(self._scan())
@@ -0,0 +1,358 @@
+"""
+Here we implement the ProcessPlatform executor.
+
+The executor runs the _run.sh script of every simulation of an experiment in a pool of subprocesses. A supervisor loop
+starts the simulations in priority order as long as the cores and memory they reserve are free on the node, stops the
+simulations that run longer than the timeout, retries the failed ones and writes job_status.txt atomically.
+
+The supervisor reads the executor.json manifest of the experiment and runs detached from the submitting process::
+
+    python -m idmtools_platform_process.executor <experiment directory>
+
+Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
+"""
+import heapq
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODULE = "idmtools_platform_process.executor"
+EXECUTOR_FILE = "executor.json"
+JOB_STATUS_FILE = "job_status.txt"
+JOB_ID_FILE = "job_id.txt"
+
+STATUS_RUNNING = "100"
+STATUS_SUCCEEDED = "0"
+STATUS_FAILED = "-1"
+
+
+def write_atomic(path: Union[str, Path], content: str) -> None:
+    """
+    Write a small file atomically so readers never see it partially written.
+
+    Args:
+        path: path of the file
+        content: content of the file
+
+    Returns:
+        None
+    """
+    path = str(path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def is_executor_process(pid: int, experiment_directory: Union[str, Path]) -> bool:
+    """
+    Check that a process is the executor of an experiment, and not an unrelated process that reused its PID.
+
+    The process is either the executor itself or the batch.sh script that starts it in the experiment directory.
+
+    Args:
+        pid: process id
+        experiment_directory: experiment directory
+
+    Returns:
+        True if the process is the executor of the experiment
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            args = [arg.decode(errors="replace") for arg in f.read().split(b"\0") if arg]
+        if EXECUTOR_MODULE in args:
+            directory = args[-1]
+        elif "batch.sh" in args:
+            directory = os.readlink(f"/proc/{pid}/cwd")
+        else:
+            return False
+        return os.path.samefile(directory, experiment_directory)
+    except OSError:
+        return False
+
+
+def get_total_memory() -> Optional[int]:
+    """
+    Get the physical memory of the node.
+
+    Returns:
+        Memory in MB or None when it cannot be determined
+    """
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+@dataclass
+class SimulationJob:
+    """
+    A simulation run by the ProcessExecutor.
+    """
+    id: str
+    directory: str
+    cores: int = 1
+    # memory reserved for the simulation in MB
+    memory: int = 0
+    # simulations with a higher priority are started first
+    priority: int = 0
+    attempts: int = 0
+    process: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+    started: float = field(default=0, repr=False, compare=False)
+    killed: float = field(default=0, repr=False, compare=False)
+
+
+class ProcessExecutor:
+    """
+    Run simulations in subprocesses within the cores and memory of the node.
+    """
+
+    def __init__(self, max_cores: int = None, max_memory: int = None, max_job: int = None, timeout: int = None,
+                 retries: int = 1, kill_timeout: int = 10, poll_interval: float = 0.5):
+        """
+        Initialize the executor.
+
+        Args:
+            max_cores: Number of cores the simulations may use. Defaults to the number of cpus
+            max_memory: Memory in MB the simulations may use. Defaults to the physical memory of the node
+            max_job: Maximum number of simulations running at the same time. Defaults to no limit
+            timeout: Seconds a simulation may run before it is stopped and considered failed. Defaults to no limit
+            retries: Number of times a simulation is run before it is considered failed
+            kill_timeout: Seconds to wait for a stopped simulation to exit before it is killed
+            poll_interval: Seconds between two checks of the running simulations
+        """
+        self.max_cores = max_cores or os.cpu_count() or 1
+        self.max_memory = max_memory or get_total_memory()
+        self.max_job = max_job
+        self.timeout = timeout
+        self.retries = max(1, retries or 1)
+        self.kill_timeout = kill_timeout
+        self.poll_interval = poll_interval
+        self.statuses: Dict[str, str] = {}
+        self._pending: List = []
+        self._running: Dict[str, SimulationJob] = {}
+        self._order = 0
+        self._stopped = False
+
+    @property
+    def used_cores(self) -> int:
+        """
+        Cores reserved by the running simulations.
+
+        Returns:
+            Number of cores
+        """
+        return sum(job.cores for job in self._running.values())
+
+    @property
+    def used_memory(self) -> int:
+        """
+        Memory reserved by the running simulations.
+
+        Returns:
+            Memory in MB
+        """
+        return sum(job.memory for job in self._running.values())
+
+    @property
+    def pids(self) -> Dict[str, int]:
+        """
+        Process ids of the running simulations.
+
+        Returns:
+            Dict of simulation id to pid
+        """
+        return {sim_id: job.process.pid for sim_id, job in self._running.items()}
+
+    def submit(self, job: SimulationJob) -> None:
+        """
+        Queue a simulation.
+
+        A simulation reserving more than the whole node is run alone.
+
+        Args:
+            job: SimulationJob
+
+        Returns:
+            None
+        """
+        job.cores = min(max(1, job.cores), self.max_cores)
+        if self.max_memory:
+            job.memory = min(max(0, job.memory), self.max_memory)
+        # ties keep the submission order
+        heapq.heappush(self._pending, (-job.priority, self._order, job))
+        self._order += 1
+
+    def run(self, jobs: Iterable[SimulationJob] = None) -> Dict[str, str]:
+        """
+        Run the queued simulations until they are all done.
+
+        Args:
+            jobs: simulations to queue before running
+
+        Returns:
+            Dict of simulation id to final status code
+        """
+        for job in jobs or []:
+            self.submit(job)
+        while (self._pending or self._running) and not self._stopped:
+            self._check_running()
+            self._start_pending()
+            if self._pending or self._running:
+                time.sleep(self.poll_interval)
+        if self._stopped:
+            self._terminate()
+        return self.statuses
+
+    def stop(self, *args) -> None:
+        """
+        Stop the executor. The running simulations are stopped and every simulation that is not done fails.
+
+        Can be used as a signal handler.
+
+        Args:
+            args: signal handler arguments
+
+        Returns:
+            None
+        """
+        self._stopped = True
+
+    def _terminate(self) -> None:
+        for job in self._running.values():
+            self._signal(job, signal.SIGTERM)
+        for job in self._running.values():
+            try:
+                job.process.wait(self.kill_timeout)
+            except subprocess.TimeoutExpired:
+                self._signal(job, signal.SIGKILL)
+            self._set_status(job, STATUS_FAILED)
+        for _, _, job in self._pending:
+            self._set_status(job, STATUS_FAILED)
+        self._running.clear()
+        self._pending.clear()
+
+    def _fits(self, job: SimulationJob) -> bool:
+        if self.max_job and len(self._running) >= self.max_job:
+            return False
+        if self.used_cores + job.cores > self.max_cores:
+            return False
+        return not self.max_memory or self.used_memory + job.memory <= self.max_memory
+
+    def _start_pending(self) -> None:
+        # start in strict priority order so simulations reserving many cores are not starved by small ones
+        while self._pending and self._fits(self._pending[0][2]):
+            _, _, job = heapq.heappop(self._pending)
+            self._start(job)
+
+    def _start(self, job: SimulationJob) -> None:
+        job.attempts += 1
+        job.killed = 0
+        self._set_status(job, STATUS_RUNNING)
+        mode = "w" if job.attempts == 1 else "a"
+        env = dict(os.environ, JOB_STATUS_FILE=os.devnull)
+        with open(os.path.join(job.directory, "stdout.txt"), mode) as out, \
+                open(os.path.join(job.directory, "stderr.txt"), mode) as err:
+            try:
+                # a new session lets us stop the simulation together with the processes it started
+                job.process = subprocess.Popen(["bash", "_run.sh"], cwd=job.directory, stdout=out, stderr=err,
+                                               env=env, start_new_session=True)
+            except OSError as e:
+                err.write(f"Could not start the simulation: {e}\n")
+                self._set_status(job, STATUS_FAILED)
+                return
+        job.started = time.monotonic()
+        write_atomic(os.path.join(job.directory, JOB_ID_FILE), str(job.process.pid))
+        self._running[job.id] = job
+        logger.info(f"Started simulation {job.id} (attempt {job.attempts}) with PID {job.process.pid}")
+
+    def _check_running(self) -> None:
+        now = time.monotonic()
+        for job in list(self._running.values()):
+            returncode = job.process.poll()
+            if returncode is None:
+                if job.killed:
+                    if now - job.killed > self.kill_timeout:
+                        self._signal(job, signal.SIGKILL)
+                elif self.timeout and now - job.started > self.timeout:
+                    logger.warning(f"Simulation {job.id} exceeded the timeout of {self.timeout}s")
+                    job.killed = now
+                    self._signal(job, signal.SIGTERM)
+                continue
+            del self._running[job.id]
+            if returncode == 0 and not job.killed:
+                self._set_status(job, STATUS_SUCCEEDED)
+            elif job.attempts < self.retries:
+                logger.warning(f"Simulation {job.id} failed with exit code {returncode}, retrying")
+                heapq.heappush(self._pending, (-job.priority, self._order, job))
+                self._order += 1
+            else:
+                logger.error(f"Simulation {job.id} failed with exit code {returncode}")
+                self._set_status(job, STATUS_FAILED)
+
+    def _set_status(self, job: SimulationJob, status: str) -> None:
+        if status != STATUS_RUNNING:
+            self.statuses[job.id] = status
+        write_atomic(os.path.join(job.directory, JOB_STATUS_FILE), status)
+
+    @staticmethod
+    def _signal(job: SimulationJob, sig: int) -> None:
+        try:
+            os.killpg(job.process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def load_executor(experiment_directory: Union[str, Path]) -> ProcessExecutor:
+    """
+    Build an executor from the executor.json manifest of an experiment.
+
+    Args:
+        experiment_directory: experiment directory
+
+    Returns:
+        ProcessExecutor with the simulations of the experiment queued
+    """
+    with open(os.path.join(experiment_directory, EXECUTOR_FILE)) as f:
+        manifest = json.load(f)
+    simulations = manifest.pop("simulations")
+    executor = ProcessExecutor(**manifest)
+    for simulation in simulations:
+        executor.submit(SimulationJob(**simulation))
+    return executor
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Run the simulations of an experiment.
+
+    Args:
+        argv: command line arguments, the experiment directory
+
+    Returns:
+        0 when every simulation succeeded, 1 otherwise
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    experiment_directory = argv[0] if argv else os.getcwd()
+    # batch.sh redirects the output of the executor to stdout.txt of the experiment
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout, format="%(asctime)s %(levelname)s %(message)s")
+    executor = load_executor(experiment_directory)
+    signal.signal(signal.SIGTERM, executor.stop)
+    signal.signal(signal.SIGINT, executor.stop)
+    statuses = executor.run()
+    failed = sum(1 for status in statuses.values() if status != STATUS_SUCCEEDED)
+    logger.info(f"Executor done: {len(statuses) - failed} succeeded, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,16 @@ Here we implement the ProcessPlatform experiment operations.
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
 import os
+import signal
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from idmtools.core import ItemType
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_file.platform_operations.experiment_operations import FilePlatformExperimentOperations
+from idmtools_platform_process.executor import JOB_ID_FILE, is_executor_process
 from logging import getLogger
 
+logger = getLogger(__name__)
 user_logger = getLogger('user')
 
 if TYPE_CHECKING:
@@ -38,6 +42,35 @@ class ProcessPlatformExperimentOperations(FilePlatformExperimentOperations):
         if not dry_run:
             self.platform.submit_job(experiment, **kwargs)
 
+    def platform_cancel(self, experiment_id: str, force: bool = True) -> Any:
+        """
+        Cancel experiment by stopping its process executor.
+
+        The executor stops the running simulations and marks every simulation that is not done as failed. Nothing is
+        signalled when the PID of job_id.txt is not the executor of the experiment anymore: job_id.txt stays once the
+        executor exits and its PID may have been reused by another process.
+        Args:
+            experiment_id: experiment id
+            force: bool, True/False
+        Returns:
+            Any
+        """
+        experiment_directory = self.platform.get_directory_by_id(experiment_id, ItemType.EXPERIMENT)
+        job_id_file = experiment_directory.joinpath(JOB_ID_FILE)
+        if not job_id_file.exists():
+            logger.debug(f"No process executor found for experiment {experiment_id}")
+            return
+        pid = int(job_id_file.read_text().strip())
+        if not is_executor_process(pid, experiment_directory):
+            logger.debug(f"Process executor {pid} of experiment {experiment_id} is not running")
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            logger.debug(f"Process executor {pid} of experiment {experiment_id} is not running")
+        except PermissionError:
+            user_logger.warning(f"Not allowed to stop the process executor {pid} of experiment {experiment_id}")
+
     def post_run_item(self, experiment: Experiment, **kwargs):
         """
         Trigger right after commissioning experiment on platform.
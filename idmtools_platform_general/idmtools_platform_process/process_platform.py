@@ -3,13 +3,16 @@ Here we implement the ProcessPlatform object.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import json
 import platform
 import subprocess
-from typing import Union, Any
-from dataclasses import dataclass
+import sys
+from typing import Union, Any, Optional
+from dataclasses import dataclass, field
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_file.file_platform import FilePlatform
+from idmtools_platform_process.executor import EXECUTOR_FILE, EXECUTOR_MODULE, JOB_ID_FILE, write_atomic
 from idmtools_platform_process.platform_operations.experiment_operations import ProcessPlatformExperimentOperations
 from logging import getLogger
 
@@ -21,11 +24,73 @@ class ProcessPlatform(FilePlatform):
     """
     Process Platform definition.
     """
+    executor: str = field(default='bash', metadata=dict(
+        help="How simulations are run: 'bash' runs them with xargs in batch.sh, 'python' with the process executor"))
+    # options of the python executor
+    max_cores: Optional[int] = field(default=None, metadata=dict(
+        help="Number of cores the simulations may use. Defaults to the number of cpus"))
+    max_memory: Optional[int] = field(default=None, metadata=dict(
+        help="Memory in MB the simulations may use. Defaults to the physical memory of the node"))
+    num_cores: Optional[int] = field(default=None, metadata=dict(
+        help="Number of cores reserved for each simulation. Defaults to ntasks"))
+    mem_per_sim: Optional[int] = field(default=None, metadata=dict(help="Memory in MB reserved for each simulation"))
+    sim_timeout: Optional[int] = field(default=None, metadata=dict(
+        help="Seconds a simulation may run before it is stopped and considered failed"))
+    priority_tag: Optional[str] = field(default=None, metadata=dict(
+        help="Simulation tag holding the priority of the simulation. Simulations with a higher priority run first"))
 
     def __post_init__(self):
+        if self.executor not in ('bash', 'python'):
+            raise ValueError(f"executor must be 'bash' or 'python', not '{self.executor}'")
         super().__post_init__()
         self._experiments = ProcessPlatformExperimentOperations(platform=self)
 
+    def create_batch_file(self, item: Union[Experiment, Simulation], **kwargs) -> None:
+        """
+        Create batch file.
+        Args:
+            item: the item to build batch file for
+            kwargs: keyword arguments used to expand functionality.
+        Returns:
+            None
+        """
+        if self.executor == 'python':
+            if isinstance(item, Experiment):
+                kwargs['supervisor'] = f'"{sys.executable}" -m {EXECUTOR_MODULE} "$(pwd)"'
+            else:
+                # the executor retries the simulations itself
+                kwargs['retries'] = 1
+        super().create_batch_file(item, **kwargs)
+
+    def create_executor_file(self, experiment: Experiment, retries: int = None) -> None:
+        """
+        Create executor.json, the manifest of the simulations the process executor runs.
+        Args:
+            experiment: idmtools Experiment
+            retries: number of times a simulation is run before it is considered failed
+        Returns:
+            None
+        """
+        simulations = []
+        for simulation in experiment.simulations:
+            priority = simulation.tags.get(self.priority_tag, 0) if self.priority_tag else 0
+            simulations.append(dict(
+                id=simulation.id,
+                directory=str(self.get_directory(simulation)),
+                cores=self.num_cores or self.ntasks,
+                memory=self.mem_per_sim or 0,
+                priority=int(priority)
+            ))
+        manifest = dict(
+            max_cores=self.max_cores,
+            max_memory=self.max_memory,
+            max_job=1 if self.run_sequence else self.max_job,
+            timeout=self.sim_timeout,
+            retries=retries or self.retries,
+            simulations=simulations
+        )
+        write_atomic(self.get_directory(experiment).joinpath(EXECUTOR_FILE), json.dumps(manifest, indent=2))
+
     def submit_job(self, item: Union[Experiment, Simulation], **kwargs) -> Any:
         """
         Submit a Process job.
@@ -42,6 +107,13 @@ class ProcessPlatform(FilePlatform):
 
         if isinstance(item, Experiment):
             working_directory = self.get_directory(item)
+            if self.executor == 'python':
+                self.create_executor_file(item, kwargs.get('retries'))
+                # the executor keeps running the simulations once this process exits
+                process = subprocess.Popen(['bash', 'batch.sh'], cwd=str(working_directory), start_new_session=True,
+                                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                write_atomic(working_directory.joinpath(JOB_ID_FILE), str(process.pid))
+                return process.pid
             result = subprocess.run(['bash', 'batch.sh'], stdout=subprocess.PIPE, cwd=str(working_directory))
             r = result.stdout.decode('utf-8').strip()
             return r
@@ -0,0 +1,44 @@
+#!/bin/bash
+
+# the process executor writes the status itself
+JOB_STATUS_FILE=${JOB_STATUS_FILE:-job_status.txt}
+
+# define the handler function
+term_handler()
+{
+    # do whatever cleanup you want here
+    echo "-1" > $JOB_STATUS_FILE
+    exit -1
+}
+
+# Register cleanup function to handle SIGINT and SIGTERM signals
+trap 'term_handler' SIGINT SIGTERM
+
+n=0
+
+
+until [ "$n" -ge 1 ]
+do
+    echo "100" > $JOB_STATUS_FILE
+    
+        exec -a "SIMULATION:3cae8285-2f41-4b3b-b23d-d3ae48ce83ea"  singularity exec my.sif Assets/hello.sh &
+    
+
+   child_pid=$!
+   echo "Running simulation with PID: $child_pid"
+   # Wait for the child process to complete
+   wait $child_pid
+
+   RESULT=$?
+   if [ $RESULT -eq 0 ]; then
+      echo "0" > $JOB_STATUS_FILE
+      exit 0
+   elif [ $RESULT -eq 255 ] || [ $RESULT -eq -1 ]; then   # Normalize -1 or 255 to 1 to avoid process abort
+      echo "-1" > $JOB_STATUS_FILE
+      echo "_run.sh exiting with code: $RESULT" >> exit_code.log
+      exit 1
+   fi
+   n=$((n+1))
+done
+echo "-1" > $JOB_STATUS_FILE
+exit $RESULT
\ No newline at end of file
@@ -0,0 +1,10 @@
+#!/bin/bash
+
+chmod +x run_simulation.sh
+
+
+
+
+
+
+exec "/root/.pyenv/versions/3.11.7/bin/python" -m idmtools_platform_process.executor "$(pwd)" 1>> stdout.txt 2>> stderr.txt
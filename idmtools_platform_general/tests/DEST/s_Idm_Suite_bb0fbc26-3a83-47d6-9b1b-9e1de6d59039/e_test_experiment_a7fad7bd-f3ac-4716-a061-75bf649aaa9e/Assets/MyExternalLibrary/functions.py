@@ -0,0 +1,15 @@
+import numpy as np
+
+
+def add(x, y):
+    """
+    Add x to y
+
+    Args:
+        x: x to add
+        y: y to add
+
+    Returns:
+
+    """
+    return np.add(x, y)
@@ -1,8 +1,10 @@
+import json
 import os
 from pathlib import Path
 import shutil
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from idmtools.core import ItemType
 from idmtools.core.platform_factory import Platform
@@ -10,6 +12,7 @@ from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.suite import Suite
 from idmtools_platform_file.platform_operations.json_metadata_operations import JSONMetadataOperations
+from idmtools_platform_file.platform_operations.metadata_index import MetadataIndex
 
 
 class JSONMetadataOperationsTest(unittest.TestCase):
@@ -396,3 +399,60 @@ class JSONMetadataOperationsTest(unittest.TestCase):
         filtered_meta_list = self.op.filter(item_type=ItemType.SIMULATION)
         # make sure match 3 simulations
         self.assertEqual(len(filtered_meta_list), 3)
+
+    def test_index_lookup_for_items(self):
+        suites, experiments, simulations = self._initialize_data(self)
+        for item, item_type in [(suites[0], ItemType.SUITE), (experiments[1], ItemType.EXPERIMENT),
+                                (simulations[2], ItemType.SIMULATION)]:
+            item_dir = self.op.get_directory_by_id(item.id, item_type)
+            self.assertEqual(os.path.abspath(item_dir), os.path.abspath(self.platform.get_directory(item)))
+        self.assertTrue(self.op.index.index_file.exists())
+        self.assertIsNone(self.op.get_directory_by_id("not-a-real-id", ItemType.SIMULATION))
+
+    def test_index_is_shared_with_new_instance(self):
+        _, _, simulations = self._initialize_data(self)
+        op = JSONMetadataOperations(self.platform)
+        item_dir = op.get_directory_by_id(simulations[0].id, ItemType.SIMULATION)
+        self.assertEqual(os.path.abspath(item_dir), os.path.abspath(self.platform.get_directory(simulations[0])))
+
+    def test_index_rebuilt_when_missing(self):
+        _, _, simulations = self._initialize_data(self)
+        os.remove(self.op.index.index_file)
+        op = JSONMetadataOperations(self.platform)
+        item_dir = op.get_directory_by_id(simulations[1].id, ItemType.SIMULATION)
+        self.assertEqual(os.path.abspath(item_dir), os.path.abspath(self.platform.get_directory(simulations[1])))
+        self.assertTrue(op.index.index_file.exists())
+
+    def test_index_miss_scans_only_the_item(self):
+        _, _, simulations = self._initialize_data(self)
+        index = self.op.index
+        # an index that exists but doesn't know the simulations yet
+        open(index.index_file, 'w').close()
+        with patch.object(MetadataIndex, 'rebuild') as rebuild:
+            item_dir = self.op.get_directory_by_id(simulations[1].id, ItemType.SIMULATION)
+            self.assertIsNone(self.op.get_directory_by_id("not-a-real-id", ItemType.SIMULATION))
+            rebuild.assert_not_called()
+        self.assertEqual(os.path.abspath(item_dir), os.path.abspath(self.platform.get_directory(simulations[1])))
+        with open(index.index_file) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r['id'] for r in records], [simulations[1].id])
+
+    def test_index_rebuild_keeps_concurrent_appends(self):
+        _, _, simulations = self._initialize_data(self)
+        index = self.op.index
+        inode = os.stat(index.index_file).st_ino
+        # a line appended by another process
+        with open(index.index_file, 'a') as f:
+            f.write(json.dumps(dict(type='Simulation', id='other', dir='other')) + "\n")
+        index.rebuild()
+        self.assertEqual(inode, os.stat(index.index_file).st_ino)
+        with open(index.index_file) as f:
+            self.assertIn('other', [json.loads(line)['id'] for line in f])
+
+    def test_index_updated_on_clear(self):
+        _, _, simulations = self._initialize_data(self)
+        sim = simulations[0]
+        self.assertIsNotNone(self.op.get_directory_by_id(sim.id, ItemType.SIMULATION))
+        self.op.clear(item=sim)
+        self.assertIsNone(self.op.get_directory_by_id(sim.id, ItemType.SIMULATION))
+        self.assertEqual(self.op.filter(item_type=ItemType.SIMULATION, property_filter={'id': sim.id}), [])
@@ -2,7 +2,10 @@ import json
 import os
 import sys
 import pathlib
+import pickle
+import tempfile
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -11,11 +14,14 @@ from typing import Any, Dict
 from pathlib import Path
 if sys.platform == "win32":
     from win32con import FALSE
+from idmtools.analysis.analysis_item_ref import AnalysisItemRef
+from idmtools.analysis.analyze_manager import AnalyzeManager
 from idmtools.builders import SimulationBuilder
 from idmtools.core import ItemType
 from idmtools.core.platform_factory import Platform
 from idmtools.entities import Suite
 from idmtools.entities.experiment import Experiment
+from idmtools.entities.ianalyzer import IAnalyzer
 from idmtools.entities.simulation import Simulation
 from idmtools.entities.templated_simulation import TemplatedSimulations
 from idmtools_models.python.json_python_task import JSONConfiguredPythonTask
@@ -284,3 +290,131 @@ class TestFilePlatform(unittest.TestCase):
         self.assertEqual(set(file_simulation_assets), set(simulation_assets))
 
 
+
+    def test_get_simulation_statuses(self):
+        experiment = self.create_experiment(a=2, b=2)
+        sims = list(experiment.simulations)
+        statuses = self.platform.get_simulation_statuses(experiment)
+        self.assertSetEqual(set(statuses.keys()), set(sim.id for sim in sims))
+        self.assertTrue(all(status.name == "CREATED" for status in statuses.values()))
+
+        # write job status for some simulations
+        for sim, content in zip(sims, ['0', '-1', '100']):
+            with open(self.platform.get_directory(sim).joinpath('job_status.txt'), 'w') as f:
+                f.write(content)
+        statuses = self.platform.get_simulation_statuses(experiment)
+        self.assertEqual(statuses[sims[0].id].name, "SUCCEEDED")
+        self.assertEqual(statuses[sims[1].id].name, "FAILED")
+        self.assertEqual(statuses[sims[2].id].name, "RUNNING")
+        self.assertEqual(statuses[sims[3].id].name, "CREATED")
+        # bulk statuses match single lookup, also from a FileExperiment
+        file_experiment = self.platform.get_item(experiment.id, item_type=ItemType.EXPERIMENT, force=True, raw=True)
+        self.assertDictEqual(self.platform.get_simulation_statuses(file_experiment), statuses)
+        for sim in sims:
+            self.assertEqual(self.platform.get_simulation_status(sim.id), statuses[sim.id])
+
+        # status file updated after previous poll
+        with open(self.platform.get_directory(sims[2]).joinpath('job_status.txt'), 'w') as f:
+            f.write('0')
+        self.platform.refresh_status(experiment)
+        self.assertEqual(sims[2].status.name, "SUCCEEDED")
+
+        # only the experiments polled last keep their cached statuses
+        status_cache = self.platform._op_client._status_cache
+        experiment_dir = str(self.platform.get_directory(experiment))
+        self.assertEqual(len(status_cache[experiment_dir]), 3)
+        other = self.create_experiment(a=1, b=1)
+        with mock.patch('idmtools_platform_file.file_operations.file_operations.STATUS_CACHE_EXPERIMENTS', 1):
+            self.platform.get_simulation_statuses(other)
+        self.assertEqual(list(status_cache), [str(self.platform.get_directory(other))])
+
+    def test_get_files_skips_file_cache(self):
+        experiment = self.create_experiment(a=1, b=1)
+        sim = experiment.simulations[0]
+        sim_dir = self.platform.get_directory(sim)
+        with open(sim_dir.joinpath('result.txt'), 'w') as f:
+            f.write('first')
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(os.environ, {"IDMTOOLS_FILE_CACHE_ENABLED": "on",
+                                             "IDMTOOLS_FILE_CACHE_DIRECTORY": cache_dir}):
+            # local files are read directly, never copied into the file cache
+            content = self.platform.get_files(sim, ['result.txt'])['result.txt']
+            self.assertIsInstance(content, bytearray)
+            self.assertEqual(content, b'first')
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_get_files_as_view(self):
+        experiment = self.create_experiment(a=1, b=1)
+        sim = experiment.simulations[0]
+        with open(self.platform.get_directory(sim).joinpath('result.txt'), 'w') as f:
+            f.write('mapped')
+        files = self.platform.get_files(sim, ['result.txt'])
+        self.assertIsInstance(files['result.txt'], bytearray)
+        self.assertEqual(files['result.txt'], b'mapped')
+        files = self.platform.get_files(sim, ['result.txt'], as_view=True)
+        self.assertIsInstance(files['result.txt'], memoryview)
+        self.assertTrue(files['result.txt'].readonly)
+        self.assertEqual(files['result.txt'], b'mapped')
+        files['result.txt'].release()
+        with self.assertRaises(RuntimeError):
+            self.platform.get_files(sim, ['missing.txt'], as_view=True)
+
+    def test_analyze_with_item_refs(self):
+        class ResultAnalyzer(IAnalyzer):
+            def __init__(self):
+                super().__init__(filenames=['result.txt'], parse=False)
+
+            def filter(self, item):
+                return item.tags['a'] == 0
+
+            def map(self, data, item):
+                assert isinstance(item, AnalysisItemRef)
+                return data['result.txt'].decode()
+
+            def reduce(self, all_data):
+                return sorted(all_data.values())
+
+        experiment = self.create_experiment(a=2, b=2)
+        for sim in experiment.simulations:
+            sim_dir = self.platform.get_directory(sim)
+            with open(sim_dir.joinpath('job_status.txt'), 'w') as f:
+                f.write('0')
+            with open(sim_dir.joinpath('result.txt'), 'w') as f:
+                f.write(f"{sim.tags['a']}-{sim.tags['b']}")
+
+        file_sim = self.platform.get_item(experiment.simulations[0].id, ItemType.SIMULATION, raw=True)
+        ref = self.platform.to_analysis_item_ref(file_sim)
+        self.assertEqual(ref.location, str(self.platform.get_directory(file_sim)))
+        self.assertLess(len(pickle.dumps(ref)), len(pickle.dumps(file_sim)))
+
+        analyzer = ResultAnalyzer()
+        am = AnalyzeManager(self.platform, ids=[(experiment.id, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                            executor_type='thread', max_workers=2)
+        self.assertTrue(am.analyze())
+        self.assertListEqual(analyzer.results, ['0-0', '0-1'])
+
+    def test_analyze_files_as_view(self):
+        class ViewAnalyzer(IAnalyzer):
+            def __init__(self):
+                super().__init__(filenames=['result.txt'], parse=False)
+
+            def map(self, data, item):
+                return isinstance(data['result.txt'], memoryview), bytes(data['result.txt']).decode()
+
+            def reduce(self, all_data):
+                return sorted(all_data.values())
+
+        experiment = self.create_experiment(a=2, b=1)
+        for sim in experiment.simulations:
+            sim_dir = self.platform.get_directory(sim)
+            with open(sim_dir.joinpath('job_status.txt'), 'w') as f:
+                f.write('0')
+            with open(sim_dir.joinpath('result.txt'), 'w') as f:
+                f.write(str(sim.tags['a']))
+
+        for files_as_view in (False, True):
+            analyzer = ViewAnalyzer()
+            am = AnalyzeManager(self.platform, ids=[(experiment.id, ItemType.EXPERIMENT)], analyzers=[analyzer],
+                                executor_type='thread', max_workers=2, files_as_view=files_as_view)
+            self.assertTrue(am.analyze())
+            self.assertListEqual(analyzer.results, [(files_as_view, '0'), (files_as_view, '1')])
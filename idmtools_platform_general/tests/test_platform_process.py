@@ -1,8 +1,12 @@
 import json
 import os
 import pathlib
+import signal
+import subprocess
+import tempfile
 from functools import partial
 from typing import Any, Dict
+from unittest.mock import patch
 import numpy as np
 import pandas as pd
 import pytest
@@ -233,3 +237,83 @@ class TestProcessPlatform(ITestWithPersistence):
         with self.assertRaises(RuntimeError) as context:
             self.platform.get_item(experiment.parent_id, item_type=ItemType.SUITE, force=True)
         self.assertTrue(f"Not found Suite with id '{experiment.parent_id}'" in str(context.exception.args[0]))
+
+    def test_python_executor(self):
+        platform = Platform('PROCESS', job_directory=self.job_directory, executor='python', run_sequence=False,
+                            max_job=2, retries=2)
+        experiment = self.create_experiment(platform=platform, a=2, b=2)
+        experiment_dir = platform.get_directory(experiment)
+        with open(os.path.join(experiment_dir, 'batch.sh'), 'r') as fpr:
+            self.assertIn('-m idmtools_platform_process.executor "$(pwd)"', fpr.read())
+        with open(os.path.join(experiment_dir, 'executor.json'), 'r') as fpr:
+            manifest = json.load(fpr)
+        self.assertEqual(manifest['max_job'], 2)
+        self.assertEqual(manifest['retries'], 2)
+        self.assertEqual(len(manifest['simulations']), 4)
+        self.assertTrue(os.path.exists(os.path.join(experiment_dir, 'job_id.txt')))
+        self.assertTrue(experiment.succeeded)
+        for simulation in experiment.simulations:
+            simulation_dir = platform.get_directory(simulation)
+            with open(os.path.join(simulation_dir, 'job_status.txt'), 'r') as fpr:
+                self.assertEqual(fpr.read(), '0')
+            with open(os.path.join(simulation_dir, 'job_id.txt'), 'r') as fpr:
+                self.assertTrue(fpr.read().isdigit())
+            with open(os.path.join(simulation_dir, '_run.sh'), 'r') as fpr:
+                # retries are handled by the executor
+                self.assertIn('until [ "$n" -ge 1 ]', fpr.read())
+
+    def test_executor_scheduling(self):
+        from idmtools_platform_process.executor import ProcessExecutor, SimulationJob
+        with tempfile.TemporaryDirectory() as tmp:
+            scripts = dict(
+                # record how many simulations run at the same time
+                a='echo start >> ../log.txt; sleep 1; echo end >> ../log.txt',
+                b='echo start >> ../log.txt; sleep 1; echo end >> ../log.txt',
+                # fail on the first attempt only
+                retry='if [ -f attempt ]; then exit 0; fi; touch attempt; exit 1',
+                slow='sleep 30'
+            )
+            jobs = []
+            for name, script in scripts.items():
+                os.makedirs(os.path.join(tmp, name))
+                with open(os.path.join(tmp, name, '_run.sh'), 'w') as f:
+                    f.write(script)
+                jobs.append(SimulationJob(id=name, directory=os.path.join(tmp, name), cores=2,
+                                          priority=1 if name in ('a', 'b') else 0))
+            executor = ProcessExecutor(max_cores=2, timeout=3, retries=2, kill_timeout=1, poll_interval=0.1)
+            statuses = executor.run(jobs)
+            self.assertDictEqual(statuses, dict(a='0', b='0', retry='0', slow='-1'))
+            # each simulation reserves the whole node so a and b never overlap
+            with open(os.path.join(tmp, 'log.txt')) as f:
+                self.assertEqual(f.read().split(), ['start', 'end', 'start', 'end'])
+            for name in scripts:
+                with open(os.path.join(tmp, name, 'job_status.txt')) as f:
+                    self.assertEqual(f.read(), statuses[name])
+                self.assertTrue(os.path.exists(os.path.join(tmp, name, 'job_id.txt')))
+
+    def test_cancel_checks_executor_pid(self):
+        from idmtools_platform_process.executor import is_executor_process
+        platform = Platform('PROCESS', job_directory=self.job_directory, executor='python')
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, 'batch.sh'), 'w') as f:
+                f.write('sleep 30')
+            executor = subprocess.Popen(['bash', 'batch.sh'], cwd=tmp)
+            # an unrelated process that reused the PID recorded in job_id.txt
+            unrelated = subprocess.Popen(['sleep', '30'], cwd=tmp)
+            try:
+                self.assertTrue(is_executor_process(executor.pid, tmp))
+                self.assertFalse(is_executor_process(executor.pid, self.job_directory))
+                self.assertFalse(is_executor_process(unrelated.pid, tmp))
+                with patch.object(platform, 'get_directory_by_id', return_value=pathlib.Path(tmp)):
+                    with open(os.path.join(tmp, 'job_id.txt'), 'w') as f:
+                        f.write(str(unrelated.pid))
+                    platform._experiments.platform_cancel('exp')
+                    self.assertIsNone(unrelated.poll())
+                    with open(os.path.join(tmp, 'job_id.txt'), 'w') as f:
+                        f.write(str(executor.pid))
+                    platform._experiments.platform_cancel('exp')
+                    self.assertEqual(executor.wait(10), -signal.SIGTERM)
+            finally:
+                for process in (executor, unrelated):
+                    process.kill()
+                    process.wait()
@@ -3,9 +3,11 @@ SlurmPlatform utilities.
 
 Copyright 2021, Bill & Melinda Gates Foundation. All rights reserved.
 """
+import json
+import os
 from pathlib import Path
 from jinja2 import Template
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_slurm.platform_operations.utils import check_home
 
@@ -14,26 +16,75 @@ if TYPE_CHECKING:
 
 DEFAULT_TEMPLATE_FILE = Path(__file__).parent.joinpath("sbatch.sh.jinja2")
 BATCH_TEMPLATE_FILE = Path(__file__).parent.joinpath("batch.sh.jinja2")
+# Manifest of the simulation directories of an experiment, in array task order
+SIMULATION_INDEX_FILE = "simulations.index"
+# Slurm jobs submitted for an experiment and the simulations of each of their array tasks
+JOB_IDS_FILE = "job_ids.json"
+# Dependencies allowed between the array jobs of an experiment
+DEPENDENCY_TYPES = ('afterok', 'afterany')
+
+
+def get_array_task_count(platform: 'SlurmPlatform', experiment: Experiment) -> int:
+    """
+    Get the number of array tasks needed to run an experiment.
+    Args:
+        platform: Slurm Platform
+        experiment: idmtools Experiment
+    Returns:
+        Number of simulations divided by sims_per_task, rounded up
+    """
+    sims_per_task = platform.sims_per_task or 1
+    return -(-experiment.simulation_count // sims_per_task)
+
+
+def get_array_chunks(platform: 'SlurmPlatform', experiment: Experiment) -> List[Tuple[int, int]]:
+    """
+    Split the array tasks of an experiment in array jobs.
+
+    Array jobs are limited by array_batch_size and by the MaxArraySize of the cluster. Array task indices of every
+    job start at 1.
+    Args:
+        platform: Slurm Platform
+        experiment: idmtools Experiment
+    Returns:
+        List of (offset, size) of the array jobs. Task i of a job runs the array task offset + i of the experiment
+    """
+    num_tasks = get_array_task_count(platform, experiment)
+    batch_size = num_tasks
+    if platform.array_batch_size is not None:
+        batch_size = min(batch_size, platform.array_batch_size)
+    if platform._max_array_size is not None:
+        # array indices must be lower than MaxArraySize
+        batch_size = min(batch_size, platform._max_array_size - 1)
+    if batch_size < 1:
+        return []
+    return [(offset, min(batch_size, num_tasks - offset)) for offset in range(0, num_tasks, batch_size)]
 
 
 def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
                    max_running_jobs: Optional[int] = None, array_batch_size: Optional[int] = None,
-                   dependency: Optional[bool] = None,
+                   dependency: Optional[Union[bool, str]] = None,
                    template: Union[Path, str] = BATCH_TEMPLATE_FILE, **kwargs) -> None:
     """
     Generate bash script file batch.sh
+
+    The experiment is submitted as a single array job when it fits in one array. Otherwise it is split in array jobs
+    of array_batch_size tasks that each run at most max_running_jobs tasks at the same time.
     Args:
         platform: Slurm Platform
         experiment: idmtools Experiment
         max_running_jobs: int, how many allowed to run
-        array_size: INT, array size for slurm job
-        dependency: bool, determine if Slurm jobs depend on each other
+        array_batch_size: int, array size for slurm job
+        dependency: determine if Slurm jobs depend on each other. True or 'afterok' starts an array job once the
+            previous one succeeded, 'afterany' once it ended and False submits independent array jobs
         template: template to be used to build batch file
         kwargs: keyword arguments used to expand functionality
     Returns:
         None
     """
-    template_vars = dict(njobs=experiment.simulation_count)
+    # Each array task runs sims_per_task simulations
+    num_tasks = get_array_task_count(platform, experiment)
+    template_vars = dict(njobs=num_tasks)
 
     # Set max_running_jobs
     if max_running_jobs is not None:
@@ -50,21 +101,16 @@ def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
     # Set array_size
     if array_batch_size is not None:
         platform.array_batch_size = array_batch_size
-
-    if platform._max_array_size is not None:
-        if platform.array_batch_size is not None:
-            template_vars['array_batch_size'] = min(platform._max_array_size, platform.array_batch_size,
-                                                    experiment.simulation_count)
-        else:
-            template_vars['array_batch_size'] = min(platform._max_array_size, experiment.simulation_count)
-    elif platform.array_batch_size is not None:
-        template_vars['array_batch_size'] = min(platform.array_batch_size, experiment.simulation_count)
-    else:
-        template_vars['array_batch_size'] = experiment.simulation_count
+    template_vars['chunks'] = get_array_chunks(platform, experiment)
+    template_vars['array_batch_size'] = template_vars['chunks'][0][1] if template_vars['chunks'] else 0
 
     # Consider dependency
-    if dependency is None:
-        dependency = True
+    if dependency is None or dependency is True:
+        dependency = 'afterok'
+    elif dependency is False:
+        dependency = None
+    elif dependency not in DEPENDENCY_TYPES:
+        raise ValueError(f"Invalid dependency '{dependency}'. Allowed values are True, False, {', '.join(DEPENDENCY_TYPES)}.")
     template_vars['dependency'] = dependency
 
     # Update with possible override values
@@ -83,6 +129,72 @@ def generate_batch(platform: 'SlurmPlatform', experiment: Experiment,
     platform.update_script_mode(output_target)
 
 
+def generate_simulation_index(platform: 'SlurmPlatform', experiment: Experiment) -> Path:
+    """
+    Generate the simulation index file simulations.index.
+
+    Line N of the file is "<simulation directory>\t<simulation id>" of the simulation run by array task N, so
+    run_simulation.sh finds its simulation directory without listing the experiment directory.
+    Args:
+        platform: Slurm Platform
+        experiment: idmtools Experiment
+    Returns:
+        Path of the index file
+    """
+    experiment_dir = platform.get_directory(experiment)
+    lines = []
+    for simulation in experiment.simulations:
+        sim_dir = platform.get_directory(simulation).relative_to(experiment_dir).as_posix()
+        lines.append(f"{sim_dir}\t{simulation.id}\n")
+
+    # Replace the file at once so that running array tasks never read a partial index
+    output_target = experiment_dir.joinpath(SIMULATION_INDEX_FILE)
+    tmp_file = output_target.with_name(f"{SIMULATION_INDEX_FILE}.{os.getpid()}.tmp")
+    with open(tmp_file, "w", newline="\n") as tout:
+        tout.write("".join(lines))
+    os.replace(tmp_file, output_target)
+    return output_target
+
+
+def generate_job_ids(platform: 'SlurmPlatform', experiment: Experiment) -> Optional[Dict]:
+    """
+    Generate job_ids.json once the experiment has been submitted.
+
+    The file maps the array task indices of every submitted array job to the ids of the simulations they run, so that
+    the status and cancellation of a simulation can target its own array task.
+    Args:
+        platform: Slurm Platform
+        experiment: idmtools Experiment
+    Returns:
+        Content of the file, None when no job has been submitted
+    """
+    experiment_dir = platform.get_directory(experiment)
+    job_id_file = experiment_dir.joinpath("job_id.txt")
+    if not job_id_file.exists():
+        return None
+    with open(job_id_file) as f:
+        job_ids = [line.strip() for line in f if line.strip()]
+
+    sim_ids = [str(simulation.id) for simulation in experiment.simulations]
+    sims_per_task = platform.sims_per_task or 1
+    jobs = []
+    # job_id.txt has one line per array job, in submission order
+    for job_id, (offset, size) in zip(job_ids, get_array_chunks(platform, experiment)):
+        tasks = {}
+        for index in range(1, size + 1):
+            first_sim = (offset + index - 1) * sims_per_task
+            tasks[str(index)] = sim_ids[first_sim:first_sim + sims_per_task]
+        jobs.append(dict(job_id=job_id, offset=offset, array=f"1-{size}", tasks=tasks))
+
+    content = dict(experiment_id=str(experiment.id), sims_per_task=sims_per_task, jobs=jobs)
+    output_target = experiment_dir.joinpath(JOB_IDS_FILE)
+    tmp_file = output_target.with_name(f"{JOB_IDS_FILE}.{os.getpid()}.tmp")
+    with open(tmp_file, "w") as tout:
+        json.dump(content, tout)
+    os.replace(tmp_file, output_target)
+    return content
+
+
 def generate_script(platform: 'SlurmPlatform', experiment: Experiment, max_running_jobs: Optional[int] = None,
                     template: Union[Path, str] = DEFAULT_TEMPLATE_FILE, **kwargs) -> None:
     """
@@ -2,16 +2,27 @@
 # Get the parameters passed from sbatch.sh
 mpi_type="$2"
 
-SIMULATION_INDEX=$((${SLURM_ARRAY_TASK_ID} + $1))
-JOB_DIRECTORY=$(find . -type d -maxdepth 1 -mindepth 1  | grep -v Assets | head -$SIMULATION_INDEX | tail -1)
-cd $JOB_DIRECTORY
+# SIMULATION_INDEX is set by sbatch.sh when an array task runs several simulations
+SIMULATION_INDEX=${SIMULATION_INDEX:-$((${SLURM_ARRAY_TASK_ID} + $1))}
+if [ -f simulations.index ]; then
+    # Line N of the index is the directory of simulation N, read it without listing the experiment directory
+    JOB_DIRECTORY=$(sed -n "${SIMULATION_INDEX}{p;q}" simulations.index | cut -f1)
+else
+    # Experiments created before the index existed
+    JOB_DIRECTORY=$(find . -type d -maxdepth 1 -mindepth 1  | grep -v Assets | head -$SIMULATION_INDEX | tail -1)
+fi
+if [ -z "$JOB_DIRECTORY" ] || [ ! -d "$JOB_DIRECTORY" ]; then
+    echo "No simulation directory for simulation index $SIMULATION_INDEX"
+    exit 1
+fi
+cd "$JOB_DIRECTORY"
 current_dir=$(pwd)
 echo "The script is running from: $current_dir"
 
 # Run the simulation based on whether MPI is required
 if [ "$mpi_type" = "no-mpi" ]; then
     echo "Run without MPI"
-    srun _run.sh 1> stdout.txt 2> stderr.txt
+    srun $SRUN_OPTIONS _run.sh 1> stdout.txt 2> stderr.txt
 elif [ "$mpi_type" = "mpirun" ]; then
     echo "Run mpirun"
     mpirun "$current_dir"/_run.sh 1> stdout.txt 2> stderr.txt
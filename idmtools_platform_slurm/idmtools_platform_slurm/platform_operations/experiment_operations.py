@@ -11,6 +11,7 @@ from idmtools.core import EntityStatus
 from idmtools.core import ItemType
 from idmtools.entities.experiment import Experiment
 from idmtools_platform_file.platform_operations.experiment_operations import FilePlatformExperimentOperations
+from idmtools_platform_slurm.assets import generate_simulation_index
 from logging import getLogger
 
 
@@ -38,6 +39,8 @@ class SlurmPlatformExperimentOperations(FilePlatformExperimentOperations):
         """
         # Ensure parent
         super().platform_run_item(experiment, **kwargs)
+        # Simulations are created by now, write the index array tasks use to find their simulation
+        generate_simulation_index(self.platform, experiment)
         # Commission
         if not dry_run:
             self.platform.submit_job(experiment, **kwargs)
@@ -57,9 +60,10 @@ class SlurmPlatformExperimentOperations(FilePlatformExperimentOperations):
             logger.debug(f'job_id is not available for experiment: {experiment.id}')
             return
 
-        # Refresh status for each simulation
+        # Refresh status for all simulations at once
+        statuses = self.platform.get_simulation_statuses(experiment, **kwargs)
         for sim in experiment.simulations:
-            sim.status = self.platform.get_simulation_status(sim.id, **kwargs)
+            sim.status = statuses[sim.id]
 
     def platform_cancel(self, experiment_id: str, force: bool = True) -> None:
         """
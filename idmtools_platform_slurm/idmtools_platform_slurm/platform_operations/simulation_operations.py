@@ -4,7 +4,7 @@ Here we implement the SlurmPlatform simulation operations.
 Copyright 2025, Gates Foundation. All rights reserved.
 """
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 from idmtools.core import ItemType, EntityStatus
 from idmtools_platform_file.platform_operations.simulation_operations import FilePlatformSimulationOperations
 from logging import getLogger
@@ -22,25 +22,43 @@ logger = getLogger(__name__)
 class SlurmPlatformSimulationOperations(FilePlatformSimulationOperations):
     platform: 'SlurmPlatform'  # noqa: F821
 
-    def platform_cancel(self, sim_id: str, force: bool = False) -> Any:
+    def platform_cancel(self, sim_id: str, force: bool = False, cancelled_ids: Iterable[str] = None) -> Any:
         """
         Cancel platform simulation's slurm job.
+
+        With sims_per_task > 1 the slurm job of a simulation is the array task running the other simulations of the
+        task too. The task is only cancelled when its other simulations are done or are being cancelled as well.
         Args:
             sim_id: simulation id
             force: bool, True/False
+            cancelled_ids: ids of the other simulations being cancelled together with this one
         Returns:
             Any
         """
         sim = self.platform.get_item(sim_id, ItemType.SIMULATION, raw=False)
         if force or sim.status == EntityStatus.RUNNING:
             logger.debug(f"cancel slurm job for simulation: {sim_id}...")
+            array_job_ids = self.platform.get_simulation_job_ids(sim.parent_id)
             job_id = self.platform.get_job_id(sim_id, ItemType.SIMULATION)
+            if job_id is None:
+                # The simulation has not started yet, cancel its array task
+                job_id = array_job_ids.get(str(sim_id))
             if job_id is None:
                 logger.debug(f"Slurm job for simulation: {sim_id} is not available!")
                 return
-            else:
-                result = self.platform._op_client.cancel_job(job_id)
-                user_logger.info(f"Cancel Simulation: {sim_id}: {result}")
-                return result
+            task_id = job_id[0] if isinstance(job_id, list) else job_id
+            cancelled_ids = {str(sim_id)} | {str(i) for i in cancelled_ids or []}
+            others = [other_id for other_id, other_job_id in array_job_ids.items()
+                      if other_job_id == task_id and other_id not in cancelled_ids]
+            active = [other_id for other_id in others
+                      if self.platform.get_item(other_id, ItemType.SIMULATION, raw=False).status
+                      not in (EntityStatus.SUCCEEDED, EntityStatus.FAILED)]
+            if active:
+                user_logger.warning(f"Simulation {sim_id} is not cancelled: its Slurm job {task_id} also runs "
+                                    f"simulations {', '.join(active)}")
+                return
+            result = self.platform._op_client.cancel_job(job_id)
+            user_logger.info(f"Cancel Simulation: {sim_id}: {result}")
+            return result
         else:
             user_logger.info(f"Simulation {sim_id} is not running, no cancel needed...")
@@ -3,37 +3,61 @@ Here we implement the Slurm Operations.
 
 Copyright 2025, Gates Foundation. All rights reserved.
 """
+import re
+import shutil
 import subprocess
+import time
 from dataclasses import dataclass, field
-from logging import getLogger
-from typing import Union, List, Any, Type
+from logging import getLogger, DEBUG
+from typing import Union, List, Any, Type, Dict, Iterable, Optional, Tuple
 
+from idmtools.core import EntityStatus
 from idmtools.entities.experiment import Experiment
 from idmtools.entities.simulation import Simulation
 from idmtools_platform_file.file_operations.file_operations import FileOperations
+from idmtools_platform_file.platform_operations.utils import FileExperiment
 from idmtools_platform_slurm.assets import generate_batch, generate_script, generate_simulation_script
 
 
 logger = getLogger(__name__)
 
+# Slurm job states of jobs that are over. See https://slurm.schedmd.com/sacct.html#SECTION_JOB-STATE-CODES
+SLURM_ENDED_STATES = {'BOOT_FAIL', 'CANCELLED', 'COMPLETED', 'DEADLINE', 'FAILED', 'NODE_FAIL', 'OUT_OF_MEMORY',
+                      'PREEMPTED', 'REVOKED', 'TIMEOUT'}
+# State of the jobs that squeue no longer lists
+SQUEUE_ENDED_STATE = 'ENDED'
+# Array task ids as printed by sacct: "<job>_<index>" or "<job>_[<ranges>]" for the pending tasks
+ARRAY_TASK_PATTERN = re.compile(r'^(\d+)_(\d+|\[[^\]]*\])$')
+
 
 @dataclass
 class SlurmOperations(FileOperations):
 
     platform: 'SlurmPlatform'  # noqa: F821
     platform_type: Type = field(default=None)
+    # Slurm job ids -> (time of the query, states of the array tasks) of the last scheduler query
+    _job_state_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, str]]] = field(default_factory=dict, init=False,
+                                                                                 repr=False, compare=False)
 
     def create_batch_file(self, item: Union[Experiment, Simulation], max_running_jobs: int = None, retries: int = None,
-                          array_batch_size: int = None, dependency: bool = True, **kwargs) -> None:
+                          array_batch_size: int = None, dependency: bool = True, sims_per_task: int = None,
+                          **kwargs) -> None:
         """
         Create batch file.
         Args:
             item: the item to build batch file for
+            max_running_jobs: int, how many allowed to run
+            retries: int, retries of a simulation
+            array_batch_size: int, array size for slurm job
+            dependency: bool, determine if Slurm jobs depend on each other
+            sims_per_task: int, number of simulations run by each array task
             kwargs: keyword arguments used to expand functionality.
         Returns:
             None
         """
         if isinstance(item, Experiment):
+            if sims_per_task is not None:
+                self.platform.sims_per_task = sims_per_task
             generate_batch(self.platform, item, max_running_jobs, array_batch_size, dependency)
             generate_script(self.platform, item, max_running_jobs)
         elif isinstance(item, Simulation):
@@ -56,3 +80,145 @@ class SlurmOperations(FileOperations):
         result = subprocess.run(['scancel', *job_ids], stdout=subprocess.PIPE)
         stdout = "Success" if result.returncode == 0 else 'Error'
         return stdout
+
+    @staticmethod
+    def _expand_array_task(job_id: str) -> List[str]:
+        """
+        Expand an array task id printed by the scheduler in array task ids.
+        Args:
+            job_id: job id such as "1001_3" or "1001_[3-5,8%2]"
+        Returns:
+            List of "<job>_<index>" ids. The job id itself when it is not an array task id
+        """
+        match = ARRAY_TASK_PATTERN.match(job_id)
+        if match is None:
+            return [job_id]
+        job, indices = match.groups()
+        if not indices.startswith('['):
+            return [job_id]
+        task_ids = []
+        for part in indices[1:-1].split('%')[0].split(','):
+            if '-' in part:
+                start, end = part.split('-')
+                task_ids.extend(f"{job}_{i}" for i in range(int(start), int(end) + 1))
+            elif part:
+                task_ids.append(f"{job}_{part}")
+        return task_ids
+
+    def _query_sacct(self, job_ids: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Query the state of array tasks from the Slurm accounting database.
+        Args:
+            job_ids: Slurm job ids
+        Returns:
+            Dict of array task id as key and state as value. None when sacct is not available
+        """
+        if shutil.which('sacct') is None:
+            return None
+        result = subprocess.run(['sacct', '-j', ','.join(job_ids), '--format=JobID,State,ExitCode', '-P', '-n', '-X'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        if result.returncode != 0:
+            # for example when accounting is disabled
+            logger.debug(f"sacct failed: {result.stderr.strip()}")
+            return None
+        states = {}
+        for line in result.stdout.splitlines():
+            parts = line.strip().split('|')
+            if len(parts) < 2:
+                continue
+            # "CANCELLED by 1000" -> "CANCELLED". Requeued jobs are listed again, the last record wins
+            state = parts[1].split(' ')[0]
+            for task_id in self._expand_array_task(parts[0]):
+                states[task_id] = state
+            if state in SLURM_ENDED_STATES and state != 'COMPLETED' and logger.isEnabledFor(DEBUG):
+                logger.debug(f"Slurm job {parts[0]} {state} with exit code {parts[2] if len(parts) > 2 else None}")
+        return states
+
+    def _query_squeue(self, job_ids: List[str], task_ids: Iterable[str]) -> Optional[Dict[str, str]]:
+        """
+        Query the state of array tasks from the queue, for clusters without accounting.
+        Args:
+            job_ids: Slurm job ids
+            task_ids: array task ids to report
+        Returns:
+            Dict of array task id as key and state as value. Tasks no longer in the queue are ENDED. None when squeue
+            is not available
+        """
+        if shutil.which('squeue') is None:
+            return None
+        result = subprocess.run(['squeue', '-h', '-r', '-j', ','.join(job_ids), '-o', '%i|%T'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        if result.returncode != 0 and 'Invalid job id' not in result.stderr:
+            logger.debug(f"squeue failed: {result.stderr.strip()}")
+            return None
+        states = {task_id: SQUEUE_ENDED_STATE for task_id in task_ids}
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                parts = line.strip().split('|')
+                if len(parts) == 2:
+                    for task_id in self._expand_array_task(parts[0]):
+                        states[task_id] = parts[1]
+        return states
+
+    def get_job_states(self, task_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the scheduler state of array tasks with one sacct, or squeue, query.
+
+        Results are cached for the status_cache_interval of the platform.
+        Args:
+            task_ids: array task ids "<job>_<index>"
+        Returns:
+            Dict of array task id as key and Slurm state as value. Tasks unknown to the scheduler are omitted
+        """
+        task_ids = set(task_ids)
+        job_ids = tuple(sorted({task_id.split('_')[0] for task_id in task_ids}))
+        if not job_ids:
+            return {}
+        interval = getattr(self.platform, 'status_cache_interval', 0) or 0
+        cached = self._job_state_cache.get(job_ids)
+        if cached is not None and time.monotonic() - cached[0] < interval:
+            return cached[1]
+
+        states = self._query_sacct(list(job_ids))
+        if states is None:
+            states = self._query_squeue(list(job_ids), task_ids)
+        states = states or {}
+        self._job_state_cache[job_ids] = (time.monotonic(), states)
+        return states
+
+    def get_simulation_statuses(self, experiment: Union[Experiment, FileExperiment], **kwargs) -> Dict[str, EntityStatus]:
+        """
+        Retrieve the status of all simulations of an experiment in bulk.
+
+        The status files written by the simulations are merged with the state of their array task in the scheduler.
+        A simulation that did not finish while its array task is over, for example when the task was killed because
+        of its time or memory limit, is FAILED.
+        Args:
+            experiment: idmtools Experiment or FileExperiment
+            kwargs: keyword arguments used to expand functionality
+        Returns:
+            Dict of simulation id as key and EntityStatus as value
+        """
+        statuses = super().get_simulation_statuses(experiment, **kwargs)
+        if not getattr(self.platform, 'status_from_scheduler', False):
+            return statuses
+        unfinished = [sim_id for sim_id, status in statuses.items()
+                      if status not in (EntityStatus.SUCCEEDED, EntityStatus.FAILED)]
+        if not unfinished:
+            return statuses
+
+        task_ids = self.platform.get_simulation_job_ids(experiment.id)
+        states = self.get_job_states(task_ids[sim_id] for sim_id in unfinished if sim_id in task_ids)
+        for sim_id in unfinished:
+            state = states.get(task_ids.get(sim_id))
+            if state not in SLURM_ENDED_STATES and state != SQUEUE_ENDED_STATE:
+                continue
+            # the simulation may have finished since its status file was read
+            status = self.get_simulation_status(sim_id)
+            if status in (EntityStatus.SUCCEEDED, EntityStatus.FAILED):
+                statuses[sim_id] = status
+            else:
+                if logger.isEnabledFor(DEBUG):
+                    logger.debug(f"Simulation {sim_id} did not finish and its Slurm job is {state}")
+                statuses[sim_id] = EntityStatus.FAILED
+        return statuses
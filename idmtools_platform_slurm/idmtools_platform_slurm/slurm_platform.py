@@ -3,6 +3,7 @@ Here we implement the SlurmPlatform object.
 
 Copyright 2025, Gates Foundation. All rights reserved.
 """
+import json
 import subprocess
 from typing import Optional, Any, Dict, List, Union, Literal
 from dataclasses import dataclass, field, fields
@@ -19,6 +20,7 @@ from idmtools_platform_slurm.platform_operations.simulation_operations import Sl
 from idmtools_platform_slurm.platform_operations.suite_operations import SlurmPlatformSuiteOperations
 from idmtools_platform_slurm.platform_operations.utils import get_max_array_size
 from idmtools_platform_slurm.slurm_operations.slurm_operations import SlurmOperations
+from idmtools_platform_slurm.assets import generate_job_ids, JOB_IDS_FILE
 
 from idmtools_platform_slurm.utils.slurm_job import run_script_on_slurm, slurm_installed
 
@@ -27,7 +29,7 @@ logger = getLogger(__name__)
 op_defaults = dict(default=None, compare=False, metadata={"pickle_ignore": True})
 CONFIG_PARAMETERS = ['ntasks', 'partition', 'nodes', 'mail_type', 'mail_user', 'ntasks_per_core', 'cpus_per_task',
                      'mem_per_cpu', 'time', 'constraint', 'account', 'mem', 'exclusive', 'requeue', 'sbatch_custom',
-                     'max_running_jobs', 'array_batch_size', 'mpi_type']
+                     'max_running_jobs', 'array_batch_size', 'mpi_type', 'sims_per_task', 'parallel_sims']
 
 
 @dataclass(repr=False)
@@ -95,6 +97,13 @@ class SlurmPlatform(FilePlatform):
     # Set array max size for Slurm job
     array_batch_size: int = field(default=None, metadata=dict(sbatch=False, help="Array batch size"))
 
+    # Number of simulations run one after the other by each Slurm array task
+    sims_per_task: int = field(default=1, metadata=dict(sbatch=False, help="Number of simulations per array task"))
+
+    # Number of simulations of an array task run at the same time
+    parallel_sims: int = field(default=1, metadata=dict(sbatch=False,
+                                                        help="Number of simulations of an array task run at the same time"))
+
     # determine if run script as Slurm job
     run_on_slurm: bool = field(default=False, repr=False, compare=False, metadata=dict(help="Run script as Slurm job"))
 
@@ -102,6 +111,14 @@ class SlurmPlatform(FilePlatform):
     mpi_type: Optional[Literal['pmi2', 'pmix', 'mpirun']] = field(default="pmi2", metadata=dict(sbatch=True,
                                                                                                 help="MPI types ('pmi2', 'pmix' for slurm MPI, 'mpirun' for independently MPI)"))
 
+    # Merge the state of the jobs in the scheduler (sacct or squeue) with the status files of the simulations
+    status_from_scheduler: bool = field(default=True, metadata=dict(sbatch=False,
+                                                                    help="Use sacct/squeue to get simulation status"))
+
+    # Number of seconds the job states returned by the scheduler are reused
+    status_cache_interval: int = field(default=30, metadata=dict(sbatch=False,
+                                                                 help="Seconds the scheduler job states are cached"))
+
     # endregion
 
     _suites: SlurmPlatformSuiteOperations = field(**op_defaults, repr=False, init=False)
@@ -120,6 +137,11 @@ class SlurmPlatform(FilePlatform):
         if slurm_installed():
             self._max_array_size = get_max_array_size()
 
+        if self.sims_per_task is None or self.sims_per_task < 1:
+            raise ValueError(f"Invalid sims_per_task '{self.sims_per_task}'. It must be at least 1.")
+        if self.parallel_sims is None or self.parallel_sims < 1:
+            raise ValueError(f"Invalid parallel_sims '{self.parallel_sims}'. It must be at least 1.")
+
         if self.mpi_type.lower() not in {'pmi2', 'pmix', 'mpirun'}:
             raise ValueError(f"Invalid mpi_type '{self.mpi_type}'. Allowed values are 'pmi2', 'pmix', or 'mpirun'.")
 
@@ -189,6 +211,28 @@ class SlurmPlatform(FilePlatform):
         job_id = open(job_id_file).read().strip()
         return job_id.split('\n')
 
+    def get_simulation_job_ids(self, experiment_id: str) -> Dict[str, str]:
+        """
+        Get the Slurm array task of every simulation of a submitted experiment from its job_ids.json.
+        Args:
+            experiment_id: id of experiment
+        Returns:
+            Dict of simulation id as key and "<job id>_<array task index>" as value. Empty if not submitted
+        """
+        job_ids_file = self.get_directory_by_id(experiment_id, ItemType.EXPERIMENT).joinpath(JOB_IDS_FILE)
+        if not job_ids_file.exists():
+            logger.debug(f"{job_ids_file} not found.")
+            return {}
+
+        with open(job_ids_file) as f:
+            content = json.load(f)
+        job_ids = {}
+        for job in content['jobs']:
+            for index, sim_ids in job['tasks'].items():
+                for sim_id in sim_ids:
+                    job_ids[sim_id] = f"{job['job_id']}_{index}"
+        return job_ids
+
     def submit_job(self, item: Union[Experiment, Simulation], **kwargs) -> None:
         """
         Submit a Slurm job.
@@ -201,6 +245,8 @@ class SlurmPlatform(FilePlatform):
         if isinstance(item, Experiment):
             working_directory = self.get_directory(item)
             subprocess.run(['bash', 'batch.sh'], stdout=subprocess.PIPE, cwd=str(working_directory))
+            # Record the array task of every simulation
+            generate_job_ids(self, item)
         elif isinstance(item, Simulation):
             pass
         else:
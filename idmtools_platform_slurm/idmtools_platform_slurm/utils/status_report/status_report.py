@@ -20,6 +20,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 user_logger = getLogger('user')
 
+# Status codes of job_status.txt
+STATUS_CODES = {EntityStatus.SUCCEEDED: '0', EntityStatus.FAILED: '-1', EntityStatus.RUNNING: '100'}
+
 
 @dataclass(repr=False)
 class StatusViewer:
@@ -102,18 +105,18 @@ class StatusViewer:
             if sim_filter is not None and sim.id not in sim_filter:
                 continue
 
-            sim_dir = self.platform.get_directory(sim)
-            job_status_path = sim_dir.joinpath("job_status.txt")
-            if not job_status_path.exists():
+            # Status refreshed above, simulations that did not start are skipped
+            status = STATUS_CODES.get(sim.status)
+            if status is None:
                 continue
 
+            sim_dir = self.platform.get_directory(sim)
             job_id_path = sim_dir.joinpath('job_id.txt')
             if job_id_path.exists():
                 job_id = open(job_id_path).read().strip()
             else:
                 job_id = None
 
-            status = open(job_status_path).read().strip()
             # Apply status filter
             if status_filter is not None and status not in status_filter:
                 continue
@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 from logging import getLogger
 from typing import Dict, TYPE_CHECKING
-from idmtools.core import ItemType
+from idmtools.core import ItemType, EntityStatus
 
 if TYPE_CHECKING:  # pragma: no cover
     from idmtools.entities.iplatform import IPlatform
@@ -65,21 +65,18 @@ def check_status(platform: 'IPlatform', exp_id: str = None, display: bool = Fals
     _failed = []
     _succeeded = []
     _simulations = _exp.simulations
+    # Statuses of all simulations are retrieved at once, including the simulations killed by Slurm
+    statuses = platform.get_simulation_statuses(_exp)
     for sim in _simulations:
-        sim_dir = platform.get_directory(sim)
-        job_status_path = sim_dir.joinpath("job_status.txt")
-        if not job_status_path.exists():
-            _pending.append(f"    {sim.id}")
+        status = statuses.get(sim.id)
+        if status == EntityStatus.SUCCEEDED:
+            _succeeded.append(f"    {sim.id}")
+        elif status == EntityStatus.FAILED:
+            _failed.append(f"    {sim.id}")
+        elif status == EntityStatus.RUNNING:
+            _running.append(f"    {sim.id}")
         else:
-            status = open(job_status_path).read().strip()
-            if status == '0':
-                _succeeded.append(f"    {sim.id}")
-            elif status == '100':
-                _running.append(f"    {sim.id}")
-            elif status == '-1':
-                _failed.append(f"    {sim.id}")
-            else:
-                _running.append(f"    {sim.id}")
+            _pending.append(f"    {sim.id}")
 
     user_logger.info(f'\nExperiment Directory: \n{str(platform.get_directory(_exp))}')
 
@@ -0,0 +1,2 @@
+#!/bin/bash
+echo "Hello World"
\ No newline at end of file
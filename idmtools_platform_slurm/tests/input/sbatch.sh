@@ -0,0 +1,46 @@
+#!/bin/bash
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+#SBATCH --requeue
+
+
+#SBATCH --open-mode=append
+#SBATCH --output=stdout.txt
+#SBATCH --error=stderr.txt
+
+
+
+# define the handler function
+term_handler()
+{
+# do whatever cleanup you want here
+echo "-1" > job_status.txt
+exit -1
+}
+
+# associate the function "term_handler" with the TERM signal
+trap 'term_handler' TERM
+
+echo $SLURM_JOB_ID > job_id.txt
+
+echo "100" > job_status.txt
+python3 script.py 20 1 2 3
+RESULT=$?
+if [ $RESULT -eq 0 ]; then
+echo "0" > job_status.txt
+exit $RESULT
+fi
+echo "-1" > job_status.txt
+exit $RESULT
\ No newline at end of file
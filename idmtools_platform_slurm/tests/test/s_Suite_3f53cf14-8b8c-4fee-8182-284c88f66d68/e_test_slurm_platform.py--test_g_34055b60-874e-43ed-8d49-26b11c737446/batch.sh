@@ -0,0 +1,22 @@
+#!/bin/bash
+
+# Set the total number of tasks
+total_tasks=1
+
+# Set the number of tasks per array job
+batch_size=1
+
+# Set max running jobs
+max_jobs=100
+
+echo "num_batches: 1"
+
+# Submit the array jobs, each one runs at most max_jobs tasks at the same time
+
+
+job_id=$(sbatch --array=1-1%$max_jobs sbatch.sh 0 | awk '{print $4}')
+
+echo $job_id >> job_id.txt
+
+
+wait
\ No newline at end of file
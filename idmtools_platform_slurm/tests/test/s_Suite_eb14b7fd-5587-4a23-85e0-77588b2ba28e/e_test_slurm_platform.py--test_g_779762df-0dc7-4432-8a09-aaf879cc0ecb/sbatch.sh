@@ -0,0 +1,48 @@
+#!/bin/bash
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+#SBATCH --requeue
+
+
+#SBATCH --open-mode=append
+#SBATCH --output=stdout.txt
+#SBATCH --error=stderr.txt
+
+
+
+
+# Assign the values from the template
+ntasks=1
+
+# Get mpi_type
+mpi_type=pmi2
+
+# All submissions happen at the experiment level
+# Check if ntasks is greater than 1 to include --mpi=$mpi_type
+if [ "$ntasks" -gt 1 ]; then
+    echo "Running with MPI (ntasks=$ntasks)"
+    run_mpi_type=$mpi_type
+else
+    echo "Running without MPI (ntasks=$ntasks)"
+    run_mpi_type="no-mpi"
+fi
+
+
+bash run_simulation.sh "$1" "$run_mpi_type"
+
+wait
+
+
+
@@ -1,8 +1,11 @@
 import json
 import os
 import pathlib
+import subprocess
+import tempfile
 from functools import partial
 from typing import Any, Dict
+from unittest.mock import patch
 import numpy as np
 import pandas as pd
 import pytest
@@ -72,7 +75,8 @@ class TestPythonSimulation(ITestWithPersistence):
         for (dirpath, dirnames, filenames) in os.walk(experiment_dir):
             files.extend(filenames)
             break
-        self.assertSetEqual(set(files), set(["metadata.json", "run_simulation.sh", "sbatch.sh", "batch.sh", "tags.json"]))
+        self.assertSetEqual(set(files), set(["metadata.json", "run_simulation.sh", "sbatch.sh", "batch.sh",
+                                             "simulations.index", "tags.json"]))
 
         # verify all files under simulations
         self.assertEqual(experiment.simulation_count, 9)
@@ -106,10 +110,10 @@ class TestPythonSimulation(ITestWithPersistence):
         with open(os.path.join(experiment_dir, 'run_simulation.sh'), 'r') as fpr:
             contents = fpr.read()
         self.assertIn(
-            "JOB_DIRECTORY=$(find . -type d -maxdepth 1 -mindepth 1  | grep -v Assets | head -$SIMULATION_INDEX | tail -1)",
+            'JOB_DIRECTORY=$(sed -n "${SIMULATION_INDEX}{p;q}" simulations.index | cut -f1)',
             contents)
         self.assertIn("JOB_DIRECTORY", contents)
-        self.assertIn("srun _run.sh 1> stdout.txt 2> stderr.txt", contents)
+        self.assertIn("srun $SRUN_OPTIONS _run.sh 1> stdout.txt 2> stderr.txt", contents)
 
         # verify _run.sh script content under simulation level
         simulation_ids = []
@@ -146,6 +150,187 @@ class TestPythonSimulation(ITestWithPersistence):
                     config_contents = json.loads(j.read())
                 self.assertDictEqual(contents['task']['parameters'], config_contents['parameters'])
 
+    def test_simulation_index(self):
+        experiment = self.create_experiment(self.platform, a=2, b=2)
+        experiment_dir = self.platform.get_directory(experiment)
+        with open(os.path.join(experiment_dir, 'simulations.index'), 'r') as f:
+            lines = f.read().splitlines()
+        # one line per simulation in the experiment order
+        self.assertEqual(lines, [f"{self.platform.get_directory(sim).name}\t{sim.id}" for sim in experiment.simulations])
+
+        # array task 2 of the chunk starting at simulation 1 runs the third simulation
+        with tempfile.TemporaryDirectory() as bin_dir:
+            fake_srun = os.path.join(bin_dir, 'srun')
+            with open(fake_srun, 'w') as f:
+                f.write("#!/bin/bash\npwd > ran_here.txt\n")
+            os.chmod(fake_srun, 0o755)
+            env = dict(os.environ, PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}", SLURM_ARRAY_TASK_ID="2")
+            result = subprocess.run(['bash', 'run_simulation.sh', '1', 'no-mpi'], cwd=experiment_dir, env=env,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertTrue(self.platform.get_directory(experiment.simulations[2]).joinpath('ran_here.txt').exists())
+            # out of range index fails instead of running another simulation
+            env["SLURM_ARRAY_TASK_ID"] = "5"
+            result = subprocess.run(['bash', 'run_simulation.sh', '0', 'no-mpi'], cwd=experiment_dir, env=env,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.assertNotEqual(result.returncode, 0)
+
+    def test_sims_per_task(self):
+        for parallel_sims in [1, 2]:
+            with self.subTest(parallel_sims=parallel_sims):
+                platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, sims_per_task=2,
+                                    parallel_sims=parallel_sims)
+                experiment = self.create_experiment(platform, a=5, b=1)
+                experiment_dir = platform.get_directory(experiment)
+                with open(os.path.join(experiment_dir, 'batch.sh'), 'r') as f:
+                    self.assertIn("total_tasks=3", f.read())
+
+                # the last array task runs the single remaining simulation, the first one runs two simulations
+                with tempfile.TemporaryDirectory() as bin_dir:
+                    fake_srun = os.path.join(bin_dir, 'srun')
+                    with open(fake_srun, 'w') as f:
+                        f.write("#!/bin/bash\npwd > ran_here.txt\necho 0 > job_status.txt\n")
+                    os.chmod(fake_srun, 0o755)
+                    env = dict(os.environ, PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+                    for task_id in ["3", "1"]:
+                        env["SLURM_ARRAY_TASK_ID"] = task_id
+                        result = subprocess.run(['bash', 'sbatch.sh', '0'], cwd=experiment_dir, env=env,
+                                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                        self.assertEqual(result.returncode, 0, result.stderr)
+                ran = [platform.get_directory(sim).joinpath('ran_here.txt').exists() for sim in experiment.simulations]
+                self.assertEqual(ran, [True, True, False, False, True])
+                # status is still tracked for every simulation
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual([statuses[sim.id].name for sim in experiment.simulations],
+                                 ["SUCCEEDED", "SUCCEEDED", "CREATED", "CREATED", "SUCCEEDED"])
+
+    def test_array_jobs(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, array_batch_size=2, max_running_jobs=3)
+        experiment = self.create_experiment(platform, a=5, b=1)
+        experiment_dir = platform.get_directory(experiment)
+        with open(os.path.join(experiment_dir, 'batch.sh'), 'r') as f:
+            contents = f.read()
+        self.assertIn("sbatch --array=1-2%$max_jobs sbatch.sh 0 ", contents)
+        self.assertIn("sbatch --array=1-2%$max_jobs --dependency=afterok:$job_id sbatch.sh 2 ", contents)
+        self.assertIn("sbatch --array=1-1%$max_jobs --dependency=afterok:$job_id sbatch.sh 4 ", contents)
+        for dependency, expected in [('afterany', '--dependency=afterany:$job_id'), (False, None)]:
+            platform.create_batch_file(experiment, dependency=dependency)
+            with open(os.path.join(experiment_dir, 'batch.sh'), 'r') as f:
+                contents = f.read()
+            self.assertEqual(contents.count("sbatch --array="), 3)
+            if expected:
+                self.assertEqual(contents.count(expected), 2)
+            else:
+                self.assertNotIn("--dependency", contents)
+        with self.assertRaises(ValueError):
+            platform.create_batch_file(experiment, dependency='after')
+
+        # submit with a fake sbatch printing increasing job ids
+        with tempfile.TemporaryDirectory() as bin_dir:
+            fake_sbatch = os.path.join(bin_dir, 'sbatch')
+            with open(fake_sbatch, 'w') as f:
+                f.write("#!/bin/bash\nn=$(cat sbatch_count 2>/dev/null || echo 0)\nn=$((n+1))\n"
+                        "echo $n > sbatch_count\necho \"Submitted batch job 100$n\"\n")
+            os.chmod(fake_sbatch, 0o755)
+            with patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}):
+                platform.submit_job(experiment)
+        with open(os.path.join(experiment_dir, 'job_ids.json'), 'r') as f:
+            job_ids = json.load(f)
+        sim_ids = [sim.id for sim in experiment.simulations]
+        self.assertEqual([job['job_id'] for job in job_ids['jobs']], ['1001', '1002', '1003'])
+        self.assertEqual(job_ids['jobs'][1], dict(job_id='1002', offset=2, array='1-2',
+                                                  tasks={'1': [sim_ids[2]], '2': [sim_ids[3]]}))
+        self.assertDictEqual(platform.get_simulation_job_ids(experiment.id),
+                             dict(zip(sim_ids, ['1001_1', '1001_2', '1002_1', '1002_2', '1003_1'])))
+
+    def test_cancel_array_task(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, sims_per_task=2,
+                            status_from_scheduler=False)
+        experiment = self.create_experiment(platform, a=4, b=1)
+        sims = list(experiment.simulations)
+        with tempfile.TemporaryDirectory() as bin_dir:
+            for name, content in [('sbatch', "n=$(cat sbatch_count 2>/dev/null || echo 0)\nn=$((n+1))\n"
+                                             "echo $n > sbatch_count\necho \"Submitted batch job 100$n\""),
+                                  ('scancel', f"echo $@ >> {bin_dir}/scancel_calls")]:
+                with open(os.path.join(bin_dir, name), 'w') as f:
+                    f.write(f"#!/bin/bash\n{content}\n")
+                os.chmod(os.path.join(bin_dir, name), 0o755)
+
+            def scancel_calls():
+                if not os.path.exists(os.path.join(bin_dir, 'scancel_calls')):
+                    return []
+                with open(os.path.join(bin_dir, 'scancel_calls')) as f:
+                    return f.read().split()
+
+            with patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}):
+                # a resubmission only maps the ids of the new array job
+                platform.submit_job(experiment)
+                platform.submit_job(experiment)
+                self.assertDictEqual(platform.get_simulation_job_ids(experiment.id),
+                                     dict(zip([sim.id for sim in sims], ['1002_1', '1002_1', '1002_2', '1002_2'])))
+
+                # the array task also runs a simulation that is not cancelled
+                platform._simulations.platform_cancel(sims[0].id, force=True)
+                self.assertEqual(scancel_calls(), [])
+                platform._simulations.platform_cancel(sims[0].id, force=True, cancelled_ids=[sims[1].id])
+                self.assertEqual(scancel_calls(), ['1002_1'])
+                # the other simulation of the array task is done
+                with open(platform.get_directory(sims[3]).joinpath('job_status.txt'), 'w') as f:
+                    f.write('0')
+                platform._simulations.platform_cancel(sims[2].id, force=True)
+                self.assertEqual(scancel_calls(), ['1002_1', '1002_2'])
+
+    def test_scheduler_status(self):
+        platform = Platform('SLURM_LOCAL', job_directory=self.job_directory, array_batch_size=2)
+        experiment = self.create_experiment(platform, a=5, b=1)
+        sims = list(experiment.simulations)
+        with tempfile.TemporaryDirectory() as bin_dir:
+            def write_script(name, content):
+                with open(os.path.join(bin_dir, name), 'w') as f:
+                    f.write(f"#!/bin/bash\n{content}\n")
+                os.chmod(os.path.join(bin_dir, name), 0o755)
+
+            def write_sacct(last_state):
+                write_script('sacct', f"echo called >> {bin_dir}/sacct_calls\n"
+                                      "echo '1001_1|COMPLETED|0:0'\necho '1001_2|TIMEOUT|0:15'\n"
+                                      "echo '1002_[1]|PENDING|0:0'\necho '1002_2|CANCELLED by 0|0:0'\n"
+                                      f"echo '1003_1|{last_state}|0:0'")
+
+            write_script('sbatch', "n=$(cat sbatch_count 2>/dev/null || echo 0)\nn=$((n+1))\n"
+                                   "echo $n > sbatch_count\necho \"Submitted batch job 100$n\"")
+            write_sacct('RUNNING')
+            with patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}):
+                platform.submit_job(experiment)
+                for sim, status in zip([sims[0], sims[1], sims[4]], ['0', '100', '100']):
+                    with open(platform.get_directory(sim).joinpath('job_status.txt'), 'w') as f:
+                        f.write(status)
+                expected = ["SUCCEEDED", "FAILED", "CREATED", "FAILED", "RUNNING"]
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual([statuses[sim.id].name for sim in sims], expected)
+
+                # scheduler states are cached for status_cache_interval
+                write_sacct('TIMEOUT')
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual([statuses[sim.id].name for sim in sims], expected)
+                with open(os.path.join(bin_dir, 'sacct_calls')) as f:
+                    self.assertEqual(len(f.readlines()), 1)
+                platform.status_cache_interval = 0
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual(statuses[sims[4].id].name, "FAILED")
+
+                # without accounting, tasks no longer in the queue are over
+                write_script('sacct', "echo 'Slurm accounting storage is disabled' >&2\nexit 1")
+                write_script('squeue', "echo '1003_1|RUNNING'")
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual([statuses[sim.id].name for sim in sims],
+                                 ["SUCCEEDED", "FAILED", "FAILED", "FAILED", "RUNNING"])
+
+                # status files only
+                platform.status_from_scheduler = False
+                statuses = platform.get_simulation_statuses(experiment)
+                self.assertEqual([statuses[sim.id].name for sim in sims],
+                                 ["SUCCEEDED", "RUNNING", "CREATED", "CREATED", "RUNNING"])
+
     @pytest.mark.skip("unskip this line when doing real run in local")
     def test_std_status_jobid_files(self):
         experiment = self.create_experiment(self.platform, a=3, b=3, wait_until_done=True, dry_run=False)